@@ -19,6 +19,9 @@ class Daemon(metaclass=abc.ABCMeta):
         self._stop = Event()
         self._service: Optional[Thread] = None
         self._skip_sleep = Event()
+        # set after the first (re-)start-attempt of the service or when
+        # the daemon exits
+        self._started = Event()
 
     @property
     def active(self) -> bool:
@@ -53,21 +56,26 @@ class Daemon(metaclass=abc.ABCMeta):
         """
         Loops until stopped. If `self._service` is down, restart.
         """
-        while not self._stop.is_set():
-            if self._service is None or not self._service.is_alive():
-                try:
-                    self._restart_service()
-                except Exception as exc_info:
-                    print(
-                        "\033[31mERROR\033[0m Daemon encountered an "
-                        + "unrecoverable error while trying to (re-)start a "
-                        + f"service: {exc_info} Shutting down now..",
-                        file=sys.stderr,
-                    )
-                    self._stop.set()
-                    break
-            self._skip_sleep.wait(interval)
-            self._skip_sleep.clear()
+        try:
+            while not self._stop.is_set():
+                if self._service is None or not self._service.is_alive():
+                    try:
+                        self._restart_service()
+                    except Exception as exc_info:
+                        print(
+                            "\033[31mERROR\033[0m Daemon encountered an "
+                            + "unrecoverable error while trying to "
+                            + f"(re-)start a service: {exc_info} Shutting "
+                            + "down now..",
+                            file=sys.stderr,
+                        )
+                        self._stop.set()
+                        break
+                    self._started.set()
+                self._skip_sleep.wait(interval)
+                self._skip_sleep.clear()
+        finally:
+            self._started.set()
 
     def run(
         self,
@@ -90,14 +98,14 @@ class Daemon(metaclass=abc.ABCMeta):
             return
 
         self._stop.clear()
+        self._started.clear()
         self._daemon = Thread(
             target=self._serve, daemon=daemon, args=(interval or 0.1,)
         )
         self._daemon.start()
 
         if block:
-            while not self.status:
-                pass
+            self._started.wait()
 
     def stop(self, block: bool = False) -> None:
         """
@@ -109,9 +117,8 @@ class Daemon(metaclass=abc.ABCMeta):
         """
         self._stop.set()
         self._skip_sleep.set()
-        if block:
-            while self.active:
-                pass
+        if block and self._daemon is not None:
+            self._daemon.join()
 
 
 class CDaemon(Daemon):
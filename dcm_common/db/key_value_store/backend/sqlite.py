@@ -1,6 +1,6 @@
 """Definition of a sqlite-based key-value store-type database."""
 
-from typing import Optional, Any
+from typing import Optional
 import sys
 from pathlib import Path
 import sqlite3
@@ -8,6 +8,7 @@ import json
 from uuid import uuid4
 import threading
 
+from dcm_common.sqlite import Transaction
 from .interface import KeyValueStore
 
 
@@ -15,88 +16,6 @@ if sys.version_info[0] != 3:
     raise ImportError(f"Module '{__name__}' is only compatible with python 3.")
 
 
-class Transaction:
-    """
-    Auxiliary definition for SQLite3-database transactions.
-
-    This is a duplicate of the implementation for the sqlite-based
-    orchestra-controller.
-
-    Keyword arguments:
-    conn -- database connection (e.g. via `get_connection`)
-    check -- if `True`, raise occuring errors, otherwise only track via
-             `success` and `exc_val`-properties
-             (default False)
-    autoclose -- automatically close connection after use
-                 (default True)
-    """
-
-    def __init__(
-        self,
-        conn: sqlite3.Connection,
-        check: bool = True,
-        autoclose: bool = True,
-    ) -> None:
-        self.connection = conn
-        self._autoclose = autoclose
-        self._check = check
-        self.cursor: Optional[sqlite3.Cursor] = None
-        self.data: Optional[list[Any]] = None
-        self.success: Optional[bool] = None
-        self.exc_val: Optional[Exception] = None
-
-    @staticmethod
-    def get_connection(path: str | Path, **kwargs) -> sqlite3.Connection:
-        """
-        Returns `sqlite3.Connection` for multiple threads.
-        """
-        if sys.version_info[1] >= 12:
-            conn = sqlite3.connect(path, autocommit=True, **kwargs)
-            # PRAGMA only works in autocommit-mode..
-            conn.execute("PRAGMA foreign_keys = 1")
-            conn.execute("PRAGMA journal_mode = WAL")
-            conn.autocommit = False
-        else:
-            conn = sqlite3.connect(path, isolation_level=None, **kwargs)
-            conn.execute("PRAGMA foreign_keys = 1")
-            conn.execute("PRAGMA journal_mode = WAL")
-        return conn
-
-    def check(self) -> None:
-        """
-        Raises exception from `self.exc_value` if not `self.success.
-        """
-        if self.success:
-            return
-        raise self.exc_val or ValueError("Unknown error occurred.")
-
-    def __enter__(self):
-        self.cursor = self.connection.cursor()
-        if sys.version_info[1] < 12:
-            self.cursor.execute("BEGIN")
-        return self
-
-    def __exit__(self, exc_type, exc_val, exc_tb):
-        self.success = exc_type is None
-
-        if self.success:
-            self.data = self.cursor.fetchall()
-            if self.connection.in_transaction:
-                self.connection.commit()
-        else:
-            self.exc_val = exc_val
-            if self.connection.in_transaction:
-                self.connection.rollback()
-
-        self.cursor.close()
-        if self._autoclose:
-            self.connection.close()
-
-        if self._check and not self.success:
-            return False
-        return True
-
-
 class SQLiteStore(KeyValueStore):
     """
     Key value-store for JSON-data that works on a SQLite3-database. This
@@ -129,6 +48,9 @@ class SQLiteStore(KeyValueStore):
 
         self.timeout = timeout
         self._threading_db_lock = threading.Lock()
+        # reuse one connection per thread (makes use of the
+        # sqlite3-module's per-connection statement cache)
+        self._connections = threading.local()
 
         # always keep one connection when working in memory
         if path is None:
@@ -148,23 +70,57 @@ class SQLiteStore(KeyValueStore):
             return Transaction.get_connection(self._path, timeout=self.timeout)
         if self._memory_id is None:
             self._memory_id = str(uuid4())
+        # in-memory databases do not support WAL-mode; the shared
+        # cache is required to access the same database via multiple
+        # connections
         return Transaction.get_connection(
             f"file:{self._memory_id}?mode=memory&cache=shared",
             uri=True,
             timeout=self.timeout,
         )
 
-    def transaction(self, check: bool = True):
+    @property
+    def _connection(self) -> sqlite3.Connection:
+        """
+        Returns the database-connection of the current thread (created
+        on first use).
+        """
+        conn = getattr(self._connections, "conn", None)
+        if conn is None:
+            conn = self.get_connection()
+            self._connections.conn = conn
+        return conn
+
+    def transaction(self, check: bool = True, write: bool = False):
         """
         Returns `Transaction`-object connected to the store's
-        database.
+        database (reuses the connection of the current thread).
         """
-        return Transaction(self.get_connection(), check=check)
+        return Transaction(
+            self._connection, check=check, autoclose=False, write=write
+        )
 
     def close(self):
-        """Closes internal database connection."""
+        """
+        Closes internal database connection and the connection of the
+        current thread.
+        """
         if self._db is not None:
             self._db.close()
+        conn = getattr(self._connections, "conn", None)
+        if conn is not None:
+            conn.close()
+            self._connections.conn = None
+
+    def __getstate__(self):
+        # thread-local connections cannot be pickled
+        state = self.__dict__.copy()
+        del state["_connections"]
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._connections = threading.local()
 
     def _get_schema_version(self) -> None:
         """
@@ -177,7 +133,7 @@ class SQLiteStore(KeyValueStore):
 
     def _load_schema(self) -> None:
         """Loads database schema."""
-        with self.transaction() as t:
+        with self.transaction(write=True) as t:
             t.cursor.execute("PRAGMA user_version = 1")
             t.cursor.execute(
                 """CREATE TABLE store (
@@ -195,7 +151,7 @@ class SQLiteStore(KeyValueStore):
         return json.loads(value)
 
     def _write(self, key, value):
-        with self._threading_db_lock, self.transaction() as t:
+        with self._threading_db_lock, self.transaction(write=True) as t:
             t.cursor.execute(
                 "INSERT OR REPLACE INTO store VALUES (?, ?)", (key, value)
             )
@@ -208,10 +164,10 @@ class SQLiteStore(KeyValueStore):
         return t.data[0][0]
 
     def _delete(self, key):
-        with self._threading_db_lock, self.transaction() as t:
+        with self._threading_db_lock, self.transaction(write=True) as t:
             t.cursor.execute("DELETE FROM store WHERE key = ?", (key,))
 
     def keys(self):
         with self._threading_db_lock, self.transaction() as t:
             t.cursor.execute("SELECT key FROM store")
-        return tuple(row[0] for row in t.data)
+            return tuple(row[0] for row in t.iter_data())
@@ -13,6 +13,7 @@ from typing import (
     get_origin,
 )
 from collections.abc import Mapping, MutableMapping
+from weakref import WeakKeyDictionary
 
 from .jsonable import (
     JSONable,
@@ -65,6 +66,15 @@ def _handler(category: str, name: str, json_name: Optional[str] = None):
 T = TypeVar("T", bound="DataModel")
 
 
+# cache for resolved type hints of `DataModel`-classes; maps class to
+# tuple of
+# * type hints (as returned by `get_type_hints`) and
+# * set of attribute names that are annotated as `JSONable`/`JSONObject`
+_TYPE_HINT_CACHE: WeakKeyDictionary[type, tuple[dict[str, Any], set[str]]] = (
+    WeakKeyDictionary()
+)
+
+
 class DataModel:
     """
     The `DataModel` class serves as a base for the definition of data
@@ -145,6 +155,10 @@ class DataModel:
      ...         return str(value)
     """
 
+    # no instance-dictionary required here; enables the use of
+    # `__slots__` in subclasses
+    __slots__ = ()
+
     _SERIALIZATION_ERR_MSG = (
         "{msg} while serializing attribute '{key}' in DataModel "
         + "'{model}'. Please define a custom handler to resolve this "
@@ -205,6 +219,29 @@ class DataModel:
         """
         return _handler("_deserialization_handlers", key, json_key)
 
+    @classmethod
+    def _get_type_hints(cls) -> tuple[dict[str, Any], set[str]]:
+        """
+        Returns (cached) tuple of type hints and names of `JSONable`-/
+        `JSONObject`-attributes for this class.
+        """
+        try:
+            return _TYPE_HINT_CACHE[cls]
+        except KeyError:
+            pass
+        hints = get_type_hints(
+            cls, localns={"JSONable": JSONable, "JSONObject": JSONObject}
+        )
+        _TYPE_HINT_CACHE[cls] = (
+            hints,
+            {
+                key
+                for key, type_ in hints.items()
+                if is_jsonable_spec(type_) or is_jsonobject_spec(type_)
+            },
+        )
+        return _TYPE_HINT_CACHE[cls]
+
     @property
     def json(self) -> JSONObject:
         """Returns dictionary that can be jsonified."""
@@ -305,11 +342,8 @@ class DataModel:
             )
 
         _json = {}
-        for key, type_ in get_type_hints(
-            cls,
-            localns=locals()
-            | {"JSONable": JSONable, "JSONObject": JSONObject},
-        ).items():
+        hints, jsonable_keys = cls._get_type_hints()
+        for key, type_ in hints.items():
             if key in cls._deserialization_handlers:
                 try:
                     _json[key] = cls._deserialization_handlers[key][1](
@@ -323,7 +357,7 @@ class DataModel:
             if key not in json:
                 continue
 
-            if is_jsonable_spec(type_) or is_jsonobject_spec(type_):
+            if key in jsonable_keys:
                 _json[key] = json[key]
             elif isinstance(json[key], MutableMapping):
                 _json[key] = cls._from_json_object(key, json[key])
@@ -357,12 +391,7 @@ class DataModel:
     @classmethod
     def _from_json_object(cls: type[T], key: str, json: JSONObject) -> Any:
         """Process single (object-)argument for deserialization."""
-        # get type annotations with extended namespace
-        type_ = get_type_hints(
-            cls,
-            localns=locals()
-            | {"JSONable": JSONable, "JSONObject": JSONObject},
-        )[key]
+        type_ = cls._get_type_hints()[0][key]
 
         # plain DataModel annotation
         if hasattr(type_, "from_json"):
@@ -422,13 +451,7 @@ class DataModel:
     def _from_json_array(cls: type[T], key: str, json: list[JSONable]) -> Any:
         """Process single (array-)argument for deserialization."""
         try:
-            type_ = get_args(
-                get_type_hints(
-                    cls,
-                    localns=locals()
-                    | {"JSONable": JSONable, "JSONObject": JSONObject},
-                )[key]
-            )[0]
+            type_ = get_args(cls._get_type_hints()[0][key])[0]
         except IndexError:
             return json
         if type_ == Any:
@@ -46,9 +46,11 @@ import os
 import multiprocessing
 
 
+_MP_METHOD = os.environ.get("ORCHESTRA_MP_METHOD", "spawn")
 try:
-    multiprocessing.set_start_method(
-        os.environ.get("ORCHESTRA_MP_METHOD", "spawn")
-    )
+    multiprocessing.set_start_method(_MP_METHOD)
 except RuntimeError:
     pass
+if _MP_METHOD == "forkserver":
+    # import once in the fork-server instead of in every child process
+    multiprocessing.set_forkserver_preload(["dcm_common.orchestra"])
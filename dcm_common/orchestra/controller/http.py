@@ -5,6 +5,7 @@ from time import sleep
 from uuid import uuid4
 from datetime import datetime
 import socket
+import threading
 
 from flask import Blueprint, request, Response, jsonify
 import requests
@@ -13,6 +14,7 @@ from ..models import JobInfo, Token, Lock, Message
 from .interface import Controller
 from .sqlite import SQLiteController
 from ..logging import Logging
+from ..serialization import dumps as json_dumps, loads as json_loads
 
 
 class HTTPController(Controller):
@@ -32,7 +34,7 @@ class HTTPController(Controller):
     retry_interval -- interval between retries in seconds
                       (default 0)
     request_kwargs -- additional kwargs that are passed when calling
-                      `requests.request`
+                      `requests.Session.request`
                       (default None)
     """
 
@@ -56,12 +58,43 @@ class HTTPController(Controller):
         self.max_retries = max_retries
         self.retry_interval = retry_interval
         self.request_kwargs = request_kwargs or {}
+        # reuse one session (i.e., persistent connections) per thread
+        self._sessions = threading.local()
 
     @property
     def name(self):
         """Returns controller name."""
         return self._name
 
+    @property
+    def _session(self) -> requests.Session:
+        """
+        Returns the `requests.Session` of the current thread (created on
+        first use).
+        """
+        session = getattr(self._sessions, "session", None)
+        if session is None:
+            session = requests.Session()
+            self._sessions.session = session
+        return session
+
+    def close(self):
+        """Closes the session of the current thread."""
+        session = getattr(self._sessions, "session", None)
+        if session is not None:
+            session.close()
+            self._sessions.session = None
+
+    def __getstate__(self):
+        # thread-local sessions cannot be pickled
+        state = self.__dict__.copy()
+        del state["_sessions"]
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._sessions = threading.local()
+
     def _run(
         self,
         method: str,
@@ -69,18 +102,25 @@ class HTTPController(Controller):
         json: Optional[dict] = None,
         *,
         skip_retry: bool = False,
+        timeout: Optional[float] = None,
     ) -> requests.Response:
         """
         Runs the given api_request while respecting timeout and retry-behavior
         """
+        kwargs = self.request_kwargs
+        if json is not None:
+            kwargs = kwargs | {
+                "data": json_dumps(json),
+                "headers": (kwargs.get("headers") or {})
+                | {"Content-Type": "application/json"},
+            }
         for i in range(self.max_retries * (0 if skip_retry else 1) + 1):
             try:
-                return requests.request(
+                return self._session.request(
                     method,
                     self.base_url + endpoint,
-                    json=json,
-                    timeout=self.timeout,
-                    **self.request_kwargs,
+                    timeout=self.timeout if timeout is None else timeout,
+                    **kwargs,
                 )
             except requests.exceptions.RequestException as exc_info:
                 Logging.print_to_log(
@@ -119,22 +159,32 @@ class HTTPController(Controller):
             },
         )
         if r.status_code == 200:
-            return Token.from_json(r.json())
+            return Token.from_json(json_loads(r.content))
         raise ValueError(r.text)
 
-    def queue_pop(self, name: str) -> Optional[Lock]:
-        """Request a lock on a job from the queue."""
+    def queue_pop(self, name: str, wait: float = 0) -> Optional[Lock]:
+        """
+        Request a lock on a job from the queue.
+
+        Keyword arguments:
+        name -- name of the requesting worker
+        wait -- if positive, the API waits up to this duration in seconds
+                for a job to be submitted in case of an empty queue
+                (long-polling)
+                (default 0)
+        """
         try:
             r = self._run(
                 "POST",
                 "/queue/pop",
-                {"name": self._name},
+                {"name": self._name} | ({"wait": wait} if wait > 0 else {}),
                 skip_retry=True,
+                timeout=self.timeout + max(0, wait),
             )
         except requests.exceptions.RequestException:
             return None
         if r.status_code == 200:
-            return Lock.from_json(r.json())
+            return Lock.from_json(json_loads(r.content))
         return None
 
     def release_lock(self, lock_id: str) -> None:
@@ -159,7 +209,32 @@ class HTTPController(Controller):
             {"id": lock_id},
         )
         if r.status_code == 200:
-            return Lock.from_json(r.json())
+            return Lock.from_json(json_loads(r.content))
+        raise ValueError(r.text)
+
+    def finish_lock(
+        self,
+        lock_id: str,
+        *,
+        status: Optional[str] = None,
+        info: Optional[Mapping | JobInfo] = None,
+    ) -> None:
+        """Push final data to registry and release lock."""
+        r = self._run(
+            "POST",
+            "/lock/finish",
+            {
+                "id": lock_id,
+                "status": status,
+                "info": (
+                    info
+                    if isinstance(info, Mapping) or info is None
+                    else info.json
+                ),
+            },
+        )
+        if r.status_code == 200:
+            return
         raise ValueError(r.text)
 
     def get_token(self, token: str) -> Token:
@@ -170,7 +245,7 @@ class HTTPController(Controller):
             {"token": token},
         )
         if r.status_code == 200:
-            return Token.from_json(r.json())
+            return Token.from_json(json_loads(r.content))
         raise ValueError(r.text)
 
     def get_info(self, token: str) -> Any:
@@ -180,7 +255,7 @@ class HTTPController(Controller):
             f"/registry/info?token={token}",
         )
         if r.status_code == 200:
-            return r.json()
+            return json_loads(r.content)
         raise ValueError(r.text)
 
     def get_status(self, token: str) -> str:
@@ -249,7 +324,7 @@ class HTTPController(Controller):
             f"/messages?since={_since}",
         )
         if r.status_code == 200:
-            return [Message.from_json(m) for m in r.json()]
+            return [Message.from_json(m) for m in json_loads(r.content)]
         raise ValueError(r.text)
 
 
@@ -257,10 +332,24 @@ def get_http_controller_bp(
     controller: SQLiteController,
     name: Optional[str] = None,
     import_name: Optional[str] = None,
+    max_wait: float = 10,
 ) -> Blueprint:
     """
     Returns Flask-blueprint that implements the controller-interface via
     an HTTP-API.
+
+    The endpoint for popping from the queue supports long-polling via
+    the optional field 'wait' (duration in seconds; limited by
+    `max_wait`; see `SQLiteController.queue_pop`).
+
+    Keyword arguments:
+    controller -- controller that is exposed via the HTTP-API
+    name -- blueprint name
+            (default None; uses "orchestra-controller-api")
+    import_name -- blueprint import name
+                   (default None; uses module name)
+    max_wait -- maximum duration for long-polling in seconds
+                (default 10)
     """
     bp = Blueprint(name or "orchestra-controller-api", import_name or __name__)
 
@@ -270,8 +359,9 @@ def get_http_controller_bp(
     def queue_push():
         """Push to queue."""
         try:
+            body = json_loads(request.get_data())
             token = controller.queue_push(
-                request.json["token"], JobInfo.from_json(request.json["info"])
+                body["token"], JobInfo.from_json(body["info"])
             )
         except Exception as exc_info:
             return Response(
@@ -285,7 +375,10 @@ def get_http_controller_bp(
     def queue_pop():
         """Pop from queue."""
         try:
-            lock = controller.queue_pop(request.json["name"])
+            lock = controller.queue_pop(
+                request.json["name"],
+                wait=min(float(request.json.get("wait", 0)), max_wait),
+            )
         except Exception as exc_info:
             return Response(
                 f"Failed to pop queue: {exc_info}",
@@ -322,6 +415,22 @@ def get_http_controller_bp(
             )
         return jsonify(lock.json), 200
 
+    @bp.route("/lock/finish", methods=["POST"])
+    def finish_lock():
+        """Push to registry and release lock."""
+        try:
+            body = json_loads(request.get_data())
+            controller.finish_lock(
+                body["id"], status=body.get("status"), info=body.get("info")
+            )
+        except Exception as exc_info:
+            return Response(
+                f"Failed to finish lock: {exc_info}",
+                mimetype="text/plain",
+                status=500,
+            )
+        return Response("OK", status=200, mimetype="text/plain")
+
     @bp.route("/registry/token", methods=["GET"])
     def get_token():
         """Get token."""
@@ -346,7 +455,9 @@ def get_http_controller_bp(
                 mimetype="text/plain",
                 status=500,
             )
-        return jsonify(info), 200
+        return Response(
+            json_dumps(info), mimetype="application/json", status=200
+        )
 
     @bp.route("/registry/status", methods=["GET"])
     def get_status():
@@ -365,10 +476,11 @@ def get_http_controller_bp(
     def registry_push():
         """Push to registry."""
         try:
+            body = json_loads(request.get_data())
             controller.registry_push(
-                request.json["lockId"],
-                status=request.json.get("status"),
-                info=request.json.get("info"),
+                body["lockId"],
+                status=body.get("status"),
+                info=body.get("info"),
             )
         except Exception as exc_info:
             return Response(
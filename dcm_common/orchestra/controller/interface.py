@@ -2,7 +2,7 @@
 Definition of an interface for `orchestra.Controller` implementations.
 """
 
-from typing import Optional, Any, Mapping
+from typing import Optional, Any, Mapping, Iterable
 import abc
 from datetime import datetime
 
@@ -48,9 +48,28 @@ class Controller(metaclass=abc.ABCMeta):
             + "'queue_push'."
         )
 
+    def queue_push_many(
+        self, items: Iterable[tuple[str, Mapping | JobInfo]]
+    ) -> list[Token]:
+        """
+        Add multiple jobs (pairs of token and info) to queue, returns
+        list of `Token`s (see `queue_push`).
+
+        The default implementation calls `queue_push` for every item.
+        """
+        return [self.queue_push(token, info) for token, info in items]
+
     @abc.abstractmethod
-    def queue_pop(self, name: str) -> Optional[Lock]:
-        """Request a lock on a job from the queue."""
+    def queue_pop(self, name: str, wait: float = 0) -> Optional[Lock]:
+        """
+        Request a lock on a job from the queue. If `wait` is positive,
+        wait up to this duration in seconds for a job if the queue is
+        empty.
+
+        Implementations without support for long-polling may omit the
+        argument `wait`; a `Worker` detects this and then only calls
+        `queue_pop(name)`.
+        """
         raise NotImplementedError(
             f"Class {self.__class__.__name__} does not define method "
             + "'queue_pop'."
@@ -113,6 +132,22 @@ class Controller(metaclass=abc.ABCMeta):
             + "'registry_push'."
         )
 
+    def finish_lock(
+        self,
+        lock_id: str,
+        *,
+        status: Optional[str] = None,
+        info: Optional[Mapping | JobInfo] = None,
+    ) -> None:
+        """
+        Push final data to registry and release lock.
+
+        The default implementation combines `registry_push` and
+        `release_lock`.
+        """
+        self.registry_push(lock_id, status=status, info=info)
+        self.release_lock(lock_id)
+
     @abc.abstractmethod
     def message_push(
         self, token: str, instruction: str, origin: str, content: str
@@ -1,21 +1,22 @@
 """Definition of a sqlite-based `orchestra.Controller`."""
 
-from typing import Optional, Any, Mapping
+from typing import Optional, Any, Mapping, Iterable
 import sys
 from pathlib import Path
 import sqlite3
 from datetime import datetime, timedelta
-import json
 from uuid import uuid4
 import threading
 import socket
-from copy import deepcopy
+from time import time
 
 from dcm_common import LoggingContext, Logger
+from dcm_common.sqlite import Transaction
 from ..models import (
     Token,
     Progress,
     Status,
+    MetadataRecord,
     JobMetadata,
     JobInfo,
     Lock,
@@ -24,89 +25,33 @@ from ..models import (
 )
 from .interface import Controller
 from ..logging import Logging
+from ..serialization import dumps as json_dumps, loads as json_loads
 
 
 if sys.version_info[0] != 3:
     raise ImportError(f"Module '{__name__}' is only compatible with python 3.")
 
-
-class Transaction:
-    """
-    Auxiliary definition for SQLite3-database transactions.
-
-    Keyword arguments:
-    conn -- database connection (e.g. via `get_connection`)
-    check -- if `True`, raise occuring errors, otherwise only track via
-             `success` and `exc_val`-properties
-             (default False)
-    autoclose -- automatically close connection after use
-                 (default True)
-    """
-
-    def __init__(
-        self,
-        conn: sqlite3.Connection,
-        check: bool = True,
-        autoclose: bool = True,
-    ) -> None:
-        self.connection = conn
-        self._autoclose = autoclose
-        self._check = check
-        self.cursor: Optional[sqlite3.Cursor] = None
-        self.data: Optional[list[Any]] = None
-        self.success: Optional[bool] = None
-        self.exc_val: Optional[Exception] = None
-
-    @staticmethod
-    def get_connection(path: str | Path, **kwargs) -> sqlite3.Connection:
-        """
-        Returns `sqlite3.Connection` for multiple threads.
-        """
-        if sys.version_info[1] >= 12:
-            conn = sqlite3.connect(path, autocommit=True, **kwargs)
-            # PRAGMA only works in autocommit-mode..
-            conn.execute("PRAGMA foreign_keys = 1")
-            conn.execute("PRAGMA journal_mode = WAL")
-            conn.autocommit = False
-        else:
-            conn = sqlite3.connect(path, isolation_level=None, **kwargs)
-            conn.execute("PRAGMA foreign_keys = 1")
-            conn.execute("PRAGMA journal_mode = WAL")
-        return conn
-
-    def check(self) -> None:
-        """
-        Raises exception from `self.exc_value` if not `self.success.
-        """
-        if self.success:
-            return
-        raise self.exc_val or ValueError("Unknown error occurred.")
-
-    def __enter__(self):
-        self.cursor = self.connection.cursor()
-        if sys.version_info[1] < 12:
-            self.cursor.execute("BEGIN")
-        return self
-
-    def __exit__(self, exc_type, exc_val, exc_tb):
-        self.success = exc_type is None
-
-        if self.success:
-            self.data = self.cursor.fetchall()
-            if self.connection.in_transaction:
-                self.connection.commit()
-        else:
-            self.exc_val = exc_val
-            if self.connection.in_transaction:
-                self.connection.rollback()
-
-        self.cursor.close()
-        if self._autoclose:
-            self.connection.close()
-
-        if self._check and not self.success:
-            return False
-        return True
+# support for RETURNING-clause
+_SQLITE_RETURNING = sqlite3.sqlite_version_info >= (3, 35)
+
+# SQL-statements that would otherwise be assembled on every call
+_SQL_QUEUE_POP = """WITH available_tokens AS (
+      SELECT token from registry
+      WHERE status = 'queued'
+      AND NOT EXISTS (
+        SELECT 1 FROM locks
+        WHERE locks.token = registry.token)
+      LIMIT 1)
+    INSERT INTO locks
+      SELECT ?, ?, token, ? FROM available_tokens
+""" + (
+    " RETURNING token" if _SQLITE_RETURNING else ""
+)
+_SQL_REGISTRY_UPDATE = {
+    (True, False): "UPDATE registry SET status = ? WHERE token = ?",
+    (False, True): "UPDATE registry SET info = ? WHERE token = ?",
+    (True, True): "UPDATE registry SET status = ?, info = ? WHERE token = ?",
+}
 
 
 class SQLiteController(Controller):
@@ -116,9 +61,6 @@ class SQLiteController(Controller):
     in-memory controller. For `multiprocessing`-support (and equivalent)
     the persistent mode is required (using the `path`-argument).
 
-    This is a duplicate of the implementation for the sqlite-based
-    key-value-store.
-
     Keyword arguments:
     path -- path to a SQLite-database file
             (default None; uses memory_id)
@@ -141,9 +83,28 @@ class SQLiteController(Controller):
                seconds (mostly relevant for concurrency; see also
                property `db`)
                (default 5)
+    pragmas -- additional PRAGMAs that are set for every new database
+               connection (overrides the defaults, see `FILE_PRAGMAS`)
+               (default None)
     """
 
-    SCHEMA_VERSION = 1
+    # version 2: registry-info declared as BLOB (databases with schema
+    # version 1 declare TEXT, both types of records can be read)
+    SCHEMA_VERSION = 2
+    # default PRAGMAs for connections to file-based databases (in
+    # addition to those set in `Transaction.get_connection`)
+    FILE_PRAGMAS = {
+        # larger page cache (64MiB; connections are reused per thread)
+        "cache_size": -65536,
+        # memory-mapped I/O for reads (up to 256MiB)
+        "mmap_size": 268435456,
+        # in-memory temporary tables/indices
+        "temp_store": "MEMORY",
+    }
+    # size of the per-connection cache of prepared statements (the
+    # sqlite3-default of 128 is shared with the variable-length queries
+    # of, e.g., `get_all`)
+    CACHED_STATEMENTS = 256
 
     def __init__(
         self,
@@ -156,6 +117,7 @@ class SQLiteController(Controller):
         token_ttl: Optional[int] = 3600,
         message_ttl: Optional[int] = 360,
         timeout: Optional[float] = 5,
+        pragmas: Optional[Mapping[str, Any]] = None,
     ) -> None:
         self._path = path
         self._memory_id = memory_id
@@ -173,7 +135,18 @@ class SQLiteController(Controller):
         self.token_ttl = token_ttl
         self.message_ttl = message_ttl
         self.timeout = timeout
+        self.pragmas = (self.FILE_PRAGMAS if path is not None else {}) | (
+            pragmas or {}
+        )
         self._threading_db_lock = threading.Lock()
+        # used to notify waiting queue_pop-calls about new submissions
+        # the counter is used to detect submissions that occurred between
+        # a failed pop-attempt and the start of waiting
+        self._queue_condition = threading.Condition()
+        self._queue_submissions = 0
+        # reuse one connection per thread (makes use of the
+        # sqlite3-module's per-connection statement cache)
+        self._connections = threading.local()
 
         # always keep one connection when working in memory
         if path is None:
@@ -183,6 +156,7 @@ class SQLiteController(Controller):
 
         if self._check_schema_version() == 0:
             self._load_schema()
+        self._create_indices()
 
     @property
     def name(self):
@@ -196,26 +170,67 @@ class SQLiteController(Controller):
         setting).
         """
         if self._path is not None:
-            return Transaction.get_connection(self._path, timeout=self.timeout)
+            return Transaction.get_connection(
+                self._path,
+                self.pragmas,
+                timeout=self.timeout,
+                cached_statements=self.CACHED_STATEMENTS,
+            )
         if self._memory_id is None:
             self._memory_id = str(uuid4())
+        # in-memory databases do not support WAL-mode; the shared
+        # cache is required to access the same database via multiple
+        # connections
         return Transaction.get_connection(
             f"file:{self._memory_id}?mode=memory&cache=shared",
+            self.pragmas,
             uri=True,
             timeout=self.timeout,
+            cached_statements=self.CACHED_STATEMENTS,
         )
 
-    def transaction(self, check: bool = True):
+    @property
+    def _connection(self) -> sqlite3.Connection:
+        """
+        Returns the database-connection of the current thread (created
+        on first use).
+        """
+        conn = getattr(self._connections, "conn", None)
+        if conn is None:
+            conn = self.db
+            self._connections.conn = conn
+        return conn
+
+    def transaction(self, check: bool = True, write: bool = False):
         """
         Returns `Transaction`-object connected to the controller's
-        database.
+        database (reuses the connection of the current thread).
         """
-        return Transaction(self.db, check=check)
+        return Transaction(
+            self._connection, check=check, autoclose=False, write=write
+        )
 
     def close(self):
-        """Closes internal database connection."""
+        """
+        Closes internal database connection and the connection of the
+        current thread.
+        """
         if self._db is not None:
             self._db.close()
+        conn = getattr(self._connections, "conn", None)
+        if conn is not None:
+            conn.close()
+            self._connections.conn = None
+
+    def __getstate__(self):
+        # thread-local connections cannot be pickled
+        state = self.__dict__.copy()
+        del state["_connections"]
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._connections = threading.local()
 
     def _check_schema_version(self) -> None:
         """
@@ -233,7 +248,7 @@ class SQLiteController(Controller):
 
     def _load_schema(self) -> None:
         """Loads database schema."""
-        with self.transaction() as t:
+        with self.transaction(write=True) as t:
             t.cursor.execute(f"PRAGMA user_version = {self.SCHEMA_VERSION}")
             t.cursor.execute(
                 """CREATE TABLE registry (
@@ -243,8 +258,8 @@ class SQLiteController(Controller):
                       'queued', 'running', 'completed', 'aborted', 'failed'
                     )
                   ) NOT NULL,
-                  -- JSON of JobInfo-object
-                  info TEXT NOT NULL,
+                  -- UTF-8-encoded JSON of JobInfo-object
+                  info BLOB NOT NULL,
                   -- token expiration; seconds since epoch
                   expires_at INTEGER
                 )"""
@@ -282,16 +297,45 @@ class SQLiteController(Controller):
                 )"""
             )
 
-    def queue_push(self, token: str, info: Mapping | JobInfo) -> Token:
+    def _create_indices(self) -> None:
         """
-        Add job to queue, returns `Token` if successful or already
-        existing or `None` otherwise.
-
-        If `info` is not passed as `JobInfo`, adds the `token` and
-        `produced`-metadata before submission.
+        Creates database indices (if missing). Indices are not part of
+        the versioned schema, since they do not affect the data itself.
         """
-        self.cleanup()
+        with self.transaction(write=True) as t:
+            # used for cascading deletes of registry-records
+            t.cursor.execute(
+                """CREATE INDEX IF NOT EXISTS messages_token
+                ON messages (token)"""
+            )
+            t.cursor.execute(
+                """CREATE INDEX IF NOT EXISTS messages_received_at
+                ON messages (received_at)"""
+            )
+            t.cursor.execute(
+                """CREATE INDEX IF NOT EXISTS registry_status
+                ON registry (status)"""
+            )
+            t.cursor.execute(
+                """CREATE INDEX IF NOT EXISTS registry_expires_at
+                ON registry (expires_at)"""
+            )
+            t.cursor.execute(
+                """CREATE INDEX IF NOT EXISTS locks_expires_at
+                ON locks (expires_at)"""
+            )
+            t.cursor.execute(
+                """CREATE INDEX IF NOT EXISTS messages_expires_at
+                ON messages (expires_at)"""
+            )
 
+    def _prepare_submission(
+        self, token: str, info: Mapping | JobInfo
+    ) -> tuple[Token, tuple]:
+        """
+        Returns `Token` and registry-row for a new submission of `token`
+        with `info`.
+        """
         _token = Token(
             token,
             self.token_ttl is not None,
@@ -304,38 +348,35 @@ class SQLiteController(Controller):
             ),
         )
         if isinstance(info, JobInfo):
-            info = deepcopy(info)
-            info.token = _token
-            info.metadata.produce(self._name)
-            if isinstance(info.report, Mapping):
-                info.report["token"] = _token.json
-            elif info.report is not None:
-                info.report.token = _token
-
-        with self._threading_db_lock, self.transaction(False) as t:
-            t.cursor.execute(
-                "INSERT INTO registry VALUES (?, ?, ?, ?)",
-                (
-                    token,
-                    "queued",
-                    json.dumps(
-                        info if isinstance(info, Mapping) else info.json
-                    ),
-                    (
-                        None
-                        if _token.expires_at is None
-                        else int(_token.expires_at.timestamp())
-                    ),
-                ),
-            )
-        # new submission
-        if t.success:
-            Logging.print_to_log(
-                f"Controller '{self._name}' accepted job '{token}'.",
-                Logging.LEVEL_DEBUG,
-            )
-            return _token
-        # resubmission
+            # patch serialized info instead of altering a (deep) copy of
+            # the original
+            info_json = info.json
+            info_json["token"] = _token.json
+            if info.metadata.produced is None:
+                info_json.setdefault("metadata", {})["produced"] = (
+                    MetadataRecord(self._name).json
+                )
+            if info.report is not None:
+                info_json["report"]["token"] = _token.json
+        else:
+            info_json = info
+
+        return _token, (
+            token,
+            "queued",
+            json_dumps(info_json),
+            (
+                None
+                if _token.expires_at is None
+                else int(_token.expires_at.timestamp())
+            ),
+        )
+
+    def _resubmission(self, token: str, info: Mapping | JobInfo) -> Token:
+        """
+        Returns existing `Token` for a resubmission of `token`. Raises
+        `ValueError` if the original body differs.
+        """
         _token = self.get_token(token)
         _info = self.get_info(token)
         if _info.get("config", {}).get("original_body") != (
@@ -346,8 +387,98 @@ class SQLiteController(Controller):
             raise ValueError("Resubmission with different body not allowed.")
         return _token
 
-    def queue_pop(self, name: str) -> Optional[Lock]:
-        """Request a lock on a job from the queue."""
+    def queue_push(self, token: str, info: Mapping | JobInfo) -> Token:
+        """
+        Add job to queue, returns `Token` if successful or already
+        existing or `None` otherwise.
+
+        If `info` is not passed as `JobInfo`, adds the `token` and
+        `produced`-metadata before submission.
+        """
+        self.cleanup()
+
+        _token, row = self._prepare_submission(token, info)
+
+        with self._threading_db_lock, self.transaction(False, write=True) as t:
+            t.cursor.execute("INSERT INTO registry VALUES (?, ?, ?, ?)", row)
+        # new submission
+        if t.success:
+            Logging.print_to_log(
+                f"Controller '{self._name}' accepted job '{token}'.",
+                Logging.LEVEL_DEBUG,
+            )
+            self._notify_submission()
+            return _token
+        # resubmission
+        return self._resubmission(token, info)
+
+    def queue_push_many(
+        self, items: Iterable[tuple[str, Mapping | JobInfo]]
+    ) -> list[Token]:
+        """
+        Add multiple jobs (pairs of token and info) to queue within a
+        single transaction, returns list of `Token`s (see `queue_push`).
+
+        Raises `ValueError` if any resubmission has a different body
+        (new submissions are accepted regardless).
+        """
+        self.cleanup()
+
+        items = list(items)
+        submissions = [
+            self._prepare_submission(token, info) for token, info in items
+        ]
+
+        with self._threading_db_lock, self.transaction(write=True) as t:
+            t.cursor.executemany(
+                "INSERT OR IGNORE INTO registry VALUES (?, ?, ?, ?)",
+                [row for _, row in submissions],
+            )
+            accepted = t.cursor.rowcount
+        Logging.print_to_log(
+            f"Controller '{self._name}' accepted {accepted} job(s).",
+            Logging.LEVEL_DEBUG,
+        )
+        if accepted > 0:
+            self._notify_submission()
+        # only new submissions
+        if accepted == len(items):
+            return [_token for _token, _ in submissions]
+        # contains resubmissions
+        return [self._resubmission(token, info) for token, info in items]
+
+    def queue_pop(self, name: str, wait: float = 0) -> Optional[Lock]:
+        """
+        Request a lock on a job from the queue.
+
+        Keyword arguments:
+        name -- name of the requesting worker
+        wait -- if positive, wait up to this duration in seconds for a
+                job to become available if the queue is empty; waiting
+                calls are notified about submissions via this controller
+                instance while jobs submitted differently are only
+                picked up after the wait-duration has elapsed
+                (default 0)
+        """
+        t0 = time()
+        while True:
+            submissions = self._queue_submissions
+            lock = self._queue_pop(name)
+            remaining = wait - (time() - t0)
+            if lock is not None or remaining <= 0:
+                return lock
+            with self._queue_condition:
+                if submissions == self._queue_submissions:
+                    self._queue_condition.wait(remaining)
+
+    def _notify_submission(self) -> None:
+        """Notify waiting `queue_pop`-calls about new submissions."""
+        with self._queue_condition:
+            self._queue_submissions += 1
+            self._queue_condition.notify_all()
+
+    def _queue_pop(self, name: str) -> Optional[Lock]:
+        """Single attempt of `queue_pop`."""
         self.cleanup()
 
         lock_id = str(uuid4())
@@ -355,24 +486,16 @@ class SQLiteController(Controller):
             expires_at = (
                 datetime.now() + timedelta(seconds=self.lock_ttl)
             ).replace(microsecond=0)
-            with self.transaction() as t:
+            with self.transaction(write=True) as t:
                 t.cursor.execute(
-                    """WITH available_tokens AS (
-                        SELECT token from registry
-                        WHERE status = 'queued'
-                        AND NOT EXISTS (
-                          SELECT 1 FROM locks
-                          WHERE locks.token = registry.token)
-                        LIMIT 1)
-                      INSERT INTO locks
-                        SELECT ?, ?, token, ? FROM available_tokens
-                    """,
+                    _SQL_QUEUE_POP,
                     (lock_id, name, int(expires_at.timestamp())),
                 )
-                t.cursor.execute(
-                    "SELECT token FROM locks where id = ?",
-                    (lock_id,),
-                )
+                if not _SQLITE_RETURNING:
+                    t.cursor.execute(
+                        "SELECT token FROM locks where id = ?",
+                        (lock_id,),
+                    )
             if t.success and len(t.data) > 0:
                 return Lock(lock_id, name, t.data[0][0], expires_at)
 
@@ -381,7 +504,7 @@ class SQLiteController(Controller):
 
     def release_lock(self, lock_id: str) -> None:
         """Releases a lock on a job from the queue."""
-        with self._threading_db_lock, self.transaction() as t:
+        with self._threading_db_lock, self.transaction(write=True) as t:
             t.cursor.execute("DELETE from locks WHERE id = ?", (lock_id,))
 
     def refresh_lock(self, lock_id: str) -> Lock:
@@ -391,20 +514,22 @@ class SQLiteController(Controller):
         """
         self.cleanup()
 
-        with self._threading_db_lock, self.transaction() as t:
+        now = int(time())
+        expires_at = now + self.lock_ttl
+        with self._threading_db_lock, self.transaction(write=True) as t:
+            # update first to not depend on the write-lock being
+            # acquired up front (see `Transaction`)
             t.cursor.execute(
-                "SELECT name, token, expires_at FROM locks WHERE id = ?",
-                (lock_id,),
+                """UPDATE locks SET expires_at = ?
+                  WHERE id = ? AND expires_at >= ?""",
+                (expires_at, lock_id, now),
             )
-            data = t.cursor.fetchone()
-            now = int(datetime.now().replace(microsecond=0).timestamp())
-            if data is None or data[2] < now:
+            if t.cursor.rowcount == 0:
                 raise ValueError("Stale lock, refresh rejected.")
-            expires_at = now + self.lock_ttl
             t.cursor.execute(
-                "UPDATE locks SET expires_at = ? WHERE id = ?",
-                (expires_at, lock_id),
+                "SELECT name, token FROM locks WHERE id = ?", (lock_id,)
             )
+            data = t.cursor.fetchone()
 
         return Lock(
             lock_id, data[0], data[1], datetime.fromtimestamp(expires_at)
@@ -413,8 +538,8 @@ class SQLiteController(Controller):
     def cleanup(self) -> None:
         """Runs a cleanup for registry and locks regarding expiration."""
         # invalidate broken locks
-        now = int(datetime.now().timestamp())
-        with self._threading_db_lock, self.transaction() as t:
+        now = int(time())
+        with self._threading_db_lock, self.transaction(write=True) as t:
             t.cursor.execute("DELETE from locks WHERE expires_at < ?", (now,))
             t.cursor.execute(
                 "DELETE from registry WHERE expires_at < ?", (now,)
@@ -443,7 +568,7 @@ class SQLiteController(Controller):
             for token, info_str in failed_tokens:
                 try:
                     # parse existing info
-                    info = json.loads(info_str)
+                    info = json_loads(info_str)
                     if "metadata" not in info:
                         info["metadata"] = JobMetadata()
                     else:
@@ -505,7 +630,7 @@ class SQLiteController(Controller):
                         """,
                         (
                             "queued" if self.requeue else "failed",
-                            json.dumps(info),
+                            json_dumps(info),
                             token,
                         ),
                     )
@@ -534,25 +659,39 @@ class SQLiteController(Controller):
                         Logging.LEVEL_ERROR,
                     )
 
+    def _read_one(self, sql: str, parameters: tuple) -> Optional[tuple]:
+        """
+        Returns the first row of the result of the read-only query `sql`
+        (runs without an explicit `Transaction`).
+        """
+        with self._threading_db_lock:
+            conn = self._connection
+            try:
+                return conn.execute(sql, parameters).fetchone()
+            finally:
+                # python>=3.12 (autocommit=False): end implicit
+                # read-transaction to not keep the snapshot
+                if conn.in_transaction:
+                    conn.rollback()
+
     def get_token(self, token: str) -> Token:
         """Fetch token-data from registry."""
         self.cleanup()
 
-        with self._threading_db_lock, self.transaction() as t:
-            t.cursor.execute(
-                "SELECT expires_at FROM registry WHERE token = ?", (token,)
-            )
+        row = self._read_one(
+            "SELECT expires_at FROM registry WHERE token = ?", (token,)
+        )
 
-        if len(t.data) == 0:
+        if row is None:
             raise ValueError(f"Unknown job token '{token}'.")
 
         return Token(
             token,
-            t.data[0][0] is not None,
+            row[0] is not None,
             (
                 None
-                if t.data[0][0] is None
-                else datetime.fromtimestamp(t.data[0][0], tz=self.tz)
+                if row[0] is None
+                else datetime.fromtimestamp(row[0], tz=self.tz)
             ),
         )
 
@@ -560,29 +699,66 @@ class SQLiteController(Controller):
         """Fetch info from registry as JSON."""
         self.cleanup()
 
-        with self._threading_db_lock, self.transaction() as t:
-            t.cursor.execute(
-                "SELECT info FROM registry WHERE token = ?", (token,)
-            )
+        row = self._read_one(
+            "SELECT info FROM registry WHERE token = ?", (token,)
+        )
 
-        if len(t.data) == 0:
+        if row is None:
             raise ValueError(f"Unknown job token '{token}'.")
 
-        return json.loads(t.data[0][0])
+        return json_loads(row[0])
 
     def get_status(self, token: str) -> str:
         """Fetch status from registry."""
         self.cleanup()
 
-        with self._threading_db_lock, self.transaction() as t:
-            t.cursor.execute(
-                "SELECT status FROM registry WHERE token = ?", (token,)
-            )
+        row = self._read_one(
+            "SELECT status FROM registry WHERE token = ?", (token,)
+        )
 
-        if len(t.data) == 0:
+        if row is None:
             raise ValueError(f"Unknown job token '{token}'.")
 
-        return t.data[0][0]
+        return row[0]
+
+    def get_all(
+        self, tokens: Optional[Iterable[str]] = None
+    ) -> dict[str, tuple[str, Any]]:
+        """
+        Fetch status and info (as JSON) for multiple records from
+        registry. Returns a mapping of token and tuple of status and
+        info. Unknown tokens are omitted.
+
+        Keyword arguments:
+        tokens -- tokens to be fetched
+                  (default None; fetches all records)
+        """
+        self.cleanup()
+
+        result = {}
+        with self._threading_db_lock, self.transaction() as t:
+            if tokens is None:
+                t.cursor.execute("SELECT token, status, info FROM registry")
+                result.update(
+                    (token, (status, json_loads(info)))
+                    for token, status, info in t.iter_data()
+                )
+            else:
+                tokens = list(tokens)
+                # limit number of placeholders per statement
+                for i in range(0, len(tokens), 500):
+                    chunk = tokens[i : i + 500]
+                    t.cursor.execute(
+                        "SELECT token, status, info FROM registry "
+                        + f"WHERE token IN ({', '.join('?' * len(chunk))})",
+                        chunk,
+                    )
+                    result.update(
+                        (token, (status, json_loads(info)))
+                        for token, status, info in t.iter_data()
+                    )
+
+        return result
 
     def registry_push(
         self,
@@ -598,45 +774,84 @@ class SQLiteController(Controller):
             return
 
         # get lock
-        with self._threading_db_lock, self.transaction() as t:
-            t.cursor.execute(
-                "SELECT token, expires_at FROM locks WHERE id = ?", (lock_id,)
-            )
+        row = self._read_one(
+            "SELECT token, expires_at FROM locks WHERE id = ?", (lock_id,)
+        )
 
-        if len(t.data) == 0:
+        if row is None:
             raise ValueError("Stale lock, update to job registry rejected.")
 
-        token, expires_at = t.data[0]
+        token, expires_at = row
 
         # check expiration
-        if datetime.now().timestamp() > expires_at:
+        if time() > expires_at:
             raise ValueError("Stale lock, update to job registry rejected.")
 
         # run update
+        with self._threading_db_lock, self.transaction(write=True) as t:
+            self._registry_update(t.cursor, token, status, info)
+
+    @staticmethod
+    def _registry_update(
+        cursor: sqlite3.Cursor,
+        token: str,
+        status: Optional[str],
+        info: Optional[Mapping | JobInfo],
+    ) -> None:
+        """Runs update of registry-record for `token`."""
+        if status is None and info is None:
+            return
         args = []
-        statement = []
         if status is not None:
-            statement.append("status = ?")
             args.append(status)
         if info is not None:
-            statement.append("info = ?")
             args.append(
-                json.dumps(info if isinstance(info, Mapping) else info.json)
+                json_dumps(info if isinstance(info, Mapping) else info.json)
             )
-        statement = ",".join(statement)
         args.append(token)
 
-        with self._threading_db_lock, self.transaction() as t:
+        cursor.execute(
+            _SQL_REGISTRY_UPDATE[(status is not None, info is not None)], args
+        )
+
+    def finish_lock(
+        self,
+        lock_id: str,
+        *,
+        status: Optional[str] = None,
+        info: Optional[Mapping | JobInfo] = None,
+    ) -> None:
+        """
+        Push final data to registry and release lock (in a single
+        transaction).
+        """
+        self.cleanup()
+
+        with self._threading_db_lock, self.transaction(write=True) as t:
+            # start with a write to acquire the write-lock right away
+            # (upgrading a read-transaction fails if another connection
+            # has written in the meantime; see `Transaction`)
             t.cursor.execute(
-                f"UPDATE registry SET {statement} WHERE token = ?",
-                args,
+                "DELETE FROM locks WHERE id = ? AND expires_at < ?",
+                (lock_id, time()),
             )
+            t.cursor.execute(
+                "SELECT token FROM locks WHERE id = ?", (lock_id,)
+            )
+            data = t.cursor.fetchone()
+            if data is None:
+                raise ValueError(
+                    "Stale lock, update to job registry rejected."
+                )
+            self._registry_update(t.cursor, data[0], status, info)
+            t.cursor.execute("DELETE from locks WHERE id = ?", (lock_id,))
 
     def message_push(
         self, token: str, instruction: str, origin: str, content: str
     ) -> None:
         """Posts message."""
-        with self._threading_db_lock, self.transaction(False) as t:
+        received_at = time()
+        with self._threading_db_lock, self.transaction(False, write=True) as t:
             t.cursor.execute(
                 "INSERT INTO messages VALUES (?, ?, ?, ?, ?, ?)",
                 (
@@ -644,14 +859,9 @@ class SQLiteController(Controller):
                     instruction,
                     origin,
                     content,
-                    int(datetime.now().timestamp()),
+                    int(received_at),
                     (
-                        int(
-                            (
-                                datetime.now()
-                                + timedelta(seconds=self.message_ttl)
-                            ).timestamp()
-                        )
+                        int(received_at + self.message_ttl)
                         if self.message_ttl is not None
                         else None
                     ),
@@ -690,10 +900,8 @@ class SQLiteController(Controller):
                 "SELECT * FROM messages WHERE received_at >= ?",
                 (since_,),
             )
-
-        return list(
-            map(
-                lambda message: Message(
+            return [
+                Message(
                     message[0],
                     Instruction(message[1]),
                     message[2],
@@ -704,7 +912,6 @@ class SQLiteController(Controller):
                         if message[5] is None
                         else datetime.fromtimestamp(message[5])
                     ),
-                ),
-                t.data,
-            )
-        )
+                )
+                for message in t.iter_data()
+            ]
@@ -1,15 +1,68 @@
 """
 Definition of an altered multiprocessing-module with support for dill-
 pickles.
+
+When pickling, the standard library's `pickle` is tried first, then
+the optional package `cloudpickle` (if installed; both are
+significantly faster than `dill`). Objects that are not supported by
+either are pickled using `dill`.
 """
 
 from typing import Callable, Optional, Iterable, Mapping, Any
 from dataclasses import dataclass
+from types import FunctionType
+import io
+import pickle
 import multiprocessing
 from multiprocessing.connection import Connection
 
 import dill
 
+try:
+    import cloudpickle
+except ImportError:
+    cloudpickle = None
+
+
+class _Pickler(pickle.Pickler):
+    """
+    Standard-library pickler that rejects classes and functions defined
+    in `__main__` (`cloudpickle` and `dill` pickle those by value
+    instead of by reference).
+    """
+
+    def reducer_override(self, obj):
+        if (
+            isinstance(obj, (type, FunctionType))
+            and getattr(obj, "__module__", None) == "__main__"
+        ):
+            raise pickle.PicklingError(
+                f"Object '{obj.__qualname__}' is defined in '__main__'."
+            )
+        return NotImplemented
+
+
+def _dumps(obj: Any) -> bytes:
+    """
+    Returns pickled `obj` (using `pickle` or `cloudpickle` if possible
+    with `dill` as fallback). The result can always be loaded with
+    `dill.loads`.
+    """
+    try:
+        buffer = io.BytesIO()
+        _Pickler(buffer, pickle.HIGHEST_PROTOCOL).dump(obj)
+        return buffer.getvalue()
+    # pylint: disable=broad-exception-caught
+    except Exception:
+        pass
+    if cloudpickle is not None:
+        try:
+            return cloudpickle.dumps(obj)
+        # pylint: disable=broad-exception-caught
+        except Exception:
+            pass
+    return dill.dumps(obj)
+
 
 @dataclass
 class DillIgnore:
@@ -40,11 +93,11 @@ class DilledProcess(multiprocessing.Process):
     ):
         super().__init__(target=lambda: None, args=(), kwargs={}, **other)
         # pickle data using dill but skip values wrapped in ProtectedArg
-        self._target = dill.dumps(target)
+        self._target = _dumps(target)
         self._args = tuple(
             map(
                 lambda arg: (
-                    arg if isinstance(arg, DillIgnore) else dill.dumps(arg)
+                    arg if isinstance(arg, DillIgnore) else _dumps(arg)
                 ),
                 args or (),
             )
@@ -56,7 +109,7 @@ class DilledProcess(multiprocessing.Process):
                     (
                         kwarg[1]
                         if isinstance(kwarg[1], DillIgnore)
-                        else dill.dumps(kwarg[1])
+                        else _dumps(kwarg[1])
                     ),
                 ),
                 (kwargs or {}).items(),
@@ -104,7 +157,8 @@ class DilledConnection:
         """`dill`-wrapped send."""
         if isinstance(obj, DillIgnore):
             self.conn.send(obj)
-        self.conn.send(dill.dumps(obj))
+        else:
+            self.conn.send(_dumps(obj))
 
     def recv(self) -> Any:
         """`dill`-wrapped recv."""
@@ -2,6 +2,7 @@
 
 from typing import Optional
 from dataclasses import dataclass, field
+from collections.abc import Mapping
 
 from flask import request
 
@@ -80,6 +81,23 @@ class MetadataRecord(DataModel):
         default_factory=lambda: now(True).isoformat()
     )
 
+    @classmethod
+    def from_json(cls, json: JSONObject) -> "MetadataRecord":
+        """
+        Instantiate `MetadataRecord` based on the given `json`.
+
+        Falls back to the generic `DataModel`-deserialization (and its
+        error handling) for malformed input.
+        """
+        if not isinstance(json, Mapping) or not all(
+            isinstance(json.get(key), (str, type(None)))
+            for key in ("by", "datetime")
+        ):
+            return super().from_json(json)
+        if "datetime" not in json:
+            return cls(json.get("by"))
+        return cls(json.get("by"), json["datetime"])
+
 
 class JobMetadata(DataModel):
     """Datamodel for `Job`-metadata."""
@@ -101,6 +119,32 @@ class JobMetadata(DataModel):
         self.aborted = aborted
         self.completed = completed
 
+    @classmethod
+    def from_json(cls, json: JSONObject) -> "JobMetadata":
+        """
+        Instantiate `JobMetadata` based on the given `json`.
+
+        This explicit implementation replaces the generic `DataModel`-
+        deserialization since metadata is deserialized with every
+        `JobInfo`. Falls back to the generic implementation (and its
+        error handling) for malformed input.
+        """
+        if not isinstance(json, Mapping) or not all(
+            isinstance(json.get(key), (Mapping, type(None)))
+            for key in ("produced", "consumed", "aborted", "completed")
+        ):
+            return super().from_json(json)
+        return cls(
+            *(
+                (
+                    None
+                    if json.get(key) is None
+                    else MetadataRecord.from_json(json[key])
+                )
+                for key in ("produced", "consumed", "aborted", "completed")
+            )
+        )
+
     def produce(self, by: Optional[str]) -> None:
         """Sets produced-record if not already set."""
         if self.produced is not None:
@@ -145,3 +189,33 @@ class JobInfo(DataModel):
         if value is None:
             DataModel.skip()
         return value
+
+    @classmethod
+    def from_json(cls, json: JSONObject) -> "JobInfo":
+        """
+        Instantiate `JobInfo` based on the given `json`.
+
+        This explicit implementation replaces the generic `DataModel`-
+        deserialization since job information is deserialized in most
+        controller- and worker-operations. Falls back to the generic
+        implementation (and its error handling) for malformed input.
+        """
+        if (
+            not isinstance(json, Mapping)
+            or not isinstance(json.get("config"), Mapping)
+            or not isinstance(json.get("token"), (Mapping, type(None)))
+            or not isinstance(json.get("metadata"), (Mapping, type(None)))
+        ):
+            return super().from_json(json)
+        kwargs = {"config": JobConfig.from_json(json["config"])}
+        if json.get("token") is not None:
+            kwargs["token"] = Token.from_json(json["token"])
+        if "metadata" in json:
+            kwargs["metadata"] = (
+                None
+                if json["metadata"] is None
+                else JobMetadata.from_json(json["metadata"])
+            )
+        if json.get("report") is not None:
+            kwargs["report"] = json["report"]
+        return cls(**kwargs)
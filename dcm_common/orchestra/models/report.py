@@ -3,9 +3,10 @@
 from typing import Optional
 from dataclasses import dataclass, field
 from enum import Enum
+from collections.abc import Mapping
 
 from dcm_common import Logger
-from dcm_common.models import DataModel, JSONable
+from dcm_common.models import DataModel, JSONable, JSONObject
 from .token import Token
 
 
@@ -20,7 +21,7 @@ class Status(Enum):
     COMPLETED = "completed"
 
 
-@dataclass
+@dataclass(slots=True)
 class Progress(DataModel):
     """
     Progress `DataModel`
@@ -35,17 +36,40 @@ class Progress(DataModel):
     verbose: str = field(default_factory=lambda: "")
     numeric: int = 0
 
-    @DataModel.serialization_handler("status")
-    @classmethod
-    def status_serialization(cls, value):
-        """Performs `status`-serialization."""
-        return value.value
+    @property
+    def json(self) -> JSONObject:
+        """
+        Returns dictionary that can be jsonified.
+
+        This explicit implementation replaces the generic `DataModel`-
+        serialization since progress is (de-)serialized with every
+        report.
+        """
+        json = {"status": self.status.value}
+        if self.verbose is not None:
+            json["verbose"] = self.verbose
+        if self.numeric is not None:
+            json["numeric"] = self.numeric
+        return json
 
-    @DataModel.deserialization_handler("status")
     @classmethod
-    def status_deserialization(cls, value):
-        """Performs `status`-deserialization."""
-        return Status(value)
+    def from_json(cls, json: JSONObject) -> "Progress":
+        """
+        Instantiate `Progress` based on the given `json`.
+
+        Falls back to the generic `DataModel`-deserialization (and its
+        error handling) for malformed input.
+        """
+        if not isinstance(json, Mapping):
+            # zero-argument super() is not usable with slots (dataclass
+            # replaces the class)
+            return DataModel.from_json.__func__(cls, json)
+        kwargs = {"status": Status(json.get("status"))}
+        if "verbose" in json:
+            kwargs["verbose"] = json["verbose"]
+        if "numeric" in json:
+            kwargs["numeric"] = json["numeric"]
+        return cls(**kwargs)
 
     def run(self) -> None:
         """Set `status`-property to RUNNING."""
@@ -3,11 +3,26 @@
 from typing import Optional
 from dataclasses import dataclass
 from datetime import datetime
+from collections.abc import Mapping
+import threading
 
-from dcm_common.models import DataModel
+from dcm_common.models import DataModel, JSONObject
 
 
-@dataclass
+# most recently parsed value of `Token.expires_at` (per thread); tokens
+# are often deserialized repeatedly with identical expiration dates
+_last_expires_at = threading.local()
+
+
+def _parse_expires_at(value: str) -> datetime:
+    """Returns parsed ISO-formatted `value` (with cache for last value)."""
+    if getattr(_last_expires_at, "value", None) != value:
+        _last_expires_at.datetime = datetime.fromisoformat(value)
+        _last_expires_at.value = value
+    return _last_expires_at.datetime
+
+
+@dataclass(slots=True)
 class Token(DataModel):
     """Token datamodel."""
 
@@ -15,18 +30,42 @@ class Token(DataModel):
     expires: bool = False
     expires_at: Optional[datetime] = None
 
-    @DataModel.serialization_handler("expires_at")
-    @classmethod
-    def expires_at_serialization(cls, value):
-        """Performs `expires_at`-serialization."""
-        if value is None:
-            DataModel.skip()
-        return value.isoformat()
+    @property
+    def json(self) -> JSONObject:
+        """
+        Returns dictionary that can be jsonified.
+
+        This explicit implementation replaces the generic `DataModel`-
+        serialization since tokens are (de-)serialized in every
+        controller-request.
+        """
+        json = {}
+        if self.value is not None:
+            json["value"] = self.value
+        if self.expires is not None:
+            json["expires"] = self.expires
+        if self.expires_at is not None:
+            json["expires_at"] = self.expires_at.isoformat()
+        return json
 
-    @DataModel.deserialization_handler("expires_at")
     @classmethod
-    def expires_at_deserialization(cls, value):
-        """Performs `expires_at`-deserialization."""
-        if value is None:
-            DataModel.skip()
-        return datetime.fromisoformat(value)
+    def from_json(cls, json: JSONObject) -> "Token":
+        """
+        Instantiate `Token` based on the given `json`.
+
+        Falls back to the generic `DataModel`-deserialization (and its
+        error handling) for malformed input.
+        """
+        if not isinstance(json, Mapping) or "value" not in json:
+            # zero-argument super() is not usable with slots (dataclass
+            # replaces the class)
+            return DataModel.from_json.__func__(cls, json)
+        return cls(
+            json["value"],
+            json.get("expires", False),
+            (
+                None
+                if json.get("expires_at") is None
+                else _parse_expires_at(json["expires_at"])
+            ),
+        )
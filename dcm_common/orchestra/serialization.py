@@ -0,0 +1,69 @@
+"""
+JSON-(de-)serialization helpers for the `orchestra`-package.
+
+If the optional package `orjson` is installed, it is used to speed up
+encoding and decoding of JSON-documents (e.g., `JobInfo`-records in a
+controller's database or HTTP-request bodies). Otherwise, the standard
+library's `json`-module is used.
+
+Both paths accept and reject the same input: out-of-range float values
+(`nan`, `inf`) raise a `ValueError` and objects that are not natively
+JSON-serializable (e.g., `datetime` or dataclass-instances) raise a
+`TypeError`. Integers beyond the 64-bit range are not supported.
+"""
+
+from typing import Any
+import json
+import math
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+else:
+    # let orjson reject types that the standard library does not
+    # serialize (and serialize subclasses like the standard library)
+    _ORJSON_OPTIONS = (
+        orjson.OPT_PASSTHROUGH_DATETIME
+        | orjson.OPT_PASSTHROUGH_DATACLASS
+        | orjson.OPT_PASSTHROUGH_SUBCLASS
+    )
+
+
+def _has_non_finite_float(obj: Any) -> bool:
+    """Returns `True` if `obj` contains `nan` or `inf`."""
+    if isinstance(obj, float):
+        return not math.isfinite(obj)
+    if isinstance(obj, dict):
+        return any(_has_non_finite_float(v) for v in obj.values())
+    if isinstance(obj, (list, tuple)):
+        return any(_has_non_finite_float(v) for v in obj)
+    return False
+
+
+def dumps(obj: Any) -> bytes:
+    """Returns UTF-8-encoded JSON for `obj`."""
+    if orjson is not None:
+        try:
+            result = orjson.dumps(obj, option=_ORJSON_OPTIONS)
+        except TypeError:
+            # orjson is more strict (e.g. non-str keys or subclasses),
+            # use standard library as fallback
+            pass
+        else:
+            # orjson silently writes out-of-range floats as null
+            if b"null" not in result or not _has_non_finite_float(obj):
+                return result
+    return json.dumps(obj, allow_nan=False).encode("utf-8")
+
+
+def loads(s: str | bytes) -> Any:
+    """Returns object deserialized from JSON-string `s`."""
+    if orjson is not None:
+        try:
+            return orjson.loads(s)
+        except orjson.JSONDecodeError:
+            # standard library is more lenient (e.g. records containing
+            # NaN that have been written before)
+            pass
+    return json.loads(s)
@@ -3,8 +3,9 @@
 from typing import Optional, Mapping, Callable
 import sys
 import os
+import inspect
 import threading
-from time import sleep, time
+from time import time
 from enum import Enum
 import socket
 from uuid import uuid4
@@ -31,6 +32,17 @@ from .dilled import DilledProcess, DilledConnection, DilledPipe, DillIgnore
 from .logging import Logging
 
 
+def _accepts_wait(controller: Controller) -> bool:
+    """
+    Returns `True` if `controller.queue_pop` accepts the argument `wait`
+    (long-polling).
+    """
+    try:
+        return "wait" in inspect.signature(controller.queue_pop).parameters
+    except (TypeError, ValueError):
+        return False
+
+
 class WorkerState(Enum):
     """Enum for states of a Worker."""
 
@@ -61,6 +73,11 @@ class Worker:
                              (default 1)
     message_interval -- interval for the message-polling in seconds
                         (default 1)
+    long_polling_timeout -- maximum duration of individual long-polling
+                            requests while idle in seconds; bounds the
+                            time for stop-requests to take effect while
+                            waiting for new submissions
+                            (default 1)
     """
 
     def __init__(
@@ -74,6 +91,7 @@ class Worker:
         registry_push_interval: float = 1,
         lock_refresh_interval: float = 1,
         messages_interval: float = 1,
+        long_polling_timeout: float = 1,
     ) -> None:
         self.controller = controller
         if len(job_factory_map) == 0 or len(report_type_map) == 0:
@@ -94,6 +112,7 @@ class Worker:
         self.registry_push_interval = registry_push_interval
         self.lock_refresh_interval = lock_refresh_interval
         self.messages_interval = messages_interval
+        self.long_polling_timeout = long_polling_timeout
 
         # business logic
         self._thread: Optional[threading.Thread] = None
@@ -106,6 +125,8 @@ class Worker:
         self._stop_context.stopped.set()
         self._abort_context = AbortContext()
 
+        self._state_change_callbacks: list[Callable[[WorkerState], None]] = []
+
     @property
     def name(self) -> str:
         """Returns worker name."""
@@ -120,6 +141,36 @@ class Worker:
             return WorkerState.BUSY
         return WorkerState.IDLE
 
+    def on_state_change(
+        self, callback: Callable[[WorkerState], None]
+    ) -> None:
+        """
+        Registers `callback` to be called with the new `WorkerState`
+        whenever this worker changes its state.
+
+        Callbacks are executed in the worker's thread and should return
+        quickly. `WorkerState.STOPPED` is signaled right before that
+        thread exits. Exceptions raised by a callback are logged and
+        otherwise ignored.
+
+        Keyword arguments:
+        callback -- callable that accepts the new state
+        """
+        self._state_change_callbacks.append(callback)
+
+    def _notify_state_change(self, state: WorkerState) -> None:
+        """Runs all registered state-change callbacks for `state`."""
+        for callback in self._state_change_callbacks:
+            try:
+                callback(state)
+            # pylint: disable=broad-exception-caught
+            except Exception as exc_info:
+                Logging.print_to_log(
+                    f"Worker '{self._name}' encountered an error in a "
+                    + f"state-change callback: {exc_info}",
+                    Logging.LEVEL_ERROR,
+                )
+
     @staticmethod
     def _run_job_child(
         pipe: DilledConnection,
@@ -366,6 +417,7 @@ class Worker:
         )
         # * run
         self._process.start()
+        self._notify_state_change(WorkerState.BUSY)
 
         # process results sent via pipe
         child_pipe.close()
@@ -497,6 +549,7 @@ class Worker:
         self._process.join(timeout=0.1)
         if self._process.is_alive():
             self._process.kill()
+            self._process.join()
 
         # handle job exit
         if self._process_context.completed:
@@ -603,48 +656,104 @@ class Worker:
                     Logging.LEVEL_ERROR,
                 )
 
+    def _queue_pop(self, wait: float = 0) -> Optional[Lock]:
+        """
+        Requests a lock on a job from the controller (waits up to `wait`
+        seconds for new submissions). Returns `None` on error.
+
+        The argument `wait` is only passed on to the controller if
+        positive (controllers that do not support long-polling must not
+        be called with `wait > 0`).
+        """
+        try:
+            if wait > 0:
+                return self.controller.queue_pop(self._name, wait=wait)
+            return self.controller.queue_pop(self._name)
+        except ValueError as exc_info:
+            Logging.print_to_log(
+                f"Worker '{self._name}' failed to fetch current "
+                + f"queue from the controller: {exc_info}",
+                Logging.LEVEL_ERROR,
+            )
+        return None
+
+    def _wait_idle(
+        self, deadline: float, long_polling: bool
+    ) -> Optional[Lock]:
+        """
+        Waits for new submissions until `deadline` (timestamp) or a
+        stop-request. Long-polling is split into requests of at most
+        `long_polling_timeout` seconds so that stop-requests take effect
+        while waiting. Returns a `Lock` if a job has been received.
+        """
+        stop_on_idle = self._stop_context.stop_on_idle
+        while not stop_on_idle.is_set():
+            remaining = deadline - time()
+            if remaining <= 0:
+                break
+            if not long_polling:
+                stop_on_idle.wait(remaining)
+                break
+            slice_end = time() + min(remaining, self.long_polling_timeout)
+            lock = self._queue_pop(slice_end - time())
+            if lock is not None:
+                return lock
+            # sleep for the remainder of this slice in case the
+            # controller returned early (e.g., due to an error)
+            stop_on_idle.wait(max(0, slice_end - time()))
+        return None
+
     def _work_loop(self, interval: float) -> None:
         """Runs worker loop until stopped."""
+        # local references for the loop
+        stop = self._stop_context.stop
+        stop_on_idle = self._stop_context.stop_on_idle
+        queue_pop = self._queue_pop
+        long_polling = _accepts_wait(self.controller)
+        self._notify_state_change(WorkerState.IDLE)
+        lock = None
         try:
-            while not self._stop_context.stop.is_set():
+            while not stop.is_set():
                 now = time()
                 # reset state
                 self._process_context = None
                 self._abort_context.origin = None
                 self._abort_context.reason = None
 
-                # find and start job
-                try:
-                    lock = self.controller.queue_pop(self._name)
-                except ValueError as exc_info:
-                    Logging.print_to_log(
-                        f"Worker '{self._name}' failed to fetch current "
-                        + f"queue from the controller: {exc_info}",
-                        Logging.LEVEL_ERROR,
-                    )
+                # find and start job (unless already received while
+                # waiting in the previous iteration)
+                if lock is None:
+                    lock = queue_pop()
                 if lock is None:
                     # no work left
-                    if self._stop_context.stop_on_idle.is_set():
+                    if stop_on_idle.is_set():
                         # detect request for early exit
-                        self._stop_context.stop.set()
-                else:
-                    # run job
-                    Logging.print_to_log(
-                        f"Worker '{self._name}' starts working on job "
-                        + f"'{lock.token}'.",
-                        Logging.LEVEL_DEBUG,
-                    )
-                    self._run_job_host(lock)
-                    Logging.print_to_log(
-                        f"Worker '{self._name}' stops working on job "
-                        + f"'{lock.token}'.",
-                        Logging.LEVEL_DEBUG,
-                    )
-                    self.controller.release_lock(lock.id)
+                        stop.set()
+                        continue
+                    # wait for new submissions until next iteration
+                    lock = self._wait_idle(now + interval, long_polling)
+                    continue
 
-                self._stop_context.stop_on_idle.wait(
-                    max(0, interval - (time() - now))
+                # run job
+                Logging.print_to_log(
+                    f"Worker '{self._name}' starts working on job "
+                    + f"'{lock.token}'.",
+                    Logging.LEVEL_DEBUG,
                 )
+                self._run_job_host(lock)
+                Logging.print_to_log(
+                    f"Worker '{self._name}' stops working on job "
+                    + f"'{lock.token}'.",
+                    Logging.LEVEL_DEBUG,
+                )
+                self.controller.release_lock(lock.id)
+                lock = None
+                self._notify_state_change(WorkerState.IDLE)
+                # continue without waiting since more work is likely
+                # queued already
+            # return job that has been received after stop-request
+            if lock is not None:
+                self.controller.release_lock(lock.id)
         # pylint: disable=broad-exception-caught
         except Exception as exc_info:
             self._stop_context.stopped.set()
@@ -665,6 +774,7 @@ class Worker:
                 f"Worker '{self._name}' stopped.",
                 Logging.LEVEL_INFO,
             )
+        self._notify_state_change(WorkerState.STOPPED)
 
     def start(self, interval: float = 1, daemon: bool = False) -> None:
         """
@@ -672,7 +782,10 @@ class Worker:
         processed.
 
         Keyword arguments:
-        interval -- polling interval for jobs
+        interval -- polling interval for jobs; while idle, the worker
+                    waits up to this duration for new submissions at
+                    the controller (long-polling, if supported by the
+                    controller; see also `long_polling_timeout`)
                     (default 1)
         daemon -- whether to run as daemon (only relevant if not `block`)
                   (default False)
@@ -700,6 +813,18 @@ class Worker:
                 Logging.LEVEL_INFO,
             )
 
+    def _wait_stopped(self, timeout: Optional[float]) -> None:
+        """
+        Blocks until the worker has stopped and its thread has exited
+        or `timeout` (in seconds) has elapsed.
+        """
+        deadline = None if timeout is None else time() + timeout
+        self._stop_context.stopped.wait(timeout)
+        if self._thread is not None:
+            self._thread.join(
+                None if deadline is None else max(0, deadline - time())
+            )
+
     def stop(
         self, block: bool = False, timeout: Optional[float] = None
     ) -> None:
@@ -707,9 +832,7 @@ class Worker:
         self._stop_context.stop.set()
         self._stop_context.stop_on_idle.set()
         if block:
-            self._stop_context.stopped.wait(timeout)
-            while self._thread is not None and self._thread.is_alive():
-                sleep(0.01)
+            self._wait_stopped(timeout)
 
     def stop_on_idle(
         self, block: bool = False, timeout: Optional[float] = None
@@ -717,9 +840,7 @@ class Worker:
         """Stops the next time the queue is empty."""
         self._stop_context.stop_on_idle.set()
         if block:
-            self._stop_context.stopped.wait(timeout)
-            while self._thread is not None and self._thread.is_alive():
-                sleep(0.01)
+            self._wait_stopped(timeout)
 
     def kill(
         self,
@@ -744,6 +865,4 @@ class Worker:
             self._process.kill()
 
         if block:
-            self._stop_context.stopped.wait(timeout)
-            while self._thread is not None and self._thread.is_alive():
-                sleep(0.01)
+            self._wait_stopped(timeout)
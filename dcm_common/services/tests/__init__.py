@@ -6,6 +6,7 @@ from .fixtures import (
     wait_for_report,
     external_service,
     run_service,
+    run_service_module,
 )
 
 __all__ = [
@@ -16,4 +17,5 @@ __all__ = [
     "wait_for_report",
     "external_service",
     "run_service",
+    "run_service_module",
 ]
@@ -50,19 +50,34 @@ def fs_cleanup(request, file_storage):
 def wait_for_report():
     def _(client, token, interval: float = 0.25, max_sleep: int = 250):
         """Helper for report collection."""
-        max_sleep = 250
         c_sleep = 0
-        while c_sleep < max_sleep:
-            sleep(interval)
+        while True:
+            # check before sleeping to return finished reports right away
             response = client.get(f"/report?token={token}")
-            if response.status_code == 200:
+            if response.status_code == 200 or c_sleep >= max_sleep:
                 break
+            sleep(interval)
             c_sleep = c_sleep + 1
         return response.json
 
     return _
 
 
+def _external_service(
+    routes: list[tuple[str, Callable, list[str]]], app_config=None
+) -> Flask:
+    app = Flask(__name__)
+
+    if app_config:
+        app.config.from_object(app_config)
+
+    for route, view, methods in routes:
+        app.add_url_rule(
+            route, endpoint=str(uuid4()), view_func=view, methods=methods
+        )
+    return app
+
+
 @pytest.fixture(name="external_service")
 def external_service() -> Callable:
     """
@@ -74,40 +89,10 @@ def external_service() -> Callable:
      >>> print(requests.post("http://localhost:8082/index?arg=123").json())
     """
 
-    def _(
-        routes: list[tuple[str, Callable, list[str]]], app_config=None
-    ) -> Flask:
-        app = Flask(__name__)
-
-        if app_config:
-            app.config.from_object(app_config)
-
-        for route, view, methods in routes:
-            app.add_url_rule(
-                route, endpoint=str(uuid4()), view_func=view, methods=methods
-            )
-        return app
-
-    return _
-
-
-@pytest.fixture(name="run_service")
-def run_service(request, external_service) -> Callable:
-    """
-    Returns function that, if called, runs a flask-app in a separate
-    process. Before returning, it is ensured that the app is responsive.
+    return _external_service
 
-    It accepts either of the following
-    * from_factory: call a factory to get the app (this is relevant if,
-        for example, the factory executes other code that is needed to
-        be run within the process where the app itself is running)
-    * app: a pre-existing app
-    * routes: a list of required endpoints from which an app is built
-        dynamically; the resulting app is initialized with the
-        `app_config` argument
 
-    The sub-process lives only in pytest's 'function'-scope.
-    """
+def _run_service(request, external_service) -> Callable:
     PROBING_PATH = "fixture-is-running"
 
     def _(
@@ -129,12 +114,12 @@ def run_service(request, external_service) -> Callable:
             else:
                 _app = app or external_service(routes, app_config)
 
-            # disable werkzeug logging
+            # disable werkzeug/waitress logging
             # pylint: disable=import-outside-toplevel
             import logging
 
-            log = logging.getLogger("werkzeug")
-            log.setLevel(logging.ERROR)
+            logging.getLogger("werkzeug").setLevel(logging.ERROR)
+            logging.getLogger("waitress").setLevel(logging.ERROR)
 
             if generate_probing_path:
 
@@ -147,7 +132,13 @@ def run_service(request, external_service) -> Callable:
                     """Used to probe whether service has started up."""
                     return "OK", 200
 
-            _app.run(host="0.0.0.0", port=port, debug=False)
+            # use multi-threaded production server if available
+            try:
+                from waitress import serve
+            except ImportError:
+                _app.run(host="0.0.0.0", port=port, debug=False)
+            else:
+                serve(_app, host="0.0.0.0", port=port, threads=32)
 
         p = DilledProcess(target=run_process)
         p.start()
@@ -177,4 +168,37 @@ def run_service(request, external_service) -> Callable:
 
         return p
 
-    yield _
+    return _
+
+
+@pytest.fixture(name="run_service")
+def run_service(request, external_service) -> Callable:
+    """
+    Returns function that, if called, runs a flask-app in a separate
+    process. Before returning, it is ensured that the app is responsive.
+
+    It accepts either of the following
+    * from_factory: call a factory to get the app (this is relevant if,
+        for example, the factory executes other code that is needed to
+        be run within the process where the app itself is running)
+    * app: a pre-existing app
+    * routes: a list of required endpoints from which an app is built
+        dynamically; the resulting app is initialized with the
+        `app_config` argument
+
+    If the package `waitress` is installed, it is used to serve the app.
+    Otherwise, the flask development server is used.
+
+    The sub-process lives only in pytest's 'function'-scope.
+    """
+    yield _run_service(request, external_service)
+
+
+@pytest.fixture(name="run_service_module", scope="module")
+def run_service_module(request) -> Callable:
+    """
+    Same as `run_service` but the sub-process lives in pytest's
+    'module'-scope. This allows to share a service between multiple
+    tests of a module.
+    """
+    yield _run_service(request, _external_service)
@@ -0,0 +1,158 @@
+"""
+SQLite3-helpers shared by the sqlite-based components (orchestra-
+controller and key-value store).
+"""
+
+from typing import Optional, Any, Mapping, Iterator
+import sys
+from pathlib import Path
+import sqlite3
+
+
+if sys.version_info[0] != 3:
+    raise ImportError(f"Module '{__name__}' is only compatible with python 3.")
+
+
+class _Cursor(sqlite3.Cursor):
+    """
+    `sqlite3.Cursor` that tracks whether any (potentially) modifying
+    statement, i.e., anything other than a plain `SELECT`, has been
+    executed.
+    """
+
+    dirty = False
+
+    def execute(self, sql, parameters=(), /):
+        if not self.dirty and sql.lstrip()[:6].upper() != "SELECT":
+            self.dirty = True
+        return super().execute(sql, parameters)
+
+    def executemany(self, sql, seq_of_parameters, /):
+        self.dirty = True
+        return super().executemany(sql, seq_of_parameters)
+
+    def executescript(self, sql_script, /):
+        self.dirty = True
+        return super().executescript(sql_script)
+
+
+class Transaction:
+    """
+    Auxiliary definition for SQLite3-database transactions.
+
+    Keyword arguments:
+    conn -- database connection (e.g. via `get_connection`)
+    check -- if `True`, raise occuring errors, otherwise only track via
+             `success` and `exc_val`-properties
+             (default False)
+    autoclose -- automatically close connection after use
+                 (default True)
+    write -- if `True`, acquire the database's write-lock when starting
+             the transaction (`BEGIN IMMEDIATE`) instead of on the first
+             write; this avoids failing lock-upgrades with concurrent
+             writers (only python<3.12; with `autocommit=False`,
+             transactions are always opened implicitly as deferred)
+             (default False)
+    """
+
+    def __init__(
+        self,
+        conn: sqlite3.Connection,
+        check: bool = True,
+        autoclose: bool = True,
+        write: bool = False,
+    ) -> None:
+        self.connection = conn
+        self._autoclose = autoclose
+        self._check = check
+        self._write = write
+        self.cursor: Optional[sqlite3.Cursor] = None
+        self.data: Optional[list[Any]] = None
+        self.success: Optional[bool] = None
+        self.exc_val: Optional[Exception] = None
+
+    @staticmethod
+    def get_connection(
+        path: str | Path,
+        pragmas: Optional[Mapping[str, Any]] = None,
+        **kwargs,
+    ) -> sqlite3.Connection:
+        """
+        Returns `sqlite3.Connection` for multiple threads.
+
+        Keyword arguments:
+        path -- database path or uri
+        pragmas -- additional PRAGMAs that are set after the defaults
+                   (can be used to override defaults)
+                   (default None)
+        """
+        if sys.version_info[1] >= 12:
+            conn = sqlite3.connect(path, autocommit=True, **kwargs)
+        else:
+            conn = sqlite3.connect(path, isolation_level=None, **kwargs)
+        # PRAGMA only works in autocommit-mode..
+        conn.execute("PRAGMA foreign_keys = 1")
+        conn.execute("PRAGMA journal_mode = WAL")
+        # safe in WAL-mode; avoids fsync on every commit
+        conn.execute("PRAGMA synchronous = NORMAL")
+        for key, value in (pragmas or {}).items():
+            conn.execute(f"PRAGMA {key} = {value}")
+        if sys.version_info[1] >= 12:
+            conn.autocommit = False
+        return conn
+
+    def check(self) -> None:
+        """
+        Raises exception from `self.exc_value` if not `self.success.
+        """
+        if self.success:
+            return
+        raise self.exc_val or ValueError("Unknown error occurred.")
+
+    def iter_data(self, size: int = 256) -> Iterator[Any]:
+        """
+        Returns iterator over the rows of the current result which are
+        fetched in chunks of `size` (only usable inside the context).
+        """
+        while rows := self.cursor.fetchmany(size):
+            yield from rows
+
+    def __enter__(self):
+        self.cursor = self.connection.cursor(_Cursor)
+        if sys.version_info[1] < 12:
+            self.connection.execute(
+                "BEGIN IMMEDIATE" if self._write else "BEGIN"
+            )
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.success = exc_type is None
+
+        if self.success:
+            self.data = self.cursor.fetchall()
+            # read-only transactions do not need to be committed
+            if self.connection.in_transaction and not self.cursor.dirty:
+                self.connection.rollback()
+            elif self.connection.in_transaction:
+                try:
+                    self.connection.commit()
+                except sqlite3.Error as exc_info:
+                    # do not leave (reused) connection in open transaction
+                    self.connection.rollback()
+                    self.success = False
+                    self.exc_val = exc_info
+        else:
+            self.exc_val = exc_val
+            if self.connection.in_transaction:
+                self.connection.rollback()
+
+        self.cursor.close()
+        if self._autoclose:
+            self.connection.close()
+
+        if self._check and not self.success:
+            if exc_type is None:
+                # failed commit; there is no exception to propagate
+                raise self.exc_val
+            return False
+        return True
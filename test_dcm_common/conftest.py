@@ -1,5 +1,13 @@
 """ Configure the tests """
 
+import os
+
+# child processes of orchestra-workers are created via a fork-server
+# with preloaded modules unless configured otherwise (significantly
+# faster than 'spawn'; must be set before importing dcm_common.orchestra)
+os.environ.setdefault("ORCHESTRA_MP_METHOD", "forkserver")
+
+# pylint: disable=wrong-import-position
 from pathlib import Path
 from shutil import rmtree
 
@@ -11,20 +19,26 @@ TESTING_DIR = Path("test_dcm_common/tmp")
 BAGIT_PROFILE_TEST = Path("test_dcm_common/fixtures/test_profile.json")
 
 
-def pytest_sessionstart():
+def pytest_sessionstart(session):
     """
     Create the temporary directory to store the test results
     before running the tests.
     """
+    if hasattr(session.config, "workerinput"):
+        # pytest-xdist-worker: directory is managed by controller
+        return
     if TESTING_DIR.is_dir():
         rmtree(TESTING_DIR)
     TESTING_DIR.mkdir(exist_ok=True)
 
 
-def pytest_sessionfinish():
+def pytest_sessionfinish(session):
     """
     Remove the temporary directory after whole test run finished.
     """
+    if hasattr(session.config, "workerinput"):
+        # pytest-xdist-worker: directory is managed by controller
+        return
     if TESTING_DIR.is_dir():
         rmtree(TESTING_DIR)
 
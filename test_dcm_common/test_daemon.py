@@ -9,6 +9,10 @@ import pytest
 from dcm_common import CDaemon, FDaemon
 
 
+# upper limit for waiting on events (only reached if a test fails)
+EVENT_TIMEOUT = 10
+
+
 def test_cdaemon_constructor():
     """Test constructor of class `CDaemon`."""
     CDaemon(target=lambda: None)
@@ -31,9 +35,11 @@ def test_cdaemon_run_minimal():
     """
     result = {"data": 0}
     interval = 0.01
+    started = Event()
 
     def _service():
         result["data"] += 1
+        started.set()
         while True:
             sleep(interval)
 
@@ -44,7 +50,7 @@ def test_cdaemon_run_minimal():
     d.run(interval, False, True)
     assert d.active
     assert d.status
-    sleep(2 * interval)
+    assert started.wait(EVENT_TIMEOUT)
     assert result["data"] == 1
     d.stop(True)
 
@@ -57,25 +63,24 @@ def test_cdaemon_run_restart():
     result = {"data": 0}
     interval = 0.01
     stop = Event()
-    stopped = Event()
+    started = Event()
 
     def _service():
         result["data"] += 1
         stop.clear()
-        while not stop.is_set():
-            sleep(interval)
-        stopped.set()
+        started.set()
+        stop.wait()
 
     d = CDaemon(target=_service, daemon=True)
     d.run(interval, False, True)
-    sleep(2 * interval)
+    assert started.wait(EVENT_TIMEOUT)
     assert result["data"] == 1
+    started.clear()
     stop.set()
-    while not stopped.is_set():
-        pass
-    sleep(2 * interval)
+    assert started.wait(EVENT_TIMEOUT)
     assert result["data"] == 2
     d.stop(True)
+    stop.set()
 
 
 def test_cdaemon_run_reconfigure():
@@ -83,26 +88,25 @@ def test_cdaemon_run_reconfigure():
     result = {"data": 0}
     interval = 0.01
     stop = Event()
-    stopped = Event()
+    started = Event()
 
     def _service(increment):
         result["data"] += increment
         stop.clear()
-        while not stop.is_set():
-            sleep(interval)
-        stopped.set()
+        started.set()
+        stop.wait()
 
     d = CDaemon(target=_service, daemon=True, kwargs={"increment": 1})
     d.run(interval, False, True)
-    sleep(2 * interval)
+    assert started.wait(EVENT_TIMEOUT)
     assert result["data"] == 1
     d.reconfigure(kwargs={"increment": 2})
+    started.clear()
     stop.set()
-    while not stopped.is_set():
-        pass
-    sleep(2 * interval)
+    assert started.wait(EVENT_TIMEOUT)
     assert result["data"] == 3
     d.stop(True)
+    stop.set()
 
 
 def test_cdaemon_run_unrecoverable_error():
@@ -121,7 +125,8 @@ def test_cdaemon_run_unrecoverable_error():
         side_effect=_broken_restart_service,
     ):
         d.run(interval, False, False)
-    sleep(interval)
+    # pylint: disable=protected-access
+    d._daemon.join(EVENT_TIMEOUT)
     assert not d.active
 
 
@@ -151,10 +156,12 @@ def test_fdaemon_minimal():
     """
     result = {"data": 0}
     interval = 0.01
+    started = Event()
 
     def _factory():
         def _service():
             result["data"] += 1
+            started.set()
             while True:
                 sleep(interval)
 
@@ -162,7 +169,7 @@ def test_fdaemon_minimal():
 
     d = FDaemon(_factory)
     d.run(interval, block=True)
-    sleep(2 * interval)
+    assert started.wait(EVENT_TIMEOUT)
     assert result["data"] == 1
     d.stop(True)
 
@@ -172,30 +179,29 @@ def test_fdaemon_reconfigure():
     result = {"data": 0}
     interval = 0.01
     stop = Event()
-    stopped = Event()
+    started = Event()
 
     def _factory(increment):
         def _service():
             stop.clear()
             result["data"] += increment
-            while not stop.is_set():
-                sleep(interval)
-            stopped.set()
+            started.set()
+            stop.wait()
 
         return Thread(target=_service, daemon=True)
 
     d = FDaemon(_factory, kwargs={"increment": 1})
     d.run(interval, block=True)
-    sleep(2 * interval)
+    assert started.wait(EVENT_TIMEOUT)
     assert result["data"] == 1
 
     d.reconfigure(increment=2)
+    started.clear()
     stop.set()
-    while not stopped.is_set():
-        pass
-    sleep(2 * interval)
+    assert started.wait(EVENT_TIMEOUT)
     assert result["data"] == 3
     d.stop(True)
+    stop.set()
 
 
 @pytest.mark.parametrize("block", [True, False], ids=["block", "no-block"])
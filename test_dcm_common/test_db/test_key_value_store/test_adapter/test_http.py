@@ -3,6 +3,7 @@ Test module for the class `HTTPKeyValueStoreAdapter` of the
 `db`-subpackage.
 """
 
+import os
 import pytest
 
 from dcm_common.services.tests.fixtures import run_service, external_service
@@ -16,7 +17,8 @@ from dcm_common.db import (
 
 @pytest.fixture(name="db_port")
 def _db_port():
-    return 8080
+    # use individual ports for pytest-xdist-workers
+    return 8080 + int(os.environ.get("PYTEST_XDIST_WORKER", "gw0")[2:])
 
 
 @pytest.fixture(name="db")
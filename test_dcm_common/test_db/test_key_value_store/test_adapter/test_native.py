@@ -137,9 +137,9 @@ def test_concurrency(adapter):
 
     assert all(t.is_alive() for t in threads)
 
-    time0 = time()
-    while any(t.is_alive() for t in threads) and time() - time0 < 2:
-        sleep(0.01)
+    deadline = time() + 2
+    for t in threads:
+        t.join(max(0, deadline - time()))
 
     assert all(not t.is_alive() for t in threads)
     if adapter == NativeKeyValueStoreAdapter:
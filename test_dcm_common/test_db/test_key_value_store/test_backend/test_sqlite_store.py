@@ -6,6 +6,7 @@ from uuid import uuid4
 import threading
 
 import pytest
+import dill
 
 from dcm_common.orchestra import DilledProcess
 from dcm_common.db import KeyValueStore, SQLiteStore
@@ -145,3 +146,24 @@ def test_concurrency_multiprocessing(temporary_directory):
         process.join()
 
     assert len(store.keys()) == n_records
+
+
+def test_connection_reuse(temporary_directory):
+    """Test reuse of per-thread connections in `SQLiteStore`."""
+    store = SQLiteStore(temporary_directory / str(uuid4()))
+
+    # same thread
+    assert store.transaction().connection is store.transaction().connection
+
+    # different thread
+    connections = []
+    thread = threading.Thread(
+        target=lambda: connections.append(store.transaction().connection)
+    )
+    thread.start()
+    thread.join()
+    assert connections[0] is not store.transaction().connection
+
+    # pickling
+    store.write("key", "value")
+    assert dill.loads(dill.dumps(store)).read("key") == "value"
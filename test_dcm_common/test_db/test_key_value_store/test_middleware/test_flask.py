@@ -3,9 +3,9 @@ Test module for the flask-middleware implementation for shared key-value
 store usage.
 """
 
+import os
 from uuid import uuid4
 import threading
-from time import sleep
 
 import pytest
 import requests
@@ -18,6 +18,10 @@ from dcm_common.db import (
 from dcm_common.services.tests.fixtures import run_service, external_service
 
 
+# use individual ports for pytest-xdist-workers
+PORT = 8080 + int(os.environ.get("PYTEST_XDIST_WORKER", "gw0")[2:])
+
+
 @pytest.fixture(name="db_dir")
 def _db_dir(temporary_directory):
     return temporary_directory / "db"
@@ -30,18 +34,18 @@ def _db(db_dir):
 
 def test_db_post(db: JSONFileStore, run_service):
     """Test /db/<key>-POST endpoint."""
-    run_service(key_value_store_app_factory(db, "test-db"), port=8080)
+    run_service(key_value_store_app_factory(db, "test-db"), port=PORT)
     assert db.read("key1") is None
-    requests.post("http://localhost:8080/db/key1", json="value1", timeout=1)
+    requests.post(f"http://localhost:{PORT}/db/key1", json="value1", timeout=1)
     assert db.read("key1") == "value1"
 
 
 def test_db_push(db: JSONFileStore, run_service):
     """Test /db-POST endpoint."""
-    run_service(key_value_store_app_factory(db, "test-db"), port=8080)
+    run_service(key_value_store_app_factory(db, "test-db"), port=PORT)
     assert len(db.keys()) == 0
     key = requests.post(
-        "http://localhost:8080/db", json="value1", timeout=1
+        f"http://localhost:{PORT}/db", json="value1", timeout=1
     ).text
     assert key
     assert db.read(key) == "value1"
@@ -50,16 +54,16 @@ def test_db_push(db: JSONFileStore, run_service):
 @pytest.mark.parametrize("pop", ["", "?pop="], ids=["no-pop", "pop"])
 def test_db_get_key(pop, db: JSONFileStore, run_service):
     """Test /db/<key>-GET endpoint."""
-    run_service(key_value_store_app_factory(db, "test-db"), port=8080)
+    run_service(key_value_store_app_factory(db, "test-db"), port=PORT)
     assert db.read("key1") is None
     # empty db
-    response = requests.get("http://localhost:8080/db/key1", timeout=1)
+    response = requests.get(f"http://localhost:{PORT}/db/key1", timeout=1)
     assert response.status_code == 404
     # single record
-    requests.post("http://localhost:8080/db/key1", json="value1", timeout=1)
-    response = requests.get(f"http://localhost:8080/db/key1{pop}", timeout=1)
+    requests.post(f"http://localhost:{PORT}/db/key1", json="value1", timeout=1)
+    response = requests.get(f"http://localhost:{PORT}/db/key1{pop}", timeout=1)
     assert response.json() == "value1"
-    response = requests.get("http://localhost:8080/db/key1", timeout=1)
+    response = requests.get(f"http://localhost:{PORT}/db/key1", timeout=1)
     if pop:
         assert response.status_code == 404
     else:
@@ -69,17 +73,17 @@ def test_db_get_key(pop, db: JSONFileStore, run_service):
 @pytest.mark.parametrize("pop", ["", "?pop="], ids=["no-pop", "pop"])
 def test_db_get(pop, db: JSONFileStore, run_service):
     """Test /db-GET endpoint."""
-    run_service(key_value_store_app_factory(db, "test-db"), port=8080)
+    run_service(key_value_store_app_factory(db, "test-db"), port=PORT)
     assert db.read("key1") is None
     # empty db
-    response = requests.get("http://localhost:8080/db", timeout=1)
+    response = requests.get(f"http://localhost:{PORT}/db", timeout=1)
     assert response.status_code == 404
     # single record
-    requests.post("http://localhost:8080/db/key1", json="value1", timeout=1)
-    response = requests.get(f"http://localhost:8080/db{pop}", timeout=1)
+    requests.post(f"http://localhost:{PORT}/db/key1", json="value1", timeout=1)
+    response = requests.get(f"http://localhost:{PORT}/db{pop}", timeout=1)
     assert response.json()["key"] == "key1"
     assert response.json()["value"] == "value1"
-    response = requests.get("http://localhost:8080/db/key1", timeout=1)
+    response = requests.get(f"http://localhost:{PORT}/db/key1", timeout=1)
     if pop:
         assert response.status_code == 404
     else:
@@ -88,41 +92,41 @@ def test_db_get(pop, db: JSONFileStore, run_service):
 
 def test_db_options(db: JSONFileStore, run_service):
     """Test /db-OPTIONS endpoint."""
-    run_service(key_value_store_app_factory(db, "test-db"), port=8080)
+    run_service(key_value_store_app_factory(db, "test-db"), port=PORT)
     assert len(db.keys()) == 0
     # empty db
-    response = requests.options("http://localhost:8080/db", timeout=1)
+    response = requests.options(f"http://localhost:{PORT}/db", timeout=1)
     assert response.json() == []
     # single record
-    requests.post("http://localhost:8080/db/key1", json="value1", timeout=1)
-    response = requests.options("http://localhost:8080/db", timeout=1)
+    requests.post(f"http://localhost:{PORT}/db/key1", json="value1", timeout=1)
+    response = requests.options(f"http://localhost:{PORT}/db", timeout=1)
     assert response.json() == ["key1"]
-    requests.post("http://localhost:8080/db/key2", json="value2", timeout=1)
-    response = requests.options("http://localhost:8080/db", timeout=1)
+    requests.post(f"http://localhost:{PORT}/db/key2", json="value2", timeout=1)
+    response = requests.options(f"http://localhost:{PORT}/db", timeout=1)
     assert sorted(response.json()) == sorted(["key1", "key2"])
 
 
 def test_db_delete(db: JSONFileStore, run_service):
     """Test /db/<key>-DELETE endpoint."""
-    run_service(key_value_store_app_factory(db, "test-db"), port=8080)
+    run_service(key_value_store_app_factory(db, "test-db"), port=PORT)
     assert db.read("key1") is None
     # empty db
-    response = requests.delete("http://localhost:8080/db/key1", timeout=1)
+    response = requests.delete(f"http://localhost:{PORT}/db/key1", timeout=1)
     assert response.status_code == 200
     # first add then delete single record
-    requests.post("http://localhost:8080/db/key1", json="value1", timeout=1)
-    response = requests.get("http://localhost:8080/db/key1", timeout=1)
+    requests.post(f"http://localhost:{PORT}/db/key1", json="value1", timeout=1)
+    response = requests.get(f"http://localhost:{PORT}/db/key1", timeout=1)
     assert response.json() == "value1"
-    response = requests.delete("http://localhost:8080/db/key1", timeout=1)
+    response = requests.delete(f"http://localhost:{PORT}/db/key1", timeout=1)
     assert response.status_code == 200
-    response = requests.get("http://localhost:8080/db/key1", timeout=1)
+    response = requests.get(f"http://localhost:{PORT}/db/key1", timeout=1)
     assert response.status_code == 404
 
 
 def test_config(db: JSONFileStore, run_service):
     """Test /config-GET endpoint."""
-    run_service(key_value_store_app_factory(db, "test-db"), port=8080)
-    json = requests.get("http://localhost:8080/config", timeout=1).json()
+    run_service(key_value_store_app_factory(db, "test-db"), port=PORT)
+    json = requests.get(f"http://localhost:{PORT}/config", timeout=1).json()
     assert json["cors"] is False
     assert json["database"]["backend"] == db.__class__.__name__
     assert json["database"]["dir"] == str(db.dir.resolve())
@@ -130,8 +134,8 @@ def test_config(db: JSONFileStore, run_service):
 
 def test_api(db: JSONFileStore, run_service):
     """Test /api-GET endpoint."""
-    run_service(key_value_store_app_factory(db, "test-db"), port=8080)
-    response = requests.get("http://localhost:8080/api", timeout=1)
+    run_service(key_value_store_app_factory(db, "test-db"), port=PORT)
+    response = requests.get(f"http://localhost:{PORT}/api", timeout=1)
     assert response.headers["content-type"] == "application/yaml"
     assert "LZV.nrw - KeyValueStore-API" in response.text
 
@@ -139,7 +143,7 @@ def test_api(db: JSONFileStore, run_service):
 def test_high_load(run_service):
     """Test handling of concurrent requests."""
     run_service(
-        key_value_store_app_factory(MemoryStore(), "test-db"), port=8080
+        key_value_store_app_factory(MemoryStore(), "test-db"), port=PORT
     )
     nthreads = 100
     nmessages = 10
@@ -149,7 +153,9 @@ def test_high_load(run_service):
             for task in range(n):
                 token = f"{index}.{task}"
                 requests.post(
-                    f"http://localhost:8080/db/{token}", json=token, timeout=1
+                    f"http://localhost:{PORT}/db/{token}",
+                    json=token,
+                    timeout=1,
                 )
 
         return _
@@ -161,7 +167,7 @@ def test_high_load(run_service):
             exit_counter = 0
             while True:
                 response = requests.get(
-                    "http://localhost:8080/db?pop=", timeout=1
+                    f"http://localhost:{PORT}/db?pop=", timeout=1
                 )
                 if response.status_code == 404:
                     exit_counter += 1
@@ -186,8 +192,8 @@ def test_high_load(run_service):
         p.run()
         c.run()
 
-    while any(t.is_alive() for t in producers + consumers):
-        sleep(0.01)
-
-    assert requests.options("http://localhost:8080/db", timeout=1).json() == []
+    assert (
+        requests.options(f"http://localhost:{PORT}/db", timeout=1).json()
+        == []
+    )
     assert len(set(consumed.keys())) == nthreads * nmessages
@@ -205,10 +205,8 @@ def test_connection_pool_concurrent_use_threads():
     t2.start()
 
     time0 = time()
-    while (time() - time0) < 2 * base_duration * n and (
-        t1.is_alive() or t2.is_alive()
-    ):
-        sleep(0.01)
+    for t in (t1, t2):
+        t.join(max(0, time0 + 2 * base_duration * n - time()))
 
     assert (time() - time0) < 2 * base_duration * n, "timeout, try again"
 
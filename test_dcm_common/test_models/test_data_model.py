@@ -1006,6 +1006,29 @@ def test_json_from_json_handlers_inheritance_dataclass():
     assert Model(p=1).json == {"p": 2}
 
 
+def test_from_json_type_hint_cache():
+    """
+    Test caching of type hints in method `from_json` of class
+    `DataModel` for inheriting models.
+    """
+
+    @dataclass
+    class Model(DataModel):
+        p: str
+
+    @dataclass
+    class ChildModel(Model):
+        q: JSONObject
+
+    assert Model.from_json({"p": "a", "q": {}}) == Model("a")
+    assert ChildModel.from_json({"p": "a", "q": {"b": 0}}) == ChildModel(
+        "a", {"b": 0}
+    )
+    assert Model._get_type_hints() is Model._get_type_hints()
+    assert "q" not in Model._get_type_hints()[0]
+    assert ChildModel._get_type_hints()[1] == {"q"}
+
+
 @dataclass
 class _Model(DataModel):
     p: Optional[str] = None
@@ -0,0 +1,88 @@
+"""Shared fixtures for the controller-tests."""
+
+from typing import Callable, Iterable
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+import dill
+
+from dcm_common.orchestra import DilledProcess, DilledPipe, DillIgnore
+
+
+PROCESS_POOL_SIZE = 10
+THREAD_POOL_SIZE = 4
+
+
+@pytest.fixture(name="thread_pool", scope="session")
+def _thread_pool():
+    """
+    Returns a `ThreadPoolExecutor` for running background tasks in
+    tests (threads are reused across the session).
+    """
+    with ThreadPoolExecutor(max_workers=THREAD_POOL_SIZE) as executor:
+        yield executor
+
+
+@pytest.fixture(name="process_pool", scope="session")
+def _process_pool():
+    """
+    Returns a callable that runs a target concurrently in a pool of
+    persistent processes (one call per set of args).
+
+    The processes are only spawned once per session. Use as
+     >>> process_pool(target, [(0,), (1,), ...])
+    """
+
+    # defined locally to have dill pickle the function by value
+    # (conftest-modules cannot be imported by name in the child process)
+    def _process_pool_worker(conn) -> None:
+        """Runs tasks received via `conn` until `None` is received."""
+        while (task := conn.recv()) is not None:
+            target, args = task
+            try:
+                dill.loads(target)(*args)
+            # pylint: disable=broad-exception-caught
+            except Exception as exc_info:
+                conn.send(exc_info)
+            else:
+                conn.send(None)
+
+    pipes = [DilledPipe() for _ in range(PROCESS_POOL_SIZE)]
+    processes = [
+        DilledProcess(
+            target=_process_pool_worker,
+            args=(DillIgnore(pipe.child),),
+            daemon=True,
+        )
+        for pipe in pipes
+    ]
+    for p in processes:
+        p.start()
+
+    def run(
+        target: Callable, args: Iterable[tuple], timeout: float = 60
+    ) -> None:
+        args = list(args)
+        if len(args) > PROCESS_POOL_SIZE:
+            raise ValueError(
+                f"Process pool supports at most {PROCESS_POOL_SIZE} "
+                + f"concurrent calls (got {len(args)})."
+            )
+        # pickle target only once and send as-is
+        target = dill.dumps(target)
+        for pipe, args_ in zip(pipes, args):
+            pipe.parent.send(DillIgnore((target, args_)))
+        for pipe, _ in zip(pipes, args):
+            if not pipe.parent.poll(timeout):
+                raise TimeoutError("Process pool did not finish in time.")
+            if (exc_info := pipe.parent.recv()) is not None:
+                raise exc_info
+
+    yield run
+
+    for pipe in pipes:
+        pipe.parent.send(None)
+    for p in processes:
+        p.join(1)
+        if p.is_alive():
+            p.kill()
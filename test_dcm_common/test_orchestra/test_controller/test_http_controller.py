@@ -1,44 +1,83 @@
 """Tests for the `HTTPController`-class."""
 
+import os
 from datetime import datetime, timedelta
 import threading
-from time import sleep
-import json
+from concurrent.futures import ThreadPoolExecutor
+from time import sleep, time
 
 import pytest
 import requests
-from flask import Flask
-
-from dcm_common.services.tests import run_service
-from dcm_common.orchestra import (
-    HTTPController,
-    get_http_controller_bp,
-    DilledProcess,
-)
+import dill
+from flask import Flask, request
+
+from dcm_common.services.tests import run_service, run_service_module
+from dcm_common.orchestra import HTTPController, get_http_controller_bp
 from dcm_common.orchestra.models import JobConfig, JobInfo
 from dcm_common.services.config import OrchestratedAppConfig
 
 
+# use individual ports for pytest-xdist-workers
+PORT = 8080 + int(os.environ.get("PYTEST_XDIST_WORKER", "gw0")[2:])
+
+
 def get_http_controller_app():
     """Returns flask app with http-controller-API."""
     config = OrchestratedAppConfig()
     app = Flask("test-http-controller")
     app.register_blueprint(get_http_controller_bp(config.controller))
+    default_lock_ttl = config.controller.lock_ttl
+
+    @app.route("/reset", methods=["POST"])
+    def reset():
+        """Clears the controller's database and resets settings."""
+        with config.controller.transaction() as t:
+            t.cursor.execute("DELETE FROM registry")
+        config.controller.lock_ttl = default_lock_ttl
+        return "OK", 200
+
+    @app.route("/lock-ttl", methods=["PUT"])
+    def set_lock_ttl():
+        """Changes the controller's lock_ttl-setting."""
+        config.controller.lock_ttl = request.json
+        return "OK", 200
 
     return app
 
 
+@pytest.fixture(name="controller_url", scope="module")
+def _controller_url(run_service_module):
+    """
+    Runs http-controller-API (shared by the tests of this module) and
+    returns its url.
+    """
+    run_service_module(from_factory=get_http_controller_app, port=PORT)
+    return f"http://localhost:{PORT}"
+
+
+@pytest.fixture(name="controller")
+def _controller(controller_url):
+    """Returns `HTTPController` for the shared API with empty database."""
+    requests.post(f"{controller_url}/reset", timeout=1).raise_for_status()
+    return HTTPController(controller_url)
+
+
 def Info():  # pylint: disable=invalid-name
     """Minimal `JobInfo`."""
     return JobInfo(JobConfig("test", {}, {}))
 
 
+# serialized minimal `JobInfo` for tests with many submissions (the API
+# deserializes into `JobInfo` either way)
+INFO_JSON = Info().json
+
+
 def test_queue(run_service):
     """Test queue-related methods of `HTTPController`."""
 
-    p = run_service(from_factory=get_http_controller_app, port=8080)
+    p = run_service(from_factory=get_http_controller_app, port=PORT + 100)
 
-    c = HTTPController("http://localhost:8080")
+    c = HTTPController(f"http://localhost:{PORT + 100}")
 
     # basic submission
     token = c.queue_push("0", Info())
@@ -71,30 +110,77 @@ def test_queue(run_service):
         c.queue_push("2", Info())
 
 
-def test_refresh_lock(run_service):
+def test_queue_pop_wait(controller, thread_pool):
+    """Test long-polling in method `HTTPController.queue_pop`."""
+
+    c = controller
+
+    # empty queue
+    t0 = time()
+    assert c.queue_pop("test", wait=0.25) is None
+    assert time() - t0 >= 0.25
+
+    # submission while waiting
+    def push():
+        sleep(0.25)
+        c.queue_push("0", Info())
+
+    future = thread_pool.submit(push)
+    t0 = time()
+    lock = c.queue_pop("test", wait=5)
+    assert lock is not None
+    assert lock.token == "0"
+    assert time() - t0 < 5
+    future.result(timeout=5)
+
+
+def test_session_reuse(controller, thread_pool):
+    """Test reuse of per-thread sessions in `HTTPController`."""
+
+    c = controller
+
+    # same thread
+    c.queue_push("0", Info())
+    # pylint: disable=protected-access
+    session = c._session
+    assert c.get_status("0") == "queued"
+    assert c._session is session
+
+    # different thread
+    assert thread_pool.submit(lambda: c._session).result() is not session
+
+    # close
+    c.close()
+    assert c._session is not session
+    assert c.get_status("0") == "queued"
+
+    # pickling
+    c2 = dill.loads(dill.dumps(c))
+    assert c2.get_status("0") == "queued"
+
+
+def test_refresh_lock(controller):
     """Test method `HTTPController.refresh_lock`."""
 
-    run_service(from_factory=get_http_controller_app, port=8080)
-    c = HTTPController("http://localhost:8080")
+    c = controller
 
     c.queue_push("0", Info())
 
     # get lock
     lock0 = c.queue_pop("some-name")
 
-    # wait
-    sleep(1)
-
-    # refresh and check
+    # increase ttl (instead of waiting) then refresh and check
+    requests.put(
+        f"{c.base_url}/lock-ttl", json=3600, timeout=1
+    ).raise_for_status()
     lock1 = c.refresh_lock(lock0.id)
     assert lock1.expires_at > lock0.expires_at
 
 
-def test_release_lock(run_service):
+def test_release_lock(controller):
     """Test method `HTTPController.release_lock`."""
 
-    run_service(from_factory=get_http_controller_app, port=8080)
-    c = HTTPController("http://localhost:8080")
+    c = controller
 
     c.queue_push("0", Info())
 
@@ -106,14 +192,13 @@ def test_release_lock(run_service):
         c.refresh_lock(lock.id)
 
 
-def test_registry_push_get_x(run_service):
+def test_registry_push_get_x(controller):
     """
     Test methods `HTTPController.registry_push` and
     `HTTPController.get_...`.
     """
 
-    run_service(from_factory=get_http_controller_app, port=8080)
-    c = HTTPController("http://localhost:8080")
+    c = controller
 
     token = c.queue_push("0", Info())
     token_ = c.get_token(token.value)
@@ -138,16 +223,34 @@ def test_registry_push_get_x(run_service):
     assert c.get_status(token.value) == "running"
 
 
-def test_threading_concurrency(run_service):
+def test_finish_lock(controller):
+    """Test method `HTTPController.finish_lock`."""
+
+    c = controller
+
+    token = c.queue_push("0", Info())
+    lock = c.queue_pop("some-name")
+
+    c.finish_lock(lock.id, status="completed", info=Info().json)
+    assert c.get_status(token.value) == "completed"
+    assert c.get_info(token.value) == Info().json
+
+    # lock already released
+    with pytest.raises(ValueError):
+        c.refresh_lock(lock.id)
+    with pytest.raises(ValueError):
+        c.finish_lock(lock.id, status="aborted")
+
+
+def test_threading_concurrency(controller):
     """Test behavior of `HTTPController` with concurrent access."""
 
-    run_service(from_factory=get_http_controller_app, port=8080)
-    c = HTTPController("http://localhost:8080")
+    c = controller
 
     interval = 0.0001
     n_jobs = 200
     n_workers = 10
-    all_jobs_posted = False
+    all_jobs_posted = threading.Event()
     worker_logs = {
         # mapping of worker id and jobs ids
         i: []
@@ -155,87 +258,66 @@ def test_threading_concurrency(run_service):
     }
 
     def post():
-        nonlocal all_jobs_posted
         for i in range(n_jobs):
-            c.queue_push(str(i), Info())
+            c.queue_push(str(i), INFO_JSON)
             sleep(interval)
             if i % 10 == 0:
                 print(".", end="", flush=True)
         print("")
-        all_jobs_posted = True
+        all_jobs_posted.set()
 
     def work(worker_id: int):
-        nonlocal all_jobs_posted
         sleep(worker_id * interval / n_workers)
         while True:
-            lock = c.queue_pop(str(worker_id))
+            # check before popping to not miss jobs posted in between
+            posted = all_jobs_posted.is_set()
+            lock = c.queue_pop(str(worker_id), wait=0.05)
             if lock is None:
-                if all_jobs_posted:
+                if posted:
                     break
                 continue
 
             worker_logs[worker_id].append(lock.token)
             sleep(interval / 10)
-            c.registry_push(
+            c.finish_lock(
                 lock.id, status="completed", info={"worker": worker_id}
             )
-            c.release_lock(lock.id)
 
-    api = threading.Thread(target=post, daemon=True)
-
-    workers = []
-    for i in range(n_workers):
-        workers.append(threading.Thread(target=work, args=(i,), daemon=True))
-    for worker in workers:
-        worker.start()
-    api.start()
-
-    api.join()
-    for worker in workers:
-        worker.join(60)
+    with ThreadPoolExecutor(max_workers=n_workers + 1) as executor:
+        workers = [executor.submit(work, i) for i in range(n_workers)]
+        executor.submit(post).result()
+        for worker in workers:
+            worker.result(timeout=60)
 
     data = []
     for i in range(n_jobs):
-        data.append(
-            (str(i), c.get_status(str(i)), json.dumps(c.get_info(str(i))))
-        )
+        data.append((str(i), c.get_status(str(i)), c.get_info(str(i))))
 
     print(
         "worker: ",
-        " | ".join(
-            map(
-                lambda id: f"#{str(id)}   ",
-                worker_logs.keys(),
-            )
-        ),
+        " | ".join(f"#{str(id)}   " for id in worker_logs),
     )
     print(
         " stats: ",
         " | ".join(
-            map(
-                lambda log: f"{(str(len(log)*100/n_jobs) + ' ')[:4]}%",
-                worker_logs.values(),
-            )
+            "%4.1f%%" % (len(log) * 100 / n_jobs)
+            for log in worker_logs.values()
         ),
     )
 
-    assert len(list(filter(lambda item: item[1] == "queued", data))) == 0
-    assert sum(map(len, worker_logs.values())) == n_jobs
+    assert not any(status == "queued" for _, status, _ in data)
+    assert sum(len(log) for log in worker_logs.values()) == n_jobs
 
+    results = {token: (status, info) for token, status, info in data}
     for worker_id, log in worker_logs.items():
         for token in log:
-            assert (
-                token,
-                "completed",
-                json.dumps({"worker": worker_id}),
-            ) in data
+            assert results[token] == ("completed", {"worker": worker_id})
 
 
-def test_multiprocessing_concurrency(run_service):
+def test_multiprocessing_concurrency(controller, process_pool):
     """Test behavior of `HTTPController` with concurrent access."""
 
-    run_service(from_factory=get_http_controller_app, port=8080)
-    c = HTTPController("http://localhost:8080")
+    c = controller
 
     interval = 0.0001
     n_jobs = 200
@@ -243,7 +325,7 @@ def test_multiprocessing_concurrency(run_service):
 
     def post():
         for i in range(n_jobs):
-            c.queue_push(str(i), Info())
+            c.queue_push(str(i), INFO_JSON)
             sleep(interval)
             if i % 10 == 0:
                 print(".", end="", flush=True)
@@ -251,79 +333,56 @@ def test_multiprocessing_concurrency(run_service):
 
     def work(worker_id: int):
         sleep(worker_id * interval / n_workers)
-        c = HTTPController("http://localhost:8080", timeout=10)
+        c = HTTPController(f"http://localhost:{PORT}", timeout=10)
         while True:
             lock = c.queue_pop(str(worker_id))
             if lock is None:
                 break
 
             sleep(interval / 10)
-            c.registry_push(
+            c.finish_lock(
                 lock.id, status="completed", info={"worker": worker_id}
             )
-            c.release_lock(lock.id)
 
     post()
 
-    workers = []
-    for i in range(n_workers):
-        workers.append(DilledProcess(target=work, args=(i,), daemon=True))
-    for worker in workers:
-        worker.start()
-
-    for worker in workers:
-        worker.join(60)
+    process_pool(work, [(i,) for i in range(n_workers)])
 
     data = []
     for i in range(n_jobs):
         data.append((str(i), c.get_status(str(i)), c.get_info(str(i))))
 
-    worker_logs = {}
-    for i in range(n_workers):
-        worker_logs[i] = list(
-            map(
-                lambda d: d[0],
-                filter(lambda d, i=i: d[2].get("worker") == i, data),
-            )
-        )
+    worker_logs = {i: [] for i in range(n_workers)}
+    for token, _, info in data:
+        if "worker" in info:
+            worker_logs[info["worker"]].append(token)
 
     print(
         "worker: ",
-        " | ".join(
-            map(
-                lambda id: f"#{str(id)}   ",
-                worker_logs.keys(),
-            )
-        ),
+        " | ".join(f"#{str(id)}   " for id in worker_logs),
     )
     print(
         " stats: ",
         " | ".join(
-            map(
-                lambda log: f"{(str(len(log)*100/n_jobs) + ' ')[:4]}%",
-                worker_logs.values(),
-            )
+            "%4.1f%%" % (len(log) * 100 / n_jobs)
+            for log in worker_logs.values()
         ),
     )
 
     assert len(data) == n_jobs
-    assert len(list(filter(lambda item: item[1] == "queued", data))) == 0
-    assert sum(map(len, worker_logs.values())) == n_jobs
+    assert not any(status == "queued" for _, status, _ in data)
+    assert sum(len(log) for log in worker_logs.values()) == n_jobs
 
+    results = {token: (status, info) for token, status, info in data}
     for worker_id, log in worker_logs.items():
         for token in log:
-            assert (
-                token,
-                "completed",
-                {"worker": worker_id},
-            ) in data
+            assert results[token] == ("completed", {"worker": worker_id})
 
 
-def test_message_push(run_service):
+def test_message_push(controller):
     """Test method `HTTPController.message_push`."""
 
-    run_service(from_factory=get_http_controller_app, port=8080)
-    c = HTTPController("http://localhost:8080")
+    c = controller
 
     # basic submission
     token = c.queue_push("0", Info())
@@ -343,11 +402,10 @@ def test_message_push(run_service):
         c.message_push(token.value, "some-instruction", "test", "reason")
 
 
-def test_message_get(run_service):
+def test_message_get(controller):
     """Test method `HTTPController.message_get`."""
 
-    run_service(from_factory=get_http_controller_app, port=8080)
-    c = HTTPController("http://localhost:8080")
+    c = controller
 
     # basic submission
     token = c.queue_push("0", Info())
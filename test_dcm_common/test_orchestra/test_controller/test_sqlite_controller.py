@@ -3,96 +3,18 @@
 from datetime import datetime, timedelta
 import sqlite3
 import threading
-from time import sleep
+from concurrent.futures import ThreadPoolExecutor
+from time import sleep, time
 import json
 from uuid import uuid4
 
 import pytest
+import dill
 
 from dcm_common import LoggingContext
-from dcm_common.orchestra.controller.sqlite import (
-    SQLiteController,
-    Transaction,
-)
-from dcm_common.orchestra import JobConfig, JobInfo, DilledProcess
-
-
-def test_transaction():
-    """Test basic functionality of `Transaction`-context manager."""
-    c = Transaction.get_connection(
-        "file:test?mode=memory&cache=shared", uri=True
-    )
-    with Transaction(c) as t:
-        t.cursor.execute(
-            """CREATE TABLE registry (
-                token TEXT NOT NULL PRIMARY KEY
-            )"""
-        )
-        t.cursor.execute("SELECT * FROM registry")
-        t.cursor.execute("INSERT INTO registry VALUES ('0')")
-        t.cursor.execute("SELECT * FROM registry")
-
-    assert t.success
-    assert t.exc_val is None
-    assert len(t.data) == 1
-    assert t.data[0] == ("0",)
-
-
-def test_transaction_error():
-    """Test `Transaction`-context manager error behavior."""
-    # check off
-    c = Transaction.get_connection(
-        "file:test?mode=memory&cache=shared", uri=True
-    )
-
-    with Transaction(c, False, autoclose=False) as t:
-        t.cursor.execute("CREATE TABLE a (id TEXT)")
-        t.cursor.execute("INSERT INTO a VALUES ('a', 'b')")
-
-    assert not t.success
-    assert isinstance(t.exc_val, sqlite3.OperationalError)
-    with pytest.raises(sqlite3.OperationalError):
-        t.check()
-
-    # no table exists
-    with Transaction(c, False, autoclose=False) as t:
-        t.cursor.execute("SELECT name FROM sqlite_master WHERE type='table'")
-    assert t.data == []
-
-    # the following tests for issues regarding transaction-control
-    # actually create table
-    with Transaction(c, False, autoclose=False) as t:
-        t.cursor.execute("CREATE TABLE a (id TEXT)")
-    with Transaction(c, False, autoclose=False) as t:
-        t.cursor.execute("SELECT name FROM sqlite_master WHERE type='table'")
-    assert t.data == [("a",)]
-    with Transaction(c, False, autoclose=False) as t:
-        t.cursor.execute("DROP TABLE a")
-    with Transaction(c, False, autoclose=False) as t:
-        t.cursor.execute("SELECT name FROM sqlite_master WHERE type='table'")
-    assert t.data == []
-
-    # repeat with check on
-    with pytest.raises(sqlite3.OperationalError), Transaction(
-        c, True, autoclose=False
-    ) as t:
-        t.cursor.execute("CREATE TABLE a (id TEXT)")
-        t.cursor.execute("INSERT INTO a VALUES ('a', 'b')")
-
-    with pytest.raises(sqlite3.OperationalError):
-        t.check()
-
-    # ok
-    with Transaction(c, autoclose=False) as t:
-        t.cursor.execute("CREATE TABLE a (id TEXT)")
-        t.cursor.execute("INSERT INTO a VALUES ('id')")
-
-    assert t.success
-    assert t.check() is None
-
-    with Transaction(c, False, autoclose=False) as t:
-        t.cursor.execute("SELECT * FROM a")
-    assert t.data == [("id",)]
+from dcm_common.sqlite import Transaction
+from dcm_common.orchestra.controller.sqlite import SQLiteController
+from dcm_common.orchestra import JobConfig, JobInfo, Report
 
 
 def Info():  # pylint: disable=invalid-name
@@ -117,6 +39,15 @@ def test_constructor(temporary_directory):
     assert ("locks",) in t.data
     assert ("messages",) in t.data
 
+    with Transaction(c.db) as t:
+        t.cursor.execute("SELECT name FROM sqlite_master WHERE type='index'")
+    assert ("registry_status",) in t.data
+    assert ("registry_expires_at",) in t.data
+    assert ("locks_expires_at",) in t.data
+    assert ("messages_token",) in t.data
+    assert ("messages_received_at",) in t.data
+    assert ("messages_expires_at",) in t.data
+
     # another in-memory
     c = SQLiteController()
     with Transaction(c.db) as t:
@@ -149,6 +80,78 @@ def test_constructor(temporary_directory):
     with Transaction(c.db) as t:
         t.cursor.execute("SELECT name FROM sqlite_master WHERE type='table'")
     assert len(t.data) == 3
+    with Transaction(c.db) as t:
+        t.cursor.execute("PRAGMA journal_mode")
+        assert t.cursor.fetchone() == ("wal",)
+        t.cursor.execute("PRAGMA synchronous")
+    assert t.data[0][0] == 1  # NORMAL
+    with c.transaction() as t:
+        t.cursor.execute("PRAGMA cache_size")
+        assert t.cursor.fetchone() == (-65536,)
+        t.cursor.execute("PRAGMA temp_store")
+        assert t.cursor.fetchone() == (2,)  # MEMORY
+        t.cursor.execute("PRAGMA mmap_size")
+    assert t.data[0][0] == 268435456
+
+
+def test_constructor_pragmas(temporary_directory):
+    """Test `SQLiteController` constructor-argument `pragmas`."""
+
+    # disk: extends and overrides defaults
+    c = SQLiteController(
+        temporary_directory / str(uuid4()),
+        pragmas={"cache_size": -20000, "synchronous": "FULL"},
+    )
+    with c.transaction() as t:
+        t.cursor.execute("PRAGMA cache_size")
+        assert t.cursor.fetchone() == (-20000,)
+        t.cursor.execute("PRAGMA synchronous")
+        assert t.cursor.fetchone() == (2,)  # FULL
+        t.cursor.execute("PRAGMA temp_store")
+        assert t.cursor.fetchone() == (2,)  # MEMORY
+        t.cursor.execute("PRAGMA journal_mode")
+    assert t.data[0][0] == "wal"
+
+    # in-memory
+    c = SQLiteController(pragmas={"temp_store": "MEMORY"})
+    with c.transaction() as t:
+        t.cursor.execute("PRAGMA temp_store")
+    assert t.data[0][0] == 2  # MEMORY
+
+
+def test_connection_reuse(temporary_directory):
+    """Test reuse of per-thread connections in `SQLiteController`."""
+
+    c = SQLiteController(temporary_directory / str(uuid4()))
+
+    # same thread
+    assert c.transaction().connection is c.transaction().connection
+
+    # different thread
+    connections = []
+    thread = threading.Thread(
+        target=lambda: connections.append(c.transaction().connection)
+    )
+    thread.start()
+    thread.join()
+    assert connections[0] is not c.transaction().connection
+
+    # close
+    connection = c.transaction().connection
+    c.close()
+    assert c.transaction().connection is not connection
+
+    # failed transactions do not break the connection
+    with c.transaction(False) as t:
+        t.cursor.execute("INSERT INTO unknown_table VALUES (0)")
+    assert not t.success
+    assert not c.transaction().connection.in_transaction
+    c.queue_push("0", Info())
+    assert c.get_status("0") == "queued"
+
+    # pickling
+    c2 = dill.loads(dill.dumps(c))
+    assert c2.get_status("0") == "queued"
 
 
 def test_queue_push():
@@ -177,6 +180,111 @@ def test_queue_push():
     assert len(t.data) == 2
 
 
+def test_queue_push_many():
+    """Test method `SQLiteController.queue_push_many`."""
+
+    c = SQLiteController()
+
+    # basic submission
+    tokens = c.queue_push_many([(str(i), Info()) for i in range(3)])
+    assert [token.value for token in tokens] == ["0", "1", "2"]
+    assert all(token.expires for token in tokens)
+    with Transaction(c.db) as t:
+        t.cursor.execute("SELECT token, status FROM registry")
+    assert sorted(t.data) == [
+        ("0", "queued"),
+        ("1", "queued"),
+        ("2", "queued"),
+    ]
+    assert c.get_info("1")["token"] == tokens[1].json
+
+    # mixed with resubmission
+    tokens2 = c.queue_push_many([("1", Info()), ("3", Info())])
+    assert tokens2[0].json == tokens[1].json
+    assert tokens2[1].value == "3"
+    with Transaction(c.db) as t:
+        t.cursor.execute("SELECT * FROM registry")
+    assert len(t.data) == 4
+
+    # resubmission with different body
+    info = Info()
+    info.config.original_body = {"different": "body"}
+    with pytest.raises(ValueError):
+        c.queue_push_many([("0", info), ("4", Info())])
+    assert c.get_status("4") == "queued"
+
+
+def test_info_storage():
+    """Test storage format of info in `SQLiteController`-registry."""
+
+    c = SQLiteController()
+    c.queue_push("0", Info())
+
+    with Transaction(c.db) as t:
+        t.cursor.execute(
+            "SELECT type FROM pragma_table_info('registry') "
+            + "WHERE name = 'info'"
+        )
+    assert t.data == [("BLOB",)]
+
+    with Transaction(c.db) as t:
+        t.cursor.execute("SELECT typeof(info) FROM registry")
+    assert t.data == [("blob",)]
+
+    # compatible with records stored as text
+    with Transaction(c.db) as t:
+        t.cursor.execute(
+            "UPDATE registry SET info = ? WHERE token = '0'",
+            (json.dumps(Info().json),),
+        )
+        t.cursor.execute("SELECT typeof(info) FROM registry")
+    assert t.data == [("text",)]
+    assert c.get_info("0") == Info().json
+
+
+def test_info_storage_legacy_schema(temporary_directory):
+    """
+    Test reading info from a database with schema version 1 (info
+    declared as TEXT) with TEXT- and BLOB-records.
+    """
+
+    # create database with legacy schema
+    with Transaction(SQLiteController().db) as t:
+        t.cursor.execute("SELECT sql FROM sqlite_master WHERE type = 'table'")
+    schema = [sql.replace("info BLOB", "info TEXT") for (sql,) in t.data]
+    path = temporary_directory / str(uuid4())
+    with Transaction(Transaction.get_connection(path)) as t:
+        t.cursor.execute("PRAGMA user_version = 1")
+        for sql in schema:
+            t.cursor.execute(sql)
+        t.cursor.execute(
+            "INSERT INTO registry VALUES ('0', 'queued', ?, NULL)",
+            (json.dumps(Info().json),),
+        )
+
+    c = SQLiteController(path)
+    c.queue_push("1", Info())
+
+    with Transaction(c.db) as t:
+        t.cursor.execute(
+            "SELECT type FROM pragma_table_info('registry') "
+            + "WHERE name = 'info'"
+        )
+    assert t.data == [("TEXT",)]
+
+    with Transaction(c.db) as t:
+        t.cursor.execute(
+            "SELECT token, typeof(info) FROM registry ORDER BY token"
+        )
+    assert t.data == [("0", "text"), ("1", "blob")]
+
+    assert c.get_info("0") == Info().json
+    assert c.get_info("1")["config"] == Info().json["config"]
+    records = c.get_all(["0", "1"])
+    assert records["0"] == ("queued", Info().json)
+    assert records["1"][1]["config"] == Info().json["config"]
+
+
 def test_queue_push_info_token():
     """
     Test behavior of method `SQLiteController.queue_push` when actual
@@ -197,6 +305,32 @@ def test_queue_push_info_token():
     assert original_info.metadata.produced is None
 
 
+@pytest.mark.parametrize(
+    "report",
+    [Report(host="test"), {"host": "test"}],
+    ids=["model", "json"],
+)
+def test_queue_push_info_report_token(report):
+    """
+    Test behavior of method `SQLiteController.queue_push` when actual
+    JobInfo with report is provided (update to report-token).
+    """
+
+    c = SQLiteController()
+
+    original_info = JobInfo(JobConfig("test", {}, {}), report=report)
+    token = c.queue_push("0", original_info)
+
+    info = c.get_info(token.value)
+    assert info["report"]["host"] == "test"
+    assert info["report"]["token"] == token.json
+
+    # does not affect original
+    assert "token" not in (
+        report if isinstance(report, dict) else report.json
+    )
+
+
 def test_queue_push_expiration():
     """Test method `SQLiteController.queue_push` with expiration."""
 
@@ -263,6 +397,48 @@ def test_queue_pop():
     assert lock3.token in ["0", "1"]
 
 
+def test_queue_pop_without_returning(monkeypatch):
+    """
+    Test method `SQLiteController.queue_pop` for SQLite-versions without
+    support for the RETURNING-clause.
+    """
+    monkeypatch.setattr(
+        "dcm_common.orchestra.controller.sqlite._SQLITE_RETURNING", False
+    )
+
+    c = SQLiteController()
+    token = c.queue_push("0", Info())
+
+    lock = c.queue_pop("some-name")
+    assert lock is not None
+    assert lock.token == token.value
+    assert c.queue_pop("some-name") is None
+
+
+def test_queue_pop_wait(thread_pool):
+    """Test waiting in method `SQLiteController.queue_pop`."""
+
+    c = SQLiteController()
+
+    # empty queue
+    t0 = time()
+    assert c.queue_pop("test", wait=0.25) is None
+    assert time() - t0 >= 0.25
+
+    # submission while waiting
+    def push():
+        sleep(0.25)
+        c.queue_push("0", Info())
+
+    future = thread_pool.submit(push)
+    t0 = time()
+    lock = c.queue_pop("test", wait=5)
+    assert lock is not None
+    assert lock.token == "0"
+    assert time() - t0 < 5
+    future.result(timeout=5)
+
+
 def test_refresh_lock():
     """Test method `SQLiteController.refresh_lock`."""
 
@@ -323,6 +499,27 @@ def test_lock_expiration_due_to_token_expiration():
         c.refresh_lock(lock.id)
 
 
+def test_get_all():
+    """Test method `SQLiteController.get_all`."""
+
+    c = SQLiteController()
+    assert c.get_all() == {}
+
+    for i in range(3):
+        c.queue_push(str(i), {"value": i})
+
+    assert c.get_all() == {
+        "0": ("queued", {"value": 0}),
+        "1": ("queued", {"value": 1}),
+        "2": ("queued", {"value": 2}),
+    }
+    assert c.get_all(["1", "2", "unknown"]) == {
+        "1": ("queued", {"value": 1}),
+        "2": ("queued", {"value": 2}),
+    }
+    assert c.get_all([]) == {}
+
+
 def test_registry_push_get_x():
     """
     Test methods `SQLiteController.registry_push` and
@@ -353,6 +550,26 @@ def test_registry_push_get_x():
     assert c.get_status(token.value) == "running"
 
 
+def test_finish_lock():
+    """Test method `SQLiteController.finish_lock`."""
+
+    c = SQLiteController()
+    token = c.queue_push("0", Info())
+    lock = c.queue_pop("some-name")
+
+    c.finish_lock(lock.id, status="completed", info=Info().json)
+    assert c.get_status(token.value) == "completed"
+    assert c.get_info(token.value) == Info().json
+    with Transaction(c.db) as t:
+        t.cursor.execute("SELECT * FROM locks WHERE id = ?", (lock.id,))
+    assert len(t.data) == 0
+
+    # lock already released
+    with pytest.raises(ValueError):
+        c.finish_lock(lock.id, status="aborted")
+    assert c.get_status(token.value) == "completed"
+
+
 def test_cleanup():
     """Test method `SQLiteController.cleanup`."""
 
@@ -462,7 +679,7 @@ def test_threading_concurrency(path, temporary_directory):
     interval = 0.0001
     n_jobs = 200
     n_workers = 10
-    all_jobs_posted = False
+    all_jobs_posted = threading.Event()
     worker_logs = {
         # mapping of worker id and jobs ids
         i: []
@@ -470,81 +687,61 @@ def test_threading_concurrency(path, temporary_directory):
     }
 
     def post():
-        nonlocal all_jobs_posted
-        for i in range(n_jobs):
-            c.queue_push(str(i), {})
-            sleep(interval)
-            if i % 10 == 0:
-                print(".", end="", flush=True)
+        # submit in batches of ten
+        for i in range(0, n_jobs, 10):
+            c.queue_push_many((str(j), {}) for j in range(i, i + 10))
+            sleep(10 * interval)
+            print(".", end="", flush=True)
         print("")
-        all_jobs_posted = True
+        all_jobs_posted.set()
 
     def work(worker_id: int):
-        nonlocal all_jobs_posted
         sleep(worker_id * interval / n_workers)
         while True:
-            lock = c.queue_pop(str(worker_id))
+            # check before popping to not miss jobs posted in between
+            posted = all_jobs_posted.is_set()
+            lock = c.queue_pop(str(worker_id), wait=0.05)
             if lock is None:
-                if all_jobs_posted:
+                if posted:
                     break
                 continue
 
             worker_logs[worker_id].append(lock.token)
             sleep(interval / 10)
-            c.registry_push(
+            c.finish_lock(
                 lock.id, status="completed", info={"worker": worker_id}
             )
-            c.release_lock(lock.id)
-
-    api = threading.Thread(target=post, daemon=True)
-
-    workers = []
-    for i in range(n_workers):
-        workers.append(threading.Thread(target=work, args=(i,), daemon=True))
-    for worker in workers:
-        worker.start()
-    api.start()
 
-    api.join()
-    for worker in workers:
-        worker.join(60)
+    with ThreadPoolExecutor(max_workers=n_workers + 1) as executor:
+        workers = [executor.submit(work, i) for i in range(n_workers)]
+        executor.submit(post).result()
+        for worker in workers:
+            worker.result(timeout=60)
 
-    with Transaction(c.db) as t:
-        t.cursor.execute("SELECT token, status, info FROM registry")
+    results = c.get_all()
 
     print(
         "worker: ",
-        " | ".join(
-            map(
-                lambda id: f"#{str(id)}   ",
-                worker_logs.keys(),
-            )
-        ),
+        " | ".join(f"#{str(id)}   " for id in worker_logs),
     )
     print(
         " stats: ",
         " | ".join(
-            map(
-                lambda log: f"{(str(len(log)*100/n_jobs) + ' ')[:4]}%",
-                worker_logs.values(),
-            )
+            "%4.1f%%" % (len(log) * 100 / n_jobs)
+            for log in worker_logs.values()
         ),
     )
 
-    assert len(t.data) == n_jobs
-    assert len(list(filter(lambda item: item[1] == "queued", t.data))) == 0
-    assert sum(map(len, worker_logs.values())) == n_jobs
+    assert len(results) == n_jobs
+    assert not any(status == "queued" for status, _ in results.values())
+    assert sum(len(log) for log in worker_logs.values()) == n_jobs
 
     for worker_id, log in worker_logs.items():
         for token in log:
-            assert (
-                token,
-                "completed",
-                json.dumps({"worker": worker_id}),
-            ) in t.data
+            assert results[token] == ("completed", {"worker": worker_id})
 
 
-def test_multiprocessing_concurrency(temporary_directory):
+def test_multiprocessing_concurrency(temporary_directory, process_pool):
     """
     Test behavior of `SQLiteController` with concurrent access via
     multiprocessing (filesystem).
@@ -558,12 +755,7 @@ def test_multiprocessing_concurrency(temporary_directory):
     n_workers = 10
 
     def post():
-        for i in range(n_jobs):
-            c.queue_push(str(i), Info())
-            sleep(interval)
-            if i % 10 == 0:
-                print(".", end="", flush=True)
-        print("")
+        c.queue_push_many((str(i), Info()) for i in range(n_jobs))
 
     def work(worker_id: int):
         sleep(worker_id * interval / n_workers)
@@ -574,65 +766,40 @@ def test_multiprocessing_concurrency(temporary_directory):
                 break
 
             sleep(interval / 10)
-            c.registry_push(
+            c.finish_lock(
                 lock.id, status="completed", info={"worker": worker_id}
             )
-            c.release_lock(lock.id)
 
     post()
 
-    workers = []
-    for i in range(n_workers):
-        workers.append(DilledProcess(target=work, args=(i,), daemon=True))
-    for worker in workers:
-        worker.start()
-
-    for worker in workers:
-        worker.join(60)
-
-    data = []
-    for i in range(n_jobs):
-        data.append((str(i), c.get_status(str(i)), c.get_info(str(i))))
-
-    worker_logs = {}
-    for i in range(n_workers):
-        worker_logs[i] = list(
-            map(
-                lambda d: d[0],
-                filter(lambda d, i=i: d[2].get("worker") == i, data),
-            )
-        )
+    process_pool(work, [(i,) for i in range(n_workers)])
+
+    results = c.get_all(str(i) for i in range(n_jobs))
+
+    worker_logs = {i: [] for i in range(n_workers)}
+    for token, (_, info) in results.items():
+        if "worker" in info:
+            worker_logs[info["worker"]].append(token)
 
     print(
         "worker: ",
-        " | ".join(
-            map(
-                lambda id: f"#{str(id)}   ",
-                worker_logs.keys(),
-            )
-        ),
+        " | ".join(f"#{str(id)}   " for id in worker_logs),
     )
     print(
         " stats: ",
         " | ".join(
-            map(
-                lambda log: f"{(str(len(log)*100/n_jobs) + ' ')[:4]}%",
-                worker_logs.values(),
-            )
+            "%4.1f%%" % (len(log) * 100 / n_jobs)
+            for log in worker_logs.values()
         ),
     )
 
-    assert len(data) == n_jobs
-    assert len(list(filter(lambda item: item[1] == "queued", data))) == 0
-    assert sum(map(len, worker_logs.values())) == n_jobs
+    assert len(results) == n_jobs
+    assert not any(status == "queued" for status, _ in results.values())
+    assert sum(len(log) for log in worker_logs.values()) == n_jobs
 
     for worker_id, log in worker_logs.items():
         for token in log:
-            assert (
-                token,
-                "completed",
-                {"worker": worker_id},
-            ) in data
+            assert results[token] == ("completed", {"worker": worker_id})
 
 
 def test_message_push():
@@ -5,6 +5,9 @@ from uuid import uuid4
 from dataclasses import dataclass
 from multiprocessing import Process, Pipe
 import sqlite3
+import threading
+import io
+import pickle
 
 import pytest
 import dill
@@ -15,6 +18,7 @@ from dcm_common.orchestra import (
     DilledPipe,
     dillignore,
 )
+from dcm_common.orchestra.dilled import _Pickler, _dumps
 
 
 def test_dilled_process_w_locals(temporary_directory: Path):
@@ -113,6 +117,69 @@ def test_dilled_pipe(temporary_directory: Path):
         pipe_parent.send(file1)
 
 
+def test_dilled_pipe_dillignore():
+    """Test sending `DillIgnore`-wrapped values via `DilledPipe`."""
+
+    pipe_parent, pipe_child = DilledPipe()
+    pipe_parent.send(DillIgnore("a"))
+    pipe_parent.send("b")
+
+    assert pipe_child.recv() == "a"
+    assert pipe_child.recv() == "b"
+    assert not pipe_child.poll(0.01)
+
+
+@pytest.mark.parametrize(
+    "use_cloudpickle",
+    [True, False],
+    ids=["cloudpickle", "dill"],
+)
+def test_dilled_pipe_pickler(use_cloudpickle, monkeypatch):
+    """
+    Test sending values via `DilledPipe` with and without `cloudpickle`.
+    """
+    if use_cloudpickle:
+        pytest.importorskip("cloudpickle")
+    else:
+        monkeypatch.setattr("dcm_common.orchestra.dilled.cloudpickle", None)
+
+    pipe_parent, pipe_child = DilledPipe()
+
+    # supported by pickle
+    pipe_parent.send(DillIgnore)
+    assert pipe_child.recv() is DillIgnore
+    pipe_parent.send({"a": [DillIgnore(0)]})
+    assert pipe_child.recv() == {"a": [DillIgnore(0)]}
+
+    # local function
+    x = 1
+    pipe_parent.send(lambda y: x + y)
+    assert pipe_child.recv()(1) == 2
+
+    # not supported by cloudpickle (dill as fallback)
+    lock = threading.Lock()
+    pipe_parent.send(lock)
+    assert not pipe_child.recv().locked()
+
+
+def test_dumps_main():
+    """
+    Test that `_dumps` does not pickle objects defined in `__main__` by
+    reference.
+    """
+
+    def f():
+        pass
+
+    f.__module__ = "__main__"
+    f.__qualname__ = "f"
+
+    with pytest.raises(pickle.PicklingError):
+        _Pickler(io.BytesIO()).dump(f)
+
+    assert dill.loads(_dumps(f)) is not f
+
+
 def test_dillignore_decorator():
     """
     Test decorator `dillignore`. Uses sqlite3-connection as unpicklable
@@ -3,6 +3,8 @@
 from datetime import datetime
 import pickle
 
+import pytest
+
 from dcm_common.models.data_model import get_model_serialization_test
 from dcm_common.orchestra.models import (
     JobConfig,
@@ -89,3 +91,68 @@ def test_job_info_json():
     info_from_json.report = Report.from_json(info_from_json.report)
 
     assert pickle.dumps(info) == pickle.dumps(info_from_json)
+
+
+@pytest.mark.parametrize(
+    "json",
+    [
+        {"config": {"type": "a", "original_body": {}, "request_body": {}}},
+        JobInfo(
+            JobConfig("a", {"b": 0}, {"c": 1}, {"d": 2}),
+            Token("b", True, datetime.now()),
+            JobMetadata(MetadataRecord("c"), MetadataRecord("d", None)),
+            {"host": "e"},
+        ).json,
+        {
+            "config": {"type": "a", "original_body": {}, "request_body": {}},
+            "token": None,
+            "metadata": None,
+            "report": None,
+        },
+        {
+            "config": {"type": "a", "original_body": {}, "request_body": {}},
+            "metadata": {"produced": {"by": "b"}, "consumed": None},
+        },
+    ],
+    ids=["minimal", "full", "null", "partial-metadata"],
+)
+def test_job_info_from_json(json):
+    """
+    Test explicit implementation of `JobInfo.from_json` against generic
+    `DataModel`-deserialization.
+    """
+    info = JobInfo.from_json(json)
+    generic = super(JobInfo, JobInfo).from_json(json)
+    info_json, generic_json = info.json, generic.json
+    # default-timestamps of MetadataRecords may differ
+    for key in ("produced", "consumed", "aborted", "completed"):
+        if (info_json.get("metadata") or {}).get(key) is not None:
+            info_json["metadata"][key].pop("datetime", None)
+            generic_json["metadata"][key].pop("datetime", None)
+    assert info_json == generic_json
+
+
+@pytest.mark.parametrize(
+    ("model", "json"),
+    [
+        (JobInfo, {"config": "a"}),
+        (JobInfo, {"config": {"type": "a"}, "token": "b"}),
+        (JobMetadata, {"produced": "a"}),
+        (MetadataRecord, {"by": 0, "datetime": "b"}),
+    ],
+)
+def test_job_info_from_json_malformed(model, json):
+    """
+    Test fallback to generic `DataModel`-deserialization for malformed
+    input in explicit `from_json`-implementations.
+    """
+
+    def outcome(from_json):
+        try:
+            return pickle.dumps(from_json(json))
+        except (ValueError, TypeError) as exc_info:
+            return type(exc_info)
+
+    assert outcome(model.from_json) == outcome(
+        super(model, model).from_json
+    )
@@ -1,5 +1,7 @@
 """Tests for the `Report`- and related data models."""
 
+import pytest
+
 from dcm_common import Logger
 from dcm_common.models.data_model import get_model_serialization_test
 from dcm_common.orchestra.models import Token, Status, Progress, Report
@@ -30,6 +32,20 @@ def test_progress_helpers():
     assert progress.status is Status.ABORTED
 
 
+@pytest.mark.parametrize(
+    "json",
+    [[1], "a"],
+    ids=["list", "str"],
+)
+def test_progress_from_json_malformed(json):
+    """
+    Test fallback to generic `DataModel`-deserialization for malformed
+    input in `Progress.from_json`.
+    """
+    with pytest.raises(ValueError, match="'Progress'"):
+        Progress.from_json(json)
+
+
 test_report_json = get_model_serialization_test(
     Report,
     (
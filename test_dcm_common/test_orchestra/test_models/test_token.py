@@ -2,6 +2,8 @@
 
 from datetime import datetime
 
+import pytest
+
 from dcm_common.models.data_model import get_model_serialization_test
 from dcm_common.orchestra.models import Token
 
@@ -13,3 +15,38 @@ test_token_json = get_model_serialization_test(
         (("a", True, datetime.now()), {}),
     ),
 )
+
+
+def test_token_from_json_expires_at():
+    """Test parsing of `expires_at` in method `Token.from_json`."""
+
+    t0 = datetime.now().replace(microsecond=0)
+    t1 = t0.replace(year=t0.year + 1)
+    for expires_at in (t0, t0, t1, t0):
+        token = Token.from_json(
+            {
+                "value": "a",
+                "expires": True,
+                "expires_at": expires_at.isoformat(),
+            }
+        )
+        assert token.expires_at == expires_at
+
+
+def test_token_slots():
+    """Test that `Token` uses `__slots__` (no instance-dictionary)."""
+    assert not hasattr(Token("a"), "__dict__")
+
+
+@pytest.mark.parametrize(
+    "json",
+    [{"expires": True}, "a", [1]],
+    ids=["missing-value", "str", "list"],
+)
+def test_token_from_json_malformed(json):
+    """
+    Test fallback to generic `DataModel`-deserialization for malformed
+    input in `Token.from_json`.
+    """
+    with pytest.raises((ValueError, TypeError), match="'Token'"):
+        Token.from_json(json)
@@ -3,7 +3,6 @@
 from typing import Optional
 from dataclasses import dataclass
 from time import sleep
-from random import randrange
 
 import pytest
 
@@ -87,16 +86,15 @@ def test_concurrency():
 
     # setup jobs
     n_jobs = 100
-    tokens = []
-    for i in range(n_jobs):
-        tokens.append(
-            pool.controller.queue_push(
-                str(i),
-                JobInfo(
-                    JobConfig("test", {}, {"sleep": 0.01 * randrange(25, 100)})
-                ),
-            )
+    tokens = pool.controller.queue_push_many(
+        (
+            str(i),
+            JobInfo(
+                JobConfig("test", {}, {"sleep": [0.05, 0.1, 0.15, 0.2][i % 4]})
+            ),
         )
+        for i in range(n_jobs)
+    )
 
     # run (w auto-init)
     pool.start(interval=0.01, daemon=True)
@@ -109,15 +107,18 @@ def test_concurrency():
     # and restarted
     pool.start(interval=0.01, daemon=True)
 
-    pool.stop_on_idle(block=True, timeout=1)
+    pool.stop_on_idle(block=True, timeout=60)
+    for worker in pool.workers.values():
+        assert worker.state is WorkerState.STOPPED
 
     # check queue
     assert pool.controller.queue_pop("") is None
 
     stats = {}
     # eval results
+    records = pool.controller.get_all(token.value for token in tokens)
     for token in tokens:
-        info = JobInfo.from_json(pool.controller.get_info(token.value))
+        info = JobInfo.from_json(records[token.value][1])
         info.report = ReportWithData.from_json(info.report)
         # job is completed
         assert LoggingContext.INFO in info.report.log
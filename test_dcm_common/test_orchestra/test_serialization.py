@@ -0,0 +1,73 @@
+"""Tests for the `orchestra.serialization`-module."""
+
+from datetime import datetime
+import math
+from dataclasses import dataclass
+
+import pytest
+
+from dcm_common.orchestra import serialization
+
+
+@pytest.fixture(name="backend", params=["orjson", "json"])
+def _backend(request, monkeypatch):
+    """Runs test with and without `orjson`."""
+    if request.param == "orjson":
+        pytest.importorskip("orjson")
+    else:
+        monkeypatch.setattr(serialization, "orjson", None)
+    return request.param
+
+
+@dataclass
+class SomeDataclass:
+    a: int = 0
+
+
+class SomeDict(dict):
+    pass
+
+
+@pytest.mark.parametrize(
+    "obj",
+    [
+        {"a": [0, 1.5, "b", None, True]},
+        {1: "a"},
+        SomeDict(a=0),
+        {"a": None, "b": {"c": [None, 0.0]}},
+    ],
+    ids=["plain", "non-str-keys", "subclass", "null"],
+)
+def test_round_trip(backend, obj):
+    """Test round-trip of `dumps` and `loads`."""
+    assert serialization.loads(serialization.dumps(obj)) == {
+        str(k): v for k, v in obj.items()
+    }
+
+
+@pytest.mark.parametrize(
+    "value",
+    [float("nan"), float("inf"), -float("inf")],
+    ids=["nan", "inf", "-inf"],
+)
+@pytest.mark.parametrize("key", ["a", 1], ids=["str-key", "int-key"])
+def test_dumps_non_finite_float(backend, key, value):
+    """Test that `dumps` rejects out-of-range float values."""
+    with pytest.raises(ValueError):
+        serialization.dumps({key: [None, value]})
+
+
+@pytest.mark.parametrize(
+    "value",
+    [datetime.now(), SomeDataclass()],
+    ids=["datetime", "dataclass"],
+)
+def test_dumps_unsupported_type(backend, value):
+    """Test that `dumps` rejects types that are not JSON-serializable."""
+    with pytest.raises(TypeError):
+        serialization.dumps({"a": value})
+
+
+def test_loads_nan(backend):
+    """Test that `loads` reads records containing `NaN`."""
+    assert math.isnan(serialization.loads(b'{"a": NaN}')["a"])
@@ -1,10 +1,11 @@
 """Tests for the `Worker`-class."""
 
-from typing import Optional
+from typing import Optional, Callable
 from dataclasses import dataclass
+import threading
+import socket
 from time import sleep, time
 from uuid import uuid4
-from random import randrange
 
 import pytest
 
@@ -23,35 +24,108 @@ from dcm_common.orchestra.models import (
 from dcm_common.orchestra.dilled import dillignore
 
 
+# timeout for waiting on events in seconds (events usually fire much
+# earlier; generous to tolerate heavy load, e.g., with pytest-xdist)
+EVENT_TIMEOUT = 10
+# timeout for processing a long queue in seconds
+QUEUE_TIMEOUT = 60
+
+
 @dataclass(kw_only=True)
 class ReportWithData(Report):
     data: Optional[JSONObject] = None
 
 
-def test_constructor():
+class SQLiteControllerWithoutWait(SQLiteController):
+    """`SQLiteController` without support for long-polling."""
+
+    def queue_pop(self, name: str):
+        return super().queue_pop(name)
+
+
+@pytest.fixture(name="shared_controller", scope="module")
+def _shared_controller():
+    """Returns `SQLiteController` shared by the tests of this module."""
+    controller = SQLiteController()
+    yield controller
+    controller.close()
+
+
+@pytest.fixture(name="controller")
+def _controller(shared_controller: SQLiteController):
+    """
+    Returns the shared `SQLiteController` with empty database (settings
+    are restored after the test).
+    """
+    with shared_controller.transaction(write=True) as t:
+        t.cursor.execute("DELETE FROM registry")
+    lock_ttl = shared_controller.lock_ttl
+    yield shared_controller
+    shared_controller.lock_ttl = lock_ttl
+
+
+def track_state(worker: Worker) -> dict[WorkerState, threading.Event]:
+    """
+    Returns a mapping of `WorkerState`s and events for the given
+    `worker`. Only the event of the most recently reported state is set.
+    """
+    events = {state: threading.Event() for state in WorkerState}
+
+    def callback(state: WorkerState) -> None:
+        for other, event in events.items():
+            if other is not state:
+                event.clear()
+        events[state].set()
+
+    worker.on_state_change(callback)
+    return events
+
+
+def watch_registry(
+    monkeypatch,
+    controller: SQLiteController,
+    predicate: Callable[[JobInfo], bool],
+) -> threading.Event:
+    """
+    Returns an event that is set as soon as `controller.registry_push`
+    is called with an `info` that satisfies `predicate`.
+    """
+    event = threading.Event()
+    registry_push = controller.registry_push
+
+    def _registry_push(lock_id, *, status=None, info=None):
+        registry_push(lock_id, status=status, info=info)
+        if info is not None and predicate(info):
+            event.set()
+
+    monkeypatch.setattr(controller, "registry_push", _registry_push)
+    return event
+
+
+def test_constructor(controller):
     """Test behavior of `Worker`-contructor."""
 
     # at least one entry in map
     with pytest.raises(ValueError):
-        Worker(SQLiteController(), {}, {})
+        Worker(controller, {}, {})
 
     # maps need to have the same keys
     with pytest.raises(ValueError):
         Worker(
-            SQLiteController(),
+            controller,
             {"type-a": lambda: None},
             {"type-b": None},
         )
 
     # ok
     Worker(
-        SQLiteController(),
+        controller,
         {"type-a": lambda: None},
         {"type-a": None},
     )
 
 
-def test_simple():
+def test_simple(controller):
     """Test plain job execution using a `Worker`."""
 
     def job(context: JobContext, info: JobInfo):
@@ -65,7 +139,7 @@ def test_simple():
         context.push()
 
     worker = Worker(
-        SQLiteController(),
+        controller,
         {"test": job},
         {"test": ReportWithData},
     )
@@ -75,7 +149,7 @@ def test_simple():
     submission_info = JobInfo(JobConfig("test", {"a": 0}, {"b": 1}))
     token = worker.controller.queue_push("0", submission_info)
 
-    worker.stop_on_idle(True, timeout=1)
+    worker.stop_on_idle(True, timeout=EVENT_TIMEOUT)
 
     assert worker.controller.get_status(token.value)
 
@@ -96,59 +170,188 @@ def test_simple():
     print(info.report.log.fancy())
 
 
-def test_state(temporary_directory):
+def test_state(temporary_directory, controller):
     """Test `Worker.state`."""
 
-    path0 = temporary_directory / str(uuid4())
-    path1 = temporary_directory / str(uuid4())
+    # the job blocks until released via this socket
+    address = str((temporary_directory / str(uuid4())).resolve())
 
     def job(_: JobContext, __: JobInfo):
-        path0.touch()
         # block until released via host
-        while not path1.is_file():
-            sleep(0.01)
+        with socket.socket(socket.AF_UNIX) as client:
+            client.connect(address)
+            client.recv(1)
 
     worker = Worker(
-        SQLiteController(),
+        controller,
         {"test": job},
         {"test": ReportWithData},
     )
+    states = track_state(worker)
     assert worker.state is WorkerState.STOPPED
 
-    worker.start(0.01, True)
+    with socket.socket(socket.AF_UNIX) as server:
+        server.bind(address)
+        server.listen(1)
+        server.settimeout(EVENT_TIMEOUT)
+
+        worker.start(0.01, True)
+        assert worker.state is WorkerState.IDLE
+
+        worker.controller.queue_push(
+            "0", JobInfo(JobConfig("test", {}, {}))
+        )
+
+        # block until job is running
+        assert states[WorkerState.BUSY].wait(EVENT_TIMEOUT)
+        conn, _ = server.accept()
+
+        assert worker.state is WorkerState.BUSY
+        with conn:
+            conn.sendall(b"\0")
+
+        assert states[WorkerState.IDLE].wait(EVENT_TIMEOUT)
+
     assert worker.state is WorkerState.IDLE
 
+    worker.stop_on_idle(True, timeout=EVENT_TIMEOUT)
+
+    assert states[WorkerState.STOPPED].is_set()
+    assert worker.state is WorkerState.STOPPED
+
+
+def test_on_state_change(controller):
+    """Test method `Worker.on_state_change`."""
+
+    worker = Worker(
+        controller,
+        {"test": lambda context, info: None},
+        {"test": ReportWithData},
+    )
+    states = []
+    worker.on_state_change(states.append)
+
+    # faulty callbacks do not affect the worker
+    def faulty_callback(_):
+        raise ValueError("Test")
+
+    worker.on_state_change(faulty_callback)
+
     worker.controller.queue_push("0", JobInfo(JobConfig("test", {}, {})))
+    worker.start(0.01, True)
+    worker.stop_on_idle(True, timeout=EVENT_TIMEOUT)
 
-    # block until released via child
-    # this ensures that the job is actually running
-    while not path0.is_file():
-        sleep(0.01)
+    assert states == [
+        WorkerState.IDLE,
+        WorkerState.BUSY,
+        WorkerState.IDLE,
+        WorkerState.STOPPED,
+    ]
+    assert worker.controller.get_status("0") == "completed"
 
-    assert worker.state is WorkerState.BUSY
-    path1.touch()
 
-    time0 = time()
-    while worker.state is not WorkerState.IDLE and time() - time0 < 1:
-        sleep(0.01)
+def test_long_polling(controller):
+    """Test that an idle `Worker` picks up new jobs without delay."""
+
+    worker = Worker(
+        controller,
+        {"test": lambda context, info: None},
+        {"test": ReportWithData},
+    )
+    states = track_state(worker)
+
+    # long interval; worker waits for submissions at the controller
+    worker.start(60, True)
+    sleep(0.1)
+    worker.controller.queue_push("0", JobInfo(JobConfig("test", {}, {})))
+    assert states[WorkerState.BUSY].wait(EVENT_TIMEOUT)
+
+    worker.kill(block=True, timeout=EVENT_TIMEOUT)
+
+    assert worker.state is WorkerState.STOPPED
+
+
+@pytest.mark.parametrize("via", ["stop", "stop_on_idle", "kill"])
+def test_long_polling_stop(controller, via):
+    """Test that an idle `Worker` responds to stop-requests quickly."""
+
+    worker = Worker(
+        controller,
+        {"test": lambda context, info: None},
+        {"test": ReportWithData},
+        long_polling_timeout=0.1,
+    )
+    states = track_state(worker)
+
+    worker.start(60, True)
+    assert states[WorkerState.IDLE].wait(EVENT_TIMEOUT)
+    sleep(0.1)
+
+    t0 = time()
+    getattr(worker, via)(block=True, timeout=EVENT_TIMEOUT)
+
+    assert worker.state is WorkerState.STOPPED
+    assert time() - t0 < 1
 
+
+def test_long_polling_not_supported():
+    """
+    Test `Worker` with a controller that does not support long-polling.
+    """
+
+    controller = SQLiteControllerWithoutWait()
+    worker = Worker(
+        controller,
+        {"test": lambda context, info: None},
+        {"test": ReportWithData},
+    )
+
+    worker.start(0.01, True)
     assert worker.state is WorkerState.IDLE
+    sleep(0.1)
+    token = controller.queue_push("0", JobInfo(JobConfig("test", {}, {})))
+    worker.stop_on_idle(True, timeout=EVENT_TIMEOUT)
+
+    assert worker.state is WorkerState.STOPPED
+    assert controller.get_status(token.value) == "completed"
+    controller.close()
 
-    worker.stop_on_idle(True, timeout=1)
 
+def test_stop_timeout(controller):
+    """Test that blocking stop-requests respect the `timeout`."""
+
+    worker = Worker(
+        controller,
+        {"test": lambda context, info: sleep(60)},
+        {"test": ReportWithData},
+    )
+    states = track_state(worker)
+
+    worker.controller.queue_push("0", JobInfo(JobConfig("test", {}, {})))
+    worker.start(0.01, True)
+    assert states[WorkerState.BUSY].wait(EVENT_TIMEOUT)
+
+    t0 = time()
+    worker.stop(True, timeout=0.1)
+
+    assert time() - t0 < EVENT_TIMEOUT
+    assert worker.state is WorkerState.BUSY
+
+    worker.kill(block=True, timeout=EVENT_TIMEOUT)
     assert worker.state is WorkerState.STOPPED
 
 
-def test_unknown_type():
+def test_unknown_type(controller):
     """
     Test behavior of `Worker` when encountering an unknown type.
     """
 
     worker = Worker(
-        SQLiteController(),
+        controller,
         {"test": lambda context, info: None},
         {"test": ReportWithData},
     )
+    states = track_state(worker)
 
     token = worker.controller.queue_push(
         "0", JobInfo(JobConfig("test-2", {}, {}))
@@ -156,9 +359,9 @@ def test_unknown_type():
 
     worker.start(0.01, True)
 
-    time0 = time()
-    while worker.state is not WorkerState.STOPPED and time() - time0 < 1:
-        sleep(0.01)
+    assert states[WorkerState.STOPPED].wait(EVENT_TIMEOUT)
+    # wait for worker thread to exit
+    worker.stop(True, timeout=EVENT_TIMEOUT)
 
     assert worker.state is WorkerState.STOPPED
 
@@ -166,18 +369,15 @@ def test_unknown_type():
     assert worker.controller.queue_pop("test").token == token.value
     assert worker.controller.get_status(token.value) == "queued"
 
-    # safeguard for test - probably not necessary
-    worker.stop_on_idle(True, timeout=1)
-
 
-def test_prefilled_report():
+def test_prefilled_report(controller):
     """Test conservation of pre-existing data in report."""
 
     def job(_: JobContext, __: JobInfo):
         pass
 
     worker = Worker(
-        SQLiteController(),
+        controller,
         {"test": job},
         {"test": ReportWithData},
     )
@@ -193,15 +393,16 @@ def test_prefilled_report():
         ),
     )
 
-    worker.stop_on_idle(True, timeout=1)
+    worker.stop_on_idle(True, timeout=EVENT_TIMEOUT)
 
     info = worker.controller.get_info(token.value)
     assert info["report"]["data"] == data
     assert info["report"]["progress"]["status"] == Status.COMPLETED.value
 
 
-def test_abort_message():
-    """Test abort via message."""
+@pytest.mark.parametrize("via", ["message", "kill"])
+def test_abort(controller, monkeypatch, via):
+    """Test abort via message or kill."""
 
     def job(context: JobContext, info: JobInfo):
         # add child and log
@@ -232,85 +433,16 @@ def test_abort_message():
         context.push()
 
     worker = Worker(
-        SQLiteController(),
+        controller,
         {"test": job},
         {"test": ReportWithData},
+        registry_push_interval=0,
+        messages_interval=0.01,
     )
-
-    token = worker.controller.queue_push(
-        "0",
-        JobInfo(JobConfig("test", {}, {})),
-    )
-
-    worker.start(0.01, True)
-
-    # wait for child being registered
-    time0 = time()
-    while time() - time0 < 1:
-        report = ReportWithData.from_json(
-            worker.controller.get_info(token.value).get("report", {})
-        )
-        if LoggingContext.WARNING in report.log:
-            break
-        sleep(0.01)
-
-    worker.controller.message_push("0", "abort", "test", "test reason")
-
-    worker.stop_on_idle(True, timeout=1)
-
-    info = JobInfo.from_json(worker.controller.get_info(token.value))
-    info.report = ReportWithData.from_json(info.report)
-    # job did not complete
-    assert LoggingContext.INFO not in info.report.log
-    # abort got logged
-    assert LoggingContext.ERROR in info.report.log
-    assert len(info.report.log[LoggingContext.ERROR]) == 1
-    assert "test reason" in info.report.log[LoggingContext.ERROR][0].body
-    # status is aborted
-    assert info.report.progress.status is Status.ABORTED
-    # child abort-callback is executed
-    assert LoggingContext.WARNING in info.report.log
-    assert len(info.report.log[LoggingContext.WARNING]) == 2
-    assert (
-        "child 'c0' aborted" in info.report.log[LoggingContext.WARNING][1].body
-    )
-
-
-def test_kill():
-    """Test abort via kill."""
-
-    def job(context: JobContext, info: JobInfo):
-        # add child and log
-        context.add_child(
-            ChildJob(
-                "c0",
-                "child 0",
-                lambda origin, reason: info.report.log.log(
-                    LoggingContext.WARNING, body="child 'c0' aborted"
-                ),
-            )
-        )
-        info.report.log.log(LoggingContext.WARNING, body="child created")
-        # add and remove another child
-        context.add_child(
-            ChildJob(
-                "c1",
-                "child 1",
-                lambda origin, reason: info.report.log.log(
-                    LoggingContext.WARNING, body="child 'c1' aborted"
-                ),
-            )
-        )
-        context.remove_child("c1")
-        context.push()
-        sleep(10)
-        info.report.log.log(LoggingContext.INFO, body="test")
-        context.push()
-
-    worker = Worker(
-        SQLiteController(),
-        {"test": job},
-        {"test": ReportWithData},
+    child_registered = watch_registry(
+        monkeypatch,
+        worker.controller,
+        lambda info: LoggingContext.WARNING in info.report.log,
     )
 
     token = worker.controller.queue_push(
@@ -320,16 +452,14 @@ def test_kill():
 
     worker.start(0.01, True)
 
-    time0 = time()
-    while time() - time0 < 1:
-        report = ReportWithData.from_json(
-            worker.controller.get_info(token.value).get("report", {})
-        )
-        if LoggingContext.WARNING in report.log:
-            break
-        sleep(0.01)
+    # wait for child being registered
+    assert child_registered.wait(EVENT_TIMEOUT)
 
-    worker.kill("test", "test reason", True)
+    if via == "message":
+        worker.controller.message_push("0", "abort", "test", "test reason")
+        worker.stop_on_idle(True, timeout=EVENT_TIMEOUT)
+    else:
+        worker.kill("test", "test reason", True)
 
     assert worker.state is WorkerState.STOPPED
 
@@ -351,7 +481,7 @@ def test_kill():
     )
 
 
-def test_job_unexpected_exit():
+def test_job_unexpected_exit(controller):
     """Test behavior if job is killed from somewhere else."""
 
     def job(context: JobContext, info: JobInfo):
@@ -360,10 +490,11 @@ def test_job_unexpected_exit():
         context.push()
 
     worker = Worker(
-        SQLiteController(),
+        controller,
         {"test": job},
         {"test": ReportWithData},
     )
+    states = track_state(worker)
 
     token = worker.controller.queue_push(
         "0",
@@ -372,23 +503,16 @@ def test_job_unexpected_exit():
 
     worker.start(0.01, True)
 
-    time0 = time()
-    while (
-        worker.controller.get_status(token.value) == "queued"
-        and time() - time0 < 1
-    ):
-        sleep(0.01)
+    assert states[WorkerState.BUSY].wait(EVENT_TIMEOUT)
 
     # pylint: disable=protected-access
     worker._process.kill()
 
-    time0 = time()
-    while worker.state is WorkerState.BUSY and time() - time0 < 1:
-        sleep(0.01)
+    assert states[WorkerState.IDLE].wait(EVENT_TIMEOUT)
 
     assert worker.state is WorkerState.IDLE
 
-    worker.stop(True, timeout=1)
+    worker.stop(True, timeout=EVENT_TIMEOUT)
 
     assert worker.state is WorkerState.STOPPED
 
@@ -403,7 +527,7 @@ def test_job_unexpected_exit():
     assert info.report.progress.status is Status.ABORTED
 
 
-def test_job_with_exception():
+def test_job_with_exception(controller):
     """
     Test behavior of `Worker` when an uncaught exception is raised in
     the job command.
@@ -413,7 +537,7 @@ def test_job_with_exception():
         raise ValueError("Test")
 
     worker = Worker(
-        SQLiteController(),
+        controller,
         {"test": job},
         {"test": ReportWithData},
     )
@@ -423,7 +547,7 @@ def test_job_with_exception():
     )
 
     worker.start(0.01, True)
-    worker.stop_on_idle(True, timeout=1)
+    worker.stop_on_idle(True, timeout=EVENT_TIMEOUT)
 
     info = JobInfo.from_json(worker.controller.get_info(token.value))
     info.report = ReportWithData.from_json(info.report)
@@ -437,7 +561,7 @@ def test_job_with_exception():
     assert info.metadata.completed is not None
 
 
-def test_lost_lock():
+def test_lost_lock(controller, monkeypatch):
     """Test behavior if the lock has been lost."""
 
     def job(context: JobContext, info: JobInfo):
@@ -446,11 +570,14 @@ def test_lost_lock():
         context.push()
 
     worker = Worker(
-        SQLiteController(),
+        controller,
         {"test": job},
         {"test": ReportWithData},
         lock_refresh_interval=0.1,
     )
+    running = watch_registry(
+        monkeypatch, worker.controller, lambda info: True
+    )
 
     token = worker.controller.queue_push(
         "0",
@@ -459,17 +586,12 @@ def test_lost_lock():
 
     worker.start(0.01, True)
 
-    time0 = time()
-    while (
-        worker.controller.get_status(token.value) == "queued"
-        and time() - time0 < 1
-    ):
-        sleep(0.01)
+    assert running.wait(EVENT_TIMEOUT)
 
     # cause locking-issue
     worker.controller.lock_ttl = 0.01
 
-    worker.stop(True, timeout=1)
+    worker.stop(True, timeout=EVENT_TIMEOUT)
 
     info = JobInfo.from_json(worker.controller.get_info(token.value))
     info.report = ReportWithData.from_json(info.report)
@@ -486,7 +608,7 @@ def test_lost_lock():
     assert info.report.progress.status is Status.ABORTED
 
 
-def test_job_timeout():
+def test_job_timeout(controller):
     """
     Test behavior of `Worker` when a job exceeds its maximum duration.
     """
@@ -497,11 +619,12 @@ def test_job_timeout():
         context.push()
 
     worker = Worker(
-        SQLiteController(),
+        controller,
         {"test": job},
         {"test": ReportWithData},
         process_timeout=0.01,
     )
+    states = track_state(worker)
 
     token = worker.controller.queue_push(
         "0",
@@ -510,14 +633,9 @@ def test_job_timeout():
 
     worker.start(0.01, True)
 
-    time0 = time()
-    while (
-        worker.controller.get_status(token.value) == "queued"
-        and time() - time0 < 1
-    ):
-        sleep(0.01)
+    assert states[WorkerState.BUSY].wait(EVENT_TIMEOUT)
 
-    worker.stop(True, timeout=1)
+    worker.stop(True, timeout=EVENT_TIMEOUT)
 
     info = JobInfo.from_json(worker.controller.get_info(token.value))
     info.report = ReportWithData.from_json(info.report)
@@ -531,7 +649,7 @@ def test_job_timeout():
     assert info.report.progress.status is Status.ABORTED
 
 
-def test_long_queue():
+def test_long_queue(controller):
     """Test processing of a long queue."""
 
     def job(context: JobContext, info: JobInfo):
@@ -539,32 +657,28 @@ def test_long_queue():
         context.push()
 
     worker = Worker(
-        SQLiteController(),
+        controller,
         {"test": job},
         {"test": ReportWithData},
     )
 
-    tokens = []
-    for i in range(10):
-        tokens.append(
-            worker.controller.queue_push(
-                str(i),
-                JobInfo(JobConfig("test", {}, {})),
-            )
-        )
+    tokens = worker.controller.queue_push_many(
+        (str(i), JobInfo(JobConfig("test", {}, {}))) for i in range(10)
+    )
 
     worker.start(0.01, True)
-    worker.stop_on_idle(True, timeout=1)
+    worker.stop_on_idle(True, timeout=EVENT_TIMEOUT)
 
+    records = worker.controller.get_all(token.value for token in tokens)
     for token in tokens:
-        info = JobInfo.from_json(worker.controller.get_info(token.value))
+        info = JobInfo.from_json(records[token.value][1])
         info.report = ReportWithData.from_json(info.report)
         # job is completed
         assert LoggingContext.INFO in info.report.log
         assert info.report.progress.status is Status.COMPLETED
 
 
-def test_stop_on_idle():
+def test_stop_on_idle(controller):
     """Test stopping behavior."""
 
     def job(context: JobContext, info: JobInfo):
@@ -573,24 +687,22 @@ def test_stop_on_idle():
         context.push()
 
     worker = Worker(
-        SQLiteController(),
+        controller,
         {"test": job},
         {"test": ReportWithData},
     )
 
-    for i in range(10):
-        worker.controller.queue_push(
-            str(i),
-            JobInfo(JobConfig("test", {}, {})),
-        )
+    worker.controller.queue_push_many(
+        (str(i), JobInfo(JobConfig("test", {}, {}))) for i in range(10)
+    )
 
     worker.start(0.01, True)
-    worker.stop_on_idle(True, timeout=1)
+    worker.stop_on_idle(True, timeout=EVENT_TIMEOUT)
 
     assert worker.controller.queue_pop("") is None
 
 
-def test_stop():
+def test_stop(controller):
     """Test stopping behavior."""
 
     def job(context: JobContext, info: JobInfo):
@@ -599,19 +711,17 @@ def test_stop():
         context.push()
 
     worker = Worker(
-        SQLiteController(),
+        controller,
         {"test": job},
         {"test": ReportWithData},
     )
 
-    for i in range(10):
-        worker.controller.queue_push(
-            str(i),
-            JobInfo(JobConfig("test", {}, {})),
-        )
+    worker.controller.queue_push_many(
+        (str(i), JobInfo(JobConfig("test", {}, {}))) for i in range(10)
+    )
 
     worker.start(0.01, True)
-    worker.stop(True, timeout=1)
+    worker.stop(True, timeout=EVENT_TIMEOUT)
 
     tokens = []
     while True:
@@ -622,7 +732,7 @@ def test_stop():
     assert 0 < len(tokens) < 10
 
 
-def test_concurrency():
+def test_concurrency(controller):
     """Test concurrent workers"""
 
     def job(context: JobContext, info: JobInfo):
@@ -631,7 +741,6 @@ def test_concurrency():
         context.push()
 
     # setup workers
-    controller = SQLiteController()
     n_workers = 5
     workers = []
     for i in range(n_workers):
@@ -645,31 +754,32 @@ def test_concurrency():
 
     # setup jobs
     n_jobs = 100
-    tokens = []
-    for i in range(n_jobs):
-        tokens.append(
-            controller.queue_push(
-                str(i),
-                JobInfo(
-                    JobConfig("test", {}, {"sleep": 0.01 * randrange(25, 100)})
-                ),
-            )
+    tokens = controller.queue_push_many(
+        (
+            str(i),
+            JobInfo(
+                JobConfig("test", {}, {"sleep": [0.05, 0.1, 0.15, 0.2][i % 4]})
+            ),
         )
+        for i in range(n_jobs)
+    )
 
     # run
     for worker in workers:
         worker.start(0.01, True)
 
     for worker in workers:
-        worker.stop_on_idle(True, timeout=1)
+        worker.stop_on_idle(True, timeout=QUEUE_TIMEOUT)
+        assert worker.state is WorkerState.STOPPED
 
     # check queue
     assert controller.queue_pop("") is None
 
     stats = {}
     # eval results
+    records = controller.get_all(token.value for token in tokens)
     for token in tokens:
-        info = JobInfo.from_json(worker.controller.get_info(token.value))
+        info = JobInfo.from_json(records[token.value][1])
         info.report = ReportWithData.from_json(info.report)
         # job is completed
         assert LoggingContext.INFO in info.report.log
@@ -732,7 +842,7 @@ def test_dcm_app():
         "0", JobInfo(JobConfig("test", {}, {}))
     )
     worker.start(1, True)
-    worker.stop_on_idle(True, timeout=1)
+    worker.stop_on_idle(True, timeout=EVENT_TIMEOUT)
 
     assert (
         config.orchestration_controller.get_info("0")["report"]["data"][
@@ -57,15 +57,16 @@ def test_get_nosuccess():
     print(result.log[Context.ERROR][0].body)
 
 
-def test_get_success_rate():
-    """Test method `get` of `DemoPlugin` with `success`-argument."""
+def test_get_success_rate(monkeypatch):
+    """Test method `get` of `DemoPlugin` with `success_rate`-argument."""
     plugin = DemoPlugin()
-    results = set()
-    count = 0
-    while len(results) < 2 and count < 100:
-        count += 1
-        results.add(plugin.get(None, success_rate=50).success)
-    assert results == {False, True}
+    # fix random rolls to both sides of the threshold
+    rolls = iter([50, 51])
+    monkeypatch.setattr(
+        "dcm_common.plugins.demo.randint", lambda a, b: next(rolls)
+    )
+    assert plugin.get(None, success_rate=50).success
+    assert not plugin.get(None, success_rate=50).success
 
 
 def test_get_with_context():
@@ -1,5 +1,6 @@
 """Test suite for the adapter-subpackage."""
 
+import os
 from time import sleep
 from urllib3.exceptions import HTTPError
 
@@ -56,7 +57,8 @@ test_stage_info_json = get_model_serialization_test(
 
 @pytest.fixture(name="port")
 def _port():
-    return 8080
+    # use individual ports for pytest-xdist-workers
+    return 8080 + int(os.environ.get("PYTEST_XDIST_WORKER", "gw0")[2:])
 
 
 @pytest.fixture(name="url")
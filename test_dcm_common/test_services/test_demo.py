@@ -2,6 +2,7 @@
 Test module for the Demo Service API.
 """
 
+import os
 from time import time, sleep
 import re
 from uuid import uuid4
@@ -24,6 +25,16 @@ except ImportError:
     sdk_available = False
 
 
+# use individual ports for pytest-xdist-workers
+PORT = 8080 + int(os.environ.get("PYTEST_XDIST_WORKER", "gw0")[2:])
+# additional services for child jobs (outside the range of PORT of the
+# other pytest-xdist-workers)
+CHILD_PORT = PORT + 200
+GRANDCHILD_PORT = PORT + 300
+CHILD_HOST = f"http://localhost:{CHILD_PORT}"
+GRANDCHILD_HOST = f"http://localhost:{GRANDCHILD_PORT}"
+
+
 @pytest.fixture(name="testing_config")
 def _testing_config(temporary_directory):
     @dillignore("db", "controller", "worker_pool")
@@ -84,9 +95,9 @@ def wait_for_report(demo_api, token):
 @pytest.mark.skipif(not sdk_available, reason="missing dcm-demo-sdk")
 def test_sdk_ping(testing_config, default_client, run_service):
     """Run minimal test for demo-app."""
-    run_service(from_factory=lambda: app_factory(testing_config()), port=8080)
+    run_service(from_factory=lambda: app_factory(testing_config()), port=PORT)
     default_api: dcm_demo_sdk.DefaultApi = default_client(
-        "http://localhost:8080"
+        f"http://localhost:{PORT}"
     )
     assert default_api.ping() == "pong"
 
@@ -94,9 +105,9 @@ def test_sdk_ping(testing_config, default_client, run_service):
 @pytest.mark.skipif(not sdk_available, reason="missing dcm-demo-sdk")
 def test_sdk_identify(testing_config, default_client, run_service):
     """Test identify-implementation for demo-app."""
-    run_service(from_factory=lambda: app_factory(testing_config()), port=8080)
+    run_service(from_factory=lambda: app_factory(testing_config()), port=PORT)
     default_api: dcm_demo_sdk.DefaultApi = default_client(
-        "http://localhost:8080"
+        f"http://localhost:{PORT}"
     )
 
     # apparently, the OpenAPI-Generator sdk model_dump renames fields in json
@@ -156,9 +167,9 @@ def test_sdk_identify_w_complex_array_plugin_arg_signature(
     class ThisAppConfig(testing_config):
         AVAILABLE_PLUGINS = {"demo-plugin": PluginWithComplexArgSignature()}
 
-    run_service(from_factory=lambda: app_factory(ThisAppConfig()), port=8080)
+    run_service(from_factory=lambda: app_factory(ThisAppConfig()), port=PORT)
     default_api: dcm_demo_sdk.DefaultApi = default_client(
-        "http://localhost:8080"
+        f"http://localhost:{PORT}"
     )
 
     # apparently, the OpenAPI-Generator sdk model_dump does not work with
@@ -192,8 +203,8 @@ def test_demo_minimal_flask_client(testing_config):
 @pytest.mark.skipif(not sdk_available, reason="missing dcm-demo-sdk")
 def test_sdk_demo_minimal(testing_config, demo_client, run_service):
     """Run test for demo-app with minimal job."""
-    run_service(from_factory=lambda: app_factory(testing_config()), port=8080)
-    demo_api: dcm_demo_sdk.DemoApi = demo_client("http://localhost:8080")
+    run_service(from_factory=lambda: app_factory(testing_config()), port=PORT)
+    demo_api: dcm_demo_sdk.DemoApi = demo_client(f"http://localhost:{PORT}")
     token = demo_api.demo({"demo": {"duration": 0}})
     report = wait_for_report(demo_api, token).model_dump()
 
@@ -204,23 +215,29 @@ def test_sdk_demo_minimal(testing_config, demo_client, run_service):
 @pytest.mark.skipif(not sdk_available, reason="missing dcm-demo-sdk")
 def test_sdk_demo_complex(testing_config, demo_client, run_service):
     """Run test for demo-app with complex job."""
-    run_service(from_factory=lambda: app_factory(testing_config()), port=8080)
-    run_service(from_factory=lambda: app_factory(testing_config()), port=8081)
-    run_service(from_factory=lambda: app_factory(testing_config()), port=8082)
-    demo_api: dcm_demo_sdk.DemoApi = demo_client("http://localhost:8080")
+    run_service(from_factory=lambda: app_factory(testing_config()), port=PORT)
+    run_service(
+        from_factory=lambda: app_factory(testing_config()),
+        port=CHILD_PORT,
+    )
+    run_service(
+        from_factory=lambda: app_factory(testing_config()),
+        port=GRANDCHILD_PORT,
+    )
+    demo_api: dcm_demo_sdk.DemoApi = demo_client(f"http://localhost:{PORT}")
     token = demo_api.demo(
         {
             "demo": {
                 "duration": 0,
                 "children": [
                     {
-                        "host": "http://localhost:8081",
+                        "host": CHILD_HOST,
                         "body": {
                             "demo": {
                                 "duration": 0,
                                 "children": [
                                     {
-                                        "host": "http://localhost:8082",
+                                        "host": GRANDCHILD_HOST,
                                         "body": {"demo": {"duration": 0}},
                                     }
                                 ],
@@ -228,13 +245,13 @@ def test_sdk_demo_complex(testing_config, demo_client, run_service):
                         },
                     },
                     {
-                        "host": "http://localhost:8081",
+                        "host": CHILD_HOST,
                         "body": {
                             "demo": {
                                 "duration": 0,
                                 "children": [
                                     {
-                                        "host": "http://localhost:8082",
+                                        "host": GRANDCHILD_HOST,
                                         "body": {"demo": {"duration": 0}},
                                     }
                                 ],
@@ -256,8 +273,8 @@ def test_sdk_demo_complex(testing_config, demo_client, run_service):
 @pytest.mark.skipif(not sdk_available, reason="missing dcm-demo-sdk")
 def test_sdk_demo_duration(testing_config, demo_client, run_service):
     """Run test for demo-app and job duration-setting."""
-    run_service(from_factory=lambda: app_factory(testing_config()), port=8080)
-    demo_api: dcm_demo_sdk.DemoApi = demo_client("http://localhost:8080")
+    run_service(from_factory=lambda: app_factory(testing_config()), port=PORT)
+    demo_api: dcm_demo_sdk.DemoApi = demo_client(f"http://localhost:{PORT}")
     # skipped since the timing of the reference-call is very inconsistent
     # time0 = time()  # call for reference
     # _ = wait_for_report(
@@ -277,9 +294,12 @@ def test_sdk_demo_no_success(testing_config, demo_client, run_service):
     """
     Run test for demo-app nested jobs and different value for success.
     """
-    run_service(from_factory=lambda: app_factory(testing_config()), port=8080)
-    run_service(from_factory=lambda: app_factory(testing_config()), port=8081)
-    demo_api: dcm_demo_sdk.DemoApi = demo_client("http://localhost:8080")
+    run_service(from_factory=lambda: app_factory(testing_config()), port=PORT)
+    run_service(
+        from_factory=lambda: app_factory(testing_config()),
+        port=CHILD_PORT,
+    )
+    demo_api: dcm_demo_sdk.DemoApi = demo_client(f"http://localhost:{PORT}")
     token = demo_api.demo(
         {
             "demo": {
@@ -287,7 +307,7 @@ def test_sdk_demo_no_success(testing_config, demo_client, run_service):
                 "duration": 0,
                 "children": [
                     {
-                        "host": "http://localhost:8081",
+                        "host": CHILD_HOST,
                         "body": {
                             "demo": {
                                 "success": False,
@@ -307,8 +327,8 @@ def test_sdk_demo_no_success(testing_config, demo_client, run_service):
 @pytest.mark.skipif(not sdk_available, reason="missing dcm-demo-sdk")
 def test_sdk_demo_abort(testing_config, demo_client, run_service):
     """Run test for abortion of running job."""
-    run_service(from_factory=lambda: app_factory(testing_config()), port=8080)
-    demo_api: dcm_demo_sdk.DemoApi = demo_client("http://localhost:8080")
+    run_service(from_factory=lambda: app_factory(testing_config()), port=PORT)
+    demo_api: dcm_demo_sdk.DemoApi = demo_client(f"http://localhost:{PORT}")
     token = demo_api.demo({"demo": {"duration": 5}})
     sleep(0.1)
     demo_api.abort(
@@ -325,10 +345,13 @@ def test_sdk_demo_abort(testing_config, demo_client, run_service):
 
 def test_sdk_demo_abort_with_child(testing_config, demo_client, run_service):
     """Run test for abortion of running job with child."""
-    run_service(from_factory=lambda: app_factory(testing_config()), port=8080)
-    demo_api: dcm_demo_sdk.DemoApi = demo_client("http://localhost:8080")
-    run_service(from_factory=lambda: app_factory(testing_config()), port=8081)
-    demo_api2: dcm_demo_sdk.DemoApi = demo_client("http://localhost:8081")
+    run_service(from_factory=lambda: app_factory(testing_config()), port=PORT)
+    demo_api: dcm_demo_sdk.DemoApi = demo_client(f"http://localhost:{PORT}")
+    run_service(
+        from_factory=lambda: app_factory(testing_config()),
+        port=CHILD_PORT,
+    )
+    demo_api2: dcm_demo_sdk.DemoApi = demo_client(CHILD_HOST)
     token = demo_api.demo(
         {
             "demo": {
@@ -336,7 +359,7 @@ def test_sdk_demo_abort_with_child(testing_config, demo_client, run_service):
                 "duration": 0,
                 "children": [
                     {
-                        "host": "http://localhost:8081",
+                        "host": CHILD_HOST,
                         "body": {
                             "demo": {
                                 "success": False,
@@ -396,8 +419,8 @@ def test_sdk_demo_abort_with_child(testing_config, demo_client, run_service):
 @pytest.mark.skipif(not sdk_available, reason="missing dcm-demo-sdk")
 def test_sdk_demo_plugin(testing_config, demo_client, run_service):
     """Run test for demo-app with plugin-job."""
-    run_service(from_factory=lambda: app_factory(testing_config()), port=8080)
-    demo_api: dcm_demo_sdk.DemoApi = demo_client("http://localhost:8080")
+    run_service(from_factory=lambda: app_factory(testing_config()), port=PORT)
+    demo_api: dcm_demo_sdk.DemoApi = demo_client(f"http://localhost:{PORT}")
     token = demo_api.demo(
         {
             "demo": {
@@ -419,8 +442,8 @@ def test_sdk_demo_plugin(testing_config, demo_client, run_service):
 @pytest.mark.skipif(not sdk_available, reason="missing dcm-demo-sdk")
 def test_sdk_demo_submit_with_token(testing_config, demo_client, run_service):
     """Run test for demo-app with minimal job and providing token."""
-    run_service(from_factory=lambda: app_factory(testing_config()), port=8080)
-    demo_api: dcm_demo_sdk.DemoApi = demo_client("http://localhost:8080")
+    run_service(from_factory=lambda: app_factory(testing_config()), port=PORT)
+    demo_api: dcm_demo_sdk.DemoApi = demo_client(f"http://localhost:{PORT}")
     _token = str(uuid4())
     token = demo_api.demo({"demo": {"duration": 1}, "token": _token})
     assert token.value == _token
@@ -7,12 +7,12 @@ from dcm_common.orchestra.models import JobConfig, JobInfo, Token
 from dcm_common.services import DefaultView, ReportView, OrchestratedAppConfig
 
 
-@pytest.fixture(name="default_config")
+@pytest.fixture(name="default_config", scope="module")
 def _default_config():
     return OrchestratedAppConfig()
 
 
-@pytest.fixture(name="default_app")
+@pytest.fixture(name="default_app", scope="module")
 def _default_app(default_config):
     app = Flask(__name__)
     app.config.from_object(default_config)
@@ -23,7 +23,7 @@ def _default_app(default_config):
     return app
 
 
-@pytest.fixture(name="default_client")
+@pytest.fixture(name="default_client", scope="module")
 def _default_client(default_app):
     return default_app.test_client()
 
@@ -83,12 +83,12 @@ def test_default_unknown_query_input(default_client, endpoint):
     assert response.mimetype == "text/plain"
 
 
-@pytest.fixture(name="report_tokens")
+@pytest.fixture(name="report_tokens", scope="module")
 def _report_token():
     return (Token("0"), Token("1"), Token("2"), Token("3"))
 
 
-@pytest.fixture(name="sample_report")
+@pytest.fixture(name="sample_report", scope="module")
 def _sample_report(report_tokens):
     return {
         "token": report_tokens[1].json,
@@ -96,7 +96,7 @@ def _sample_report(report_tokens):
     }
 
 
-@pytest.fixture(name="report_app")
+@pytest.fixture(name="report_app", scope="module")
 def _report_app(report_tokens, sample_report, default_config):
     app = Flask(__name__)
     app.config.from_object(default_config)
@@ -127,7 +127,7 @@ def _report_app(report_tokens, sample_report, default_config):
     return app
 
 
-@pytest.fixture(name="report_client")
+@pytest.fixture(name="report_client", scope="module")
 def _report_client(report_app):
     return report_app.test_client()
 
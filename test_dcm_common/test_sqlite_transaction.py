@@ -0,0 +1,179 @@
+"""Tests for the `Transaction` of the `sqlite`-module."""
+
+import sys
+import sqlite3
+from uuid import uuid4
+
+import pytest
+
+from dcm_common.sqlite import Transaction
+
+
+def test_transaction():
+    """Test basic functionality of `Transaction`-context manager."""
+    c = Transaction.get_connection(":memory:")
+    with Transaction(c) as t:
+        t.cursor.execute(
+            """CREATE TABLE registry (
+                token TEXT NOT NULL PRIMARY KEY
+            )"""
+        )
+        t.cursor.execute("SELECT * FROM registry")
+        t.cursor.execute("INSERT INTO registry VALUES ('0')")
+        t.cursor.execute("SELECT * FROM registry")
+
+    assert t.success
+    assert t.exc_val is None
+    assert len(t.data) == 1
+    assert t.data[0] == ("0",)
+
+
+def test_transaction_error():
+    """Test `Transaction`-context manager error behavior."""
+    # check off
+    c = Transaction.get_connection(":memory:")
+
+    with Transaction(c, False, autoclose=False) as t:
+        t.cursor.execute("CREATE TABLE a (id TEXT)")
+        t.cursor.execute("INSERT INTO a VALUES ('a', 'b')")
+
+    assert not t.success
+    assert isinstance(t.exc_val, sqlite3.OperationalError)
+    with pytest.raises(sqlite3.OperationalError):
+        t.check()
+
+    # no table exists
+    with Transaction(c, False, autoclose=False) as t:
+        t.cursor.execute("SELECT name FROM sqlite_master WHERE type='table'")
+    assert t.data == []
+
+    # the following tests for issues regarding transaction-control
+    # actually create table
+    with Transaction(c, False, autoclose=False) as t:
+        t.cursor.execute("CREATE TABLE a (id TEXT)")
+    with Transaction(c, False, autoclose=False) as t:
+        t.cursor.execute("SELECT name FROM sqlite_master WHERE type='table'")
+    assert t.data == [("a",)]
+    with Transaction(c, False, autoclose=False) as t:
+        t.cursor.execute("DROP TABLE a")
+    with Transaction(c, False, autoclose=False) as t:
+        t.cursor.execute("SELECT name FROM sqlite_master WHERE type='table'")
+    assert t.data == []
+
+    # repeat with check on
+    with pytest.raises(sqlite3.OperationalError), Transaction(
+        c, True, autoclose=False
+    ) as t:
+        t.cursor.execute("CREATE TABLE a (id TEXT)")
+        t.cursor.execute("INSERT INTO a VALUES ('a', 'b')")
+
+    with pytest.raises(sqlite3.OperationalError):
+        t.check()
+
+    # ok
+    with Transaction(c, autoclose=False) as t:
+        t.cursor.execute("CREATE TABLE a (id TEXT)")
+        t.cursor.execute("INSERT INTO a VALUES ('id')")
+
+    assert t.success
+    assert t.check() is None
+
+    with Transaction(c, False, autoclose=False) as t:
+        t.cursor.execute("SELECT * FROM a")
+    assert t.data == [("id",)]
+
+
+def test_transaction_iter_data():
+    """Test method `Transaction.iter_data`."""
+    c = Transaction.get_connection(":memory:")
+    with Transaction(c, autoclose=False) as t:
+        t.cursor.execute("CREATE TABLE a (id INTEGER)")
+        t.cursor.executemany(
+            "INSERT INTO a VALUES (?)", [(i,) for i in range(10)]
+        )
+
+    with Transaction(c) as t:
+        t.cursor.execute("SELECT id FROM a ORDER BY id")
+        assert list(t.iter_data(3)) == [(i,) for i in range(10)]
+    assert t.data == []
+
+
+def test_transaction_read_only():
+    """Test tracking of modifying statements in `Transaction`."""
+    c = Transaction.get_connection(":memory:")
+
+    # read only
+    with Transaction(c, autoclose=False) as t:
+        t.cursor.execute("SELECT name FROM sqlite_master WHERE type='table'")
+    assert t.success
+    assert not t.cursor.dirty
+    assert not c.in_transaction
+
+    # modifying
+    with Transaction(c, autoclose=False) as t:
+        t.cursor.execute("CREATE TABLE a (id TEXT)")
+        t.cursor.execute("SELECT * FROM a")
+    assert t.cursor.dirty
+    with Transaction(c, autoclose=False) as t:
+        t.cursor.execute(
+            "WITH b AS (SELECT 'id') INSERT INTO a SELECT * FROM b"
+        )
+    assert t.cursor.dirty
+    with Transaction(c) as t:
+        t.cursor.execute("SELECT * FROM a")
+    assert t.data == [("id",)]
+
+
+@pytest.mark.skipif(
+    sys.version_info[1] >= 12,
+    reason="transactions are always opened as deferred in python>=3.12",
+)
+def test_transaction_write(temporary_directory):
+    """Test `Transaction` with argument `write`."""
+    path = temporary_directory / str(uuid4())
+    c0 = Transaction.get_connection(path)
+    c1 = Transaction.get_connection(path, timeout=0)
+
+    # deferred
+    with Transaction(c0, autoclose=False, write=False):
+        with Transaction(c1, autoclose=False) as t:
+            t.cursor.execute("CREATE TABLE a (id TEXT)")
+
+    # immediate
+    with Transaction(c0, autoclose=False, write=True):
+        with pytest.raises(sqlite3.OperationalError), Transaction(
+            c1, autoclose=False
+        ) as t:
+            t.cursor.execute("INSERT INTO a VALUES ('id')")
+
+
+@pytest.mark.parametrize("check", [True, False], ids=["check", "no-check"])
+def test_transaction_commit_error(check):
+    """Test `Transaction` with an error during commit."""
+    c = Transaction.get_connection(":memory:")
+    with Transaction(c, autoclose=False) as t:
+        t.cursor.execute("CREATE TABLE a (id TEXT PRIMARY KEY)")
+        t.cursor.execute(
+            """CREATE TABLE b (
+              a TEXT REFERENCES a (id) DEFERRABLE INITIALLY DEFERRED
+            )"""
+        )
+
+    # foreign key-violation is only detected on commit
+    t = Transaction(c, check, autoclose=False)
+    if check:
+        with pytest.raises(sqlite3.IntegrityError), t:
+            t.cursor.execute("INSERT INTO b VALUES ('a')")
+    else:
+        with t:
+            t.cursor.execute("INSERT INTO b VALUES ('a')")
+
+    assert not t.success
+    assert isinstance(t.exc_val, sqlite3.IntegrityError)
+    with pytest.raises(sqlite3.IntegrityError):
+        t.check()
+    assert not c.in_transaction
+
+    with Transaction(c) as t:
+        t.cursor.execute("SELECT * FROM b")
+    assert t.data == []
@@ -18,6 +18,10 @@ import pytest
 from dcm_common import util
 
 
+# use individual ports for pytest-xdist-workers
+PORT = 8080 + int(os.environ.get("PYTEST_XDIST_WORKER", "gw0")[2:])
+
+
 @pytest.fixture(name="get_simple_http_server")
 def _get_simple_http_server():
     # setup fake server
@@ -28,7 +32,7 @@ def _get_simple_http_server():
                 self.end_headers()
                 self.wfile.write(data)
 
-        return HTTPServer(("localhost", 8080), Handler)
+        return HTTPServer(("localhost", PORT), Handler)
 
     return _
 
@@ -63,7 +67,7 @@ def test_get_profile_remote(
         get_simple_http_server(bagit_profile_test.read_bytes()), request
     )
 
-    some_remote_test_profile = util.get_profile("http://localhost:8080")
+    some_remote_test_profile = util.get_profile(f"http://localhost:{PORT}")
 
     profile_identifier = some_remote_test_profile["BagIt-Profile-Info"][
         "BagIt-Profile-Identifier"
@@ -82,7 +86,7 @@ def test_get_profile_remote_txt(
         get_simple_http_server(b"Some text\nSecond line"), request
     )
     with pytest.raises(json.JSONDecodeError):
-        util.get_profile("http://localhost:8080")
+        util.get_profile(f"http://localhost:{PORT}")
 
 
 def test_get_profile_local(bagit_profile_test):